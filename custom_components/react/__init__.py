@@ -27,7 +27,7 @@ from custom_components.react.utils.jit import ObjectJitter
 from custom_components.react.utils.logger import format_data, get_react_logger
 from custom_components.react.utils.session import SessionManager
 from custom_components.react.utils.struct import ActorRuntime, ReactorRuntime
-from custom_components.react.utils.track import ObjectTracker
+from custom_components.react.utils.track import ObjectTracker, get_template_tracker_group
 
 from custom_components.react.const import (
     ATTR_ACTION,
@@ -143,6 +143,7 @@ class WorkflowEntity(ToggleEntity, RestoreEntity):
         self._async_destroyers: list[AWAITABLE_TYPE] = None
 
         self._variable_tracker: ObjectTracker = None
+        self._actor_trackers_by_runtime: dict[int, ObjectTracker[ActorRuntime]] = {}
         
 
     async def async_added_to_hass(self) -> None:
@@ -169,15 +170,18 @@ class WorkflowEntity(ToggleEntity, RestoreEntity):
             def create_actor_tracker(actor: Actor):
                 actor_tracker = ObjectTracker[ActorRuntime](self.hass, actor, self.tctx, ActorRuntime)
                 actor_tracker.start()
+                self.on_destroy(actor_tracker.destroy)
+                return actor_tracker
 
+            def dispatch_actor_tracker_created(actor_tracker: ObjectTracker[ActorRuntime]):
                 def destroy_dispatch():
                     async_dispatcher_send(
                         self.hass, 
                         SIGNAL_ACTION_HANDLER_DESTROYED, 
                         self.workflow.id,
                         actor_tracker.value_container)
-                self.on_destroy(destroy_dispatch)
-                self.on_destroy(actor_tracker.destroy)
+                # Dispatched before the tracker is destroyed
+                self._destroyers.insert(self._destroyers.index(actor_tracker.destroy), destroy_dispatch)
                 
                 async_dispatcher_send(
                     self.hass, 
@@ -185,9 +189,17 @@ class WorkflowEntity(ToggleEntity, RestoreEntity):
                     self.workflow.id,
                     actor_tracker.value_container)
 
-                return actor_tracker
-
-            self.actor_trackers = [ create_actor_tracker(actor) for actor in self.workflow.actors ]
+            # The actor trackers share the template group of the context, which is only built once all of them
+            # are started. Handlers are created after that, so they see the rendered actors.
+            template_group = get_template_tracker_group(self.hass, self.tctx)
+            template_group.hold()
+            try:
+                self.actor_trackers = [ create_actor_tracker(actor) for actor in self.workflow.actors ]
+            finally:
+                template_group.release()
+            for actor_tracker in self.actor_trackers:
+                dispatch_actor_tracker_created(actor_tracker)
+            self._actor_trackers_by_runtime = { id(actor_tracker.value_container): actor_tracker for actor_tracker in self.actor_trackers }
 
             # Create jitters for all reactors
             def create_reactor_jitter(reactor: Reactor):
@@ -199,7 +211,7 @@ class WorkflowEntity(ToggleEntity, RestoreEntity):
             async def async_destroy_runtime():
                 await self.react.runtime.async_destroy_workflow_runtime(self.workflow.id)
             self.on_destroy_async(async_destroy_runtime)
-            self.on_destroy(self.hass.bus.async_listen(EVENT_REACT_ACTION, self.async_handle))
+            self.on_destroy(self.react.runtime.action_router.register_workflow(self.workflow.id, self.async_handle_actors))
         
             if state := await self.async_get_last_state():
                 enable_workflow = state.state == STATE_ON
@@ -287,10 +299,16 @@ class WorkflowEntity(ToggleEntity, RestoreEntity):
     @callback
     async def async_handle(self, ha_event: HaEvent):
         action_event = ActionEvent(ha_event)
-        
-        for actor_tracker in self.actor_trackers:
+        await self.async_handle_actors(action_event, [ actor_tracker.value_container for actor_tracker in self.actor_trackers ])
+
+
+    @callback
+    async def async_handle_actors(self, action_event: ActionEvent, actor_runtimes: list[ActorRuntime]):
+        for actor_runtime in actor_runtimes:
             run = False
-            actor_runtime = actor_tracker.value_container
+            actor_tracker = self._actor_trackers_by_runtime.get(id(actor_runtime))
+            if not actor_tracker:
+                continue
             if ((actor_runtime.entity == "*" or 
                  action_event.payload.entity in actor_runtime.entity) and 
                 action_event.payload.type in actor_runtime.type
@@ -320,12 +338,12 @@ class WorkflowEntity(ToggleEntity, RestoreEntity):
 
             if run: 
                 self.react.session_manager.load_session(action_event)
-                action_event.session.debug(_RUNTIME_LOGGER, f"Action event caught by actor {actor_runtime.id} from react.{self.workflow.id}: {format_data(**action_event.payload.source)}")
+                action_event.session.debug(_RUNTIME_LOGGER, lambda: f"Action event caught by actor {actor_runtime.id} from react.{self.workflow.id}: {format_data(**action_event.payload.source)}")
                 if self.is_enabled:
                     self._last_triggered = utcnow()
                     self.async_write_ha_state()
 
-                    parent_id = None if ha_event.context is None else ha_event.context.id
+                    parent_id = None if action_event.context is None else action_event.context.id
                     hass_run_context = Context(parent_id=parent_id)
                     
                     entity_vars = None
@@ -340,7 +358,7 @@ class WorkflowEntity(ToggleEntity, RestoreEntity):
                         action_event.session,
                     )
                 else:
-                    action_event.session.debug(_RUNTIME_LOGGER, f"Skipping react.{self.workflow.id} {actor_runtime.id} (workflow is disabled)")
+                    action_event.session.debug(_RUNTIME_LOGGER, lambda: f"Skipping react.{self.workflow.id} {actor_runtime.id} (workflow is disabled)")
 
 
     @callback
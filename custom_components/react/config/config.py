@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from time import strptime
@@ -9,7 +11,7 @@ from homeassistant.util import dt as dt_util
 
 from custom_components.react.exceptions import ReactException
 from custom_components.react.utils.logger import get_react_logger
-from custom_components.react.utils.struct import ActorConfig, CtorConfig, DelayData, DynamicData, MultiItem, ReactorConfig, ScheduleConfig, ScheduleRuntime, StateConfig, WaitConfig
+from custom_components.react.utils.struct import ActorConfig, CtorConfig, DelayData, DynamicData, FrozenDict, MultiItem, ReactorConfig, ScheduleConfig, ScheduleRuntime, StateConfig, WaitConfig, freeze_value
 
 from custom_components.react.const import (
     ATTR_ACTION,
@@ -220,6 +222,7 @@ class Workflow():
         self.variables = DynamicData(config.get(ATTR_VARIABLES, {}))
         self.actors: Union[list[Actor], None] = None
         self.reactors: Union[list[Reactor], None] = None
+        self._trace_config: Union[FrozenDict, None] = None
         
         self.errors: list[str] = []
 
@@ -231,6 +234,7 @@ class Workflow():
 
     def load(self, config: dict, stencil: dict, entity_group_configuration: dict):
         merged_config = dict_merge(stencil, config)
+        self._trace_config = None
         self.actors: list[Actor] = self.load_items(merged_config, entity_group_configuration, ATTR_WORKFLOW_WHEN, Actor)
         self.reactors: list[Reactor] = self.load_items(merged_config, entity_group_configuration, ATTR_WORKFLOW_THEN, Reactor)
         if ATTR_MODE in merged_config:
@@ -272,7 +276,14 @@ class Workflow():
         return result
 
     
-    def get_trace_config(self) -> dict:
+    def get_trace_config(self) -> FrozenDict:
+        # The configuration doesn't change until it is loaded again, so every trace shares the same frozen dict
+        if self._trace_config is None:
+            self._trace_config = freeze_value(self.build_trace_config())
+        return self._trace_config
+
+
+    def build_trace_config(self) -> dict:
         result = {
             a: getattr(self, a)
             for a in [ATTR_ID, ATTR_STENCIL, ATTR_NAME]
@@ -436,4 +447,4 @@ def dict_merge(dct: dict, merge_dct: dict) -> dict:
                         existing.append(list_value)
         else:
             result[key] = new
-    return result
\ No newline at end of file
+    return result
@@ -39,11 +39,18 @@ from custom_components.react.const import (
     CONF_PLUGINS,
     CONF_STENCIL,
     CONF_TRACE,
+    CONF_TRACE_MODE,
+    CONF_TRACE_SAMPLE_EVERY,
+    CONF_TRACE_SAMPLE_INTERVAL,
     CONF_WORKFLOW,
     DOMAIN,
     RESTART_MODE_ABORT,
     RESTART_MODE_FORCE,
     RESTART_MODE_RERUN,
+    TRACE_MODE_ERRORS,
+    TRACE_MODE_FULL,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
     WORKFLOW_MODE_PARALLEL,
     WORKFLOW_MODE_QUEUED,
     WORKFLOW_MODE_RESTART,
@@ -112,6 +119,14 @@ STENCIL_SCHEMA = vol.Schema({
     })
 })
 
+# trace schema
+WORKFLOW_TRACE_SCHEMA = vol.Schema({
+    **TRACE_CONFIG_SCHEMA,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL) : vol.In([TRACE_MODE_FULL, TRACE_MODE_SAMPLED, TRACE_MODE_ERRORS, TRACE_MODE_OFF]),
+    vol.Optional(CONF_TRACE_SAMPLE_EVERY, default=1) : vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(CONF_TRACE_SAMPLE_INTERVAL, default=0) : vol.All(vol.Coerce(float), vol.Range(min=0)),
+})
+
 # workflow schema
 WORKFLOW_SCHEMA = vol.Schema({
     cv.slug: vol.Schema({
@@ -122,7 +137,7 @@ WORKFLOW_SCHEMA = vol.Schema({
         vol.Optional(ATTR_WORKFLOW_THEN) : vol.All(cv.ensure_list, ensure_entity_data, [REACTOR_DATA_SCHEMA]),
         vol.Optional(ATTR_NAME): cv.string,
         vol.Optional(CONF_ICON): cv.icon,
-        vol.Optional(CONF_TRACE, default={}): TRACE_CONFIG_SCHEMA,
+        vol.Optional(CONF_TRACE, default={}): WORKFLOW_TRACE_SCHEMA,
     }, )
 })
 
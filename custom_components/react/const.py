@@ -101,6 +101,17 @@ ATTR_VARIABLES = "variables"
 ATTR_WORKFLOW_ID = "workflow_id"
 ATTR_STENCIL = "stencil"
 CONF_TRACE = "trace"
+CONF_TRACE_MODE = "mode"
+CONF_TRACE_SAMPLE_EVERY = "sample_every"
+CONF_TRACE_SAMPLE_INTERVAL = "sample_interval"
+
+# Trace modes
+TRACE_MODE_FULL = "full"
+TRACE_MODE_SAMPLED = "sampled"
+TRACE_MODE_ERRORS = "errors"
+TRACE_MODE_OFF = "off"
+ATTR_TRACED_COUNT = "traced_count"
+ATTR_SKIPPED_COUNT = "skipped_count"
 
 # Internal attributes
 ATTR_DATA = "data"
@@ -134,6 +145,9 @@ ATTR_EVENT_NOTIFY_PROVIDER_PAYLOAD = "provider_payload"
 # service attributes
 ATTR_RUN_ID = "run_id"
 ATTR_REACTION_ID = "reaction_id"
+ATTR_REACTION = "reaction"
+ATTR_CHANGES = "changes"
+ATTR_REVISION = "revision"
 
 # trace attributes
 ATTR_DONE = "done"
@@ -157,6 +171,16 @@ EVENT_REACT_REACTION = "ev_react_reaction"
 
 EVENT_RUN_REGISTRY_UPDATED = "run_registry_updated"
 EVENT_REACTION_REGISTRY_UPDATED = "reaction_registry_updated"
+# Seconds to collect registry changes into one event, 0 to merge the changes of one loop iteration
+REGISTRY_UPDATE_WINDOW = 0
+# Number of registry changes kept so subscribers can resume from a revision
+REGISTRY_UPDATE_BACKLOG = 1000
+REGISTRY_ACTION_CREATE = "create"
+REGISTRY_ACTION_UPDATE = "update"
+REGISTRY_ACTION_REMOVE = "remove"
+
+# Seconds between checks for timer actions that became due without the timer firing, e.g. after a clock jump or resume
+TIMER_CATCH_UP_INTERVAL = 60
 
 # event payload
 EVENTPAYLOAD_COMMAND_REACT = "/react"
@@ -233,6 +257,21 @@ ACTION_UNAVAILABLE = "unavailable"
 ACTION_INCREASE = "increase"
 ACTION_DECREASE = "decrease"
 
+# session settings
+SESSION_IDLE_MAX_COUNT = 1000
+SESSION_IDLE_TTL = 300
+
+# reaction journal settings
+JOURNAL_STORE_KEY = "journal"
+JOURNAL_SEGMENT_SIZE = 100
+JOURNAL_FLUSH_DELAY = 1
+
+# trace store settings
+TRACE_STORE_SEGMENTS_KEY = "trace_segments"
+TRACE_STORE_SEGMENT_SIZE = 256 * 1024
+TRACE_STORE_WORKFLOW_BUDGET = 4 * 1024 * 1024
+TRACE_STORE_FLUSH_DELAY = 1
+
 # workflow entity settings
 DEFAULT_INITIAL_STATE = True
 ATTR_LAST_TRIGGERED = "last_triggered"
@@ -25,7 +25,7 @@ class AlarmApi(PluginApiBase[AlarmConfig]):
     async def _async_alarm_arm(self, session: Session, context: Context, entity_id: str, arm_mode: ArmMode, alarm_control_panel_provider: str):
         try:
             full_entity_id = f"alarm_control_panel.{entity_id}"
-            session.debug(self.logger, f"Arming {arm_mode} {full_entity_id}")
+            session.debug(self.logger, lambda: f"Arming {arm_mode} {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -58,7 +58,7 @@ class AlarmApi(PluginApiBase[AlarmConfig]):
     async def async_alarm_disarm(self, session: Session, context: Context, entity_id: str, alarm_control_panel_provider: str):
         try:
             full_entity_id = f"alarm_control_panel.{entity_id}"
-            session.debug(self.logger, f"Disarming {full_entity_id}")
+            session.debug(self.logger, lambda: f"Disarming {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -75,7 +75,7 @@ class AlarmApi(PluginApiBase[AlarmConfig]):
     async def async_alarm_trigger(self, session: Session, context: Context, entity_id: str, alarm_control_panel_provider: str):
         try:
             full_entity_id = f"alarm_control_panel.{entity_id}"
-            session.debug(self.logger, f"Triggering alarm {full_entity_id}")
+            session.debug(self.logger, lambda: f"Triggering alarm {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
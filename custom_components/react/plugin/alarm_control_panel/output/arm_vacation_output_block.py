@@ -28,7 +28,7 @@ class AlarmArmVacationOutputBlock(OutputBlock[AlarmConfig], ApiType[AlarmApi]):
 
 
     async def async_handle_event(self, react_event: AlarmArmVacationReactionEvent):
-        react_event.session.debug(self.logger, f"Alarm arm vacation reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Alarm arm vacation reaction caught: '{react_event.payload.entity}'")
         await self.api.async_alarm_arm_vacation(
             react_event.session,
             react_event.context, 
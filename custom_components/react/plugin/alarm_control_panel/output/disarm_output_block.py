@@ -28,7 +28,7 @@ class AlarmDisarmOutputBlock(OutputBlock[AlarmConfig], ApiType[AlarmApi]):
 
 
     async def async_handle_event(self, react_event: AlarmDisarmReactionEvent):
-        react_event.session.debug(self.logger, f"Alarm disarm reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Alarm disarm reaction caught: '{react_event.payload.entity}'")
         await self.api.async_alarm_disarm(
             react_event.session,
             react_event.context, 
@@ -28,7 +28,7 @@ class AlarmTriggerOutputBlock(OutputBlock[AlarmConfig], ApiType[AlarmApi]):
 
 
     async def async_handle_event(self, react_event: AlarmTriggerReactionEvent):
-        react_event.session.debug(self.logger, f"Alarm trigger reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Alarm trigger reaction caught: '{react_event.payload.entity}'")
         await self.api.async_alarm_trigger(
             react_event.session,
             react_event.context, 
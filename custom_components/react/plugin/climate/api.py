@@ -21,7 +21,7 @@ class ClimateApi(PluginApiBase[ClimateConfig]):
     ):
         try:
             full_entity_id = f"climate.{entity_id}"
-            session.debug(self.logger, f"Setting temperature of {full_entity_id} to {temperature}")
+            session.debug(self.logger, lambda: f"Setting temperature of {full_entity_id} to {temperature}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 state_temperature = state.attributes.get(ATTR_TEMPERATURE, None)
             else:
@@ -43,7 +43,7 @@ class ClimateApi(PluginApiBase[ClimateConfig]):
     ):
         try:
             full_entity_id = f"climate.{entity_id}"
-            session.debug(self.logger, f"Resetting temperature of {full_entity_id}")
+            session.debug(self.logger, lambda: f"Resetting temperature of {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 state_temperature = state.attributes.get(ATTR_TEMPERATURE, None)
             else:
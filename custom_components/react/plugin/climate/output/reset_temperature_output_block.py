@@ -25,7 +25,7 @@ class ClimateResetTemperatureOutputBlock(OutputBlock[ClimateConfig], ApiType[Cli
 
 
     async def async_handle_event(self, react_event: ClimateResetTemperatureReactionEvent):
-        react_event.session.debug(self.logger, f"Climate reset_temperature reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Climate reset_temperature reaction caught: '{react_event.payload.entity}'")
         await self.api.async_reset_temperature(
             react_event.session,
             react_event.context, 
@@ -25,7 +25,7 @@ class ClimateSetTemperatureOutputBlock(OutputBlock[ClimateConfig], ApiType[Clima
 
 
     async def async_handle_event(self, react_event: ClimateSetTemperatureReactionEvent):
-        react_event.session.debug(self.logger, f"Climate set_temperature reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Climate set_temperature reaction caught: '{react_event.payload.entity}'")
         await self.api.async_set_temperature(
             react_event.session,
             react_event.context, 
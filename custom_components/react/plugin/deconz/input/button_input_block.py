@@ -36,7 +36,7 @@ class DeconzButtonInputBlock(InputBlock[DeconzConfig]):
 
     def create_action_event_payloads(self, source_event: DeconzButtonEvent) -> list[dict]:
         entity_id = self.entity_maps.get(source_event.payload.device_id, source_event.payload.device_id)
-        source_event.session.debug(self.logger, f"Deconz {self.event_description} event caught: device id {source_event.payload.device_id} mapped to {entity_id}")
+        source_event.session.debug(self.logger, lambda: f"Deconz {self.event_description} event caught: device id {source_event.payload.device_id} mapped to {entity_id}")
         return [{
             ATTR_ENTITY: entity_id,
             ATTR_TYPE: REACT_TYPE_BUTTON,
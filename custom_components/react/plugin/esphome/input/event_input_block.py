@@ -28,7 +28,7 @@ class EspHomeEventInputBlock(InputBlock[EspHomeConfig]):
 
     def create_action_event_payloads(self, source_event: EspHomeEventActionEvent) -> list[dict]:
         entity = source_event.payload.get(self.entity_property, None)
-        source_event.session.debug(self.logger, f"EspHome event caught: '{self.esphome_event_name}' event from {self.react_type}.{entity}")
+        source_event.session.debug(self.logger, lambda: f"EspHome event caught: '{self.esphome_event_name}' event from {self.react_type}.{entity}")
         return [{
             ATTR_ENTITY: entity,
             ATTR_TYPE: self.react_type,
@@ -14,7 +14,7 @@ from custom_components.react.utils.struct import DynamicData
 class GroupProvider(NotifyProvider[DynamicData]):
 
     async def async_notify(self, session: Session, context: Context, entity_id: str, message: str, feedback_items: list[FeedbackItem]):
-        session.debug(self.logger, f"Sending message to {entity_id}")
+        session.debug(self.logger, lambda: f"Sending message to {entity_id}")
         resolver: NotifyPluginResolver = self.plugin.hass_api.hass_get_data(NOTIFY_RESOLVER_KEY)
         if not resolver:
             session.error(self.plugin.logger, f"Notify resolver not found, notify plugin is not configured")
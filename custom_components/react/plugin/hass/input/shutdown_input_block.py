@@ -22,7 +22,7 @@ class HassEventShutdownInputBlock(InputBlock[DynamicData]):
 
 
     def create_action_event_payloads(self, source_event: HassEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Hass shutdown caught")
+        source_event.session.debug(self.logger, lambda: f"Hass shutdown caught")
         return [{
             ATTR_ENTITY: ENTITY_HASS,
             ATTR_TYPE: TYPE_SYSTEM,
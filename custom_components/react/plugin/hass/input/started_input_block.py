@@ -23,7 +23,7 @@ class HassEventStartedInputBlock(InputBlock[DynamicData]):
 
 
     def create_action_event_payloads(self, source_event: ReactEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Hass started caught")
+        source_event.session.debug(self.logger, lambda: f"Hass started caught")
         return [{
             ATTR_ENTITY: ENTITY_HASS,
             ATTR_TYPE: TYPE_SYSTEM,
@@ -12,7 +12,7 @@ class HassioApi(PluginApiBase[HassioConfig]):
 
     async def async_hassio_restart_addon(self, session: Session, context: Context, addon: str, hassio_provider: str = None):
         try:
-            session.debug(self.logger, f"Restarting addon {addon}")
+            session.debug(self.logger, lambda: f"Restarting addon {addon}")
             
             provider = self.get_hassio_provider(session, hassio_provider)
             if provider:
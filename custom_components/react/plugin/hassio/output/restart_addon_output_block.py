@@ -26,7 +26,7 @@ class HassioRestartAddonOutputBlock(OutputBlock[HassioConfig], ApiType[HassioApi
 
 
     async def async_handle_event(self, react_event: HassioRestartAddonReactionEvent):
-        react_event.session.debug(self.logger, f"Hassio restart addon reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Hassio restart addon reaction caught: '{react_event.payload.entity}'")
         await self.api.async_hassio_restart_addon(
             react_event.session,
             react_event.context, 
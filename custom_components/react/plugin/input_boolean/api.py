@@ -17,7 +17,7 @@ class InputBooleanApi(PluginApiBase[InputBooleanConfig]):
     async def async_input_boolean_turn_on(self, session: Session, context: Context, entity_id: str, input_boolean_provider: str = None):
         try:
             full_entity_id = f"input_boolean.{entity_id}"
-            session.debug(self.logger, f"Turning on {full_entity_id}")
+            session.debug(self.logger, lambda: f"Turning on {full_entity_id}")
             value: bool = None
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 try:
@@ -37,7 +37,7 @@ class InputBooleanApi(PluginApiBase[InputBooleanConfig]):
     async def async_input_boolean_turn_off(self, session: Session, context: Context, entity_id: str, input_boolean_provider: str = None):
         try:
             full_entity_id = f"input_boolean.{entity_id}"
-            session.debug(self.logger, f"Turning off {full_entity_id}")
+            session.debug(self.logger, lambda: f"Turning off {full_entity_id}")
             value: bool = None
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 try:
@@ -57,7 +57,7 @@ class InputBooleanApi(PluginApiBase[InputBooleanConfig]):
     async def async_input_boolean_toggle(self, session: Session, context: Context, entity_id: str, input_boolean_provider: str = None):
         try:
             full_entity_id = f"input_boolean.{entity_id}"
-            session.debug(self.logger, f"Toggling {full_entity_id}")
+            session.debug(self.logger, lambda: f"Toggling {full_entity_id}")
             value: bool = None
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 try:
@@ -26,7 +26,7 @@ class InputBooleanToggleOutputBlock(OutputBlock[InputBooleanConfig], ApiType[Inp
 
 
     async def async_handle_event(self, react_event: InputBooleanToggleReactionEvent):
-        react_event.session.debug(self.logger, f"Input_boolean toggle reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Input_boolean toggle reaction caught: '{react_event.payload.entity}'")
         await self.api.async_input_boolean_toggle(
             react_event.session,
             react_event.context, 
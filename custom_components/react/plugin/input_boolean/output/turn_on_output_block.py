@@ -26,7 +26,7 @@ class InputBooleanTurnOnOutputBlock(OutputBlock[InputBooleanConfig], ApiType[Inp
 
 
     async def async_handle_event(self, react_event: InputBooleanTurnOnReactionEvent):
-        react_event.session.debug(self.logger, f"Input_boolean turn on reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Input_boolean turn on reaction caught: '{react_event.payload.entity}'")
         await self.api.async_input_boolean_turn_on(
             react_event.session,
             react_event.context, 
@@ -14,7 +14,7 @@ class InputNumberApi(PluginApiBase[InputNumberConfig]):
     async def async_input_number_set(self, session: Session, context: Context, entity_id: str, value: float, input_number_provider: str = None):
         try:
             full_entity_id = f"input_number.{entity_id}"
-            session.debug(self.logger, f"Setting {full_entity_id} to {str(value)}")
+            session.debug(self.logger, lambda: f"Setting {full_entity_id} to {str(value)}")
             if not self.plugin.hass_api.hass_get_state(full_entity_id):
                 session.warning(self.plugin.logger, f"{full_entity_id} not found")
                 return
@@ -29,7 +29,7 @@ class InputNumberApi(PluginApiBase[InputNumberConfig]):
     async def async_input_number_increase(self, session: Session, context: Context, entity_id: str, increase: float, max: float = None, input_number_provider: str = None):
         try:
             full_entity_id = f"input_number.{entity_id}"
-            session.debug(self.logger, f"Increasing {full_entity_id} with {str(increase)}")
+            session.debug(self.logger, lambda: f"Increasing {full_entity_id} with {str(increase)}")
             value: float = None
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 try:
@@ -51,7 +51,7 @@ class InputNumberApi(PluginApiBase[InputNumberConfig]):
     async def async_input_number_decrease(self, session: Session, context: Context, entity_id: str, decrease: float, min: float = None, input_number_provider: str = None):
         try:
             full_entity_id = f"input_number.{entity_id}"
-            session.debug(self.logger, f"Decreasing {full_entity_id} with {str(decrease)}")
+            session.debug(self.logger, lambda: f"Decreasing {full_entity_id} with {str(decrease)}")
             value: float = None
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 try:
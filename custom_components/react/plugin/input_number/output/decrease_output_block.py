@@ -28,7 +28,7 @@ class InputNumberDecreaseOutputBlock(OutputBlock[InputNumberConfig], ApiType[Inp
 
 
     async def async_handle_event(self, react_event: InputNumberDecreaseReactionEvent):
-        react_event.session.debug(self.logger, f"Input_number decrease reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Input_number decrease reaction caught: '{react_event.payload.entity}'")
         await self.api.async_input_number_decrease(
             react_event.session,
             react_event.context, 
@@ -25,7 +25,7 @@ class InputNumberIncreaseOutputBlock(OutputBlock[InputNumberConfig], ApiType[Inp
 
 
     async def async_handle_event(self, react_event: InputNumberIncreaseReactionEvent):
-        react_event.session.debug(self.logger, f"Input_number increase reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Input_number increase reaction caught: '{react_event.payload.entity}'")
         await self.api.async_input_number_increase(
             react_event.session,
             react_event.context, 
@@ -26,7 +26,7 @@ class InputNumberSetOutputBlock(OutputBlock[InputNumberConfig], ApiType[InputNum
 
 
     async def async_handle_event(self, react_event: InputNumberSetReactionEvent):
-        react_event.session.debug(self.logger, f"Input_number set reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Input_number set reaction caught: '{react_event.payload.entity}'")
         await self.api.async_input_number_set(
             react_event.session,
             react_event.context, 
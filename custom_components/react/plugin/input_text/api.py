@@ -14,7 +14,7 @@ class InputTextApi(PluginApiBase[InputTextConfig]):
     async def async_input_text_set(self, session: Session, context: Context, entity_id: str, value: str, input_text_provider: str = None):
         try:
             full_entity_id = f"input_text.{entity_id}"
-            session.debug(self.logger, f"Setting {full_entity_id} to '{str(value)}'")
+            session.debug(self.logger, lambda: f"Setting {full_entity_id} to '{str(value)}'")
             if not self.plugin.hass_api.hass_get_state(full_entity_id):
                 session.warning(self.plugin.logger, f"{full_entity_id} not found")
                 return
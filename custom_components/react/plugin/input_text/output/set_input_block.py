@@ -26,7 +26,7 @@ class InputTextSetInputBlock(OutputBlock[InputTextConfig], ApiType[InputTextApi]
 
 
     async def async_handle_event(self, react_event: InputTextSetReactionEvent):
-        react_event.session.debug(self.logger, f"Input_text set reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Input_text set reaction caught: '{react_event.payload.entity}'")
         await self.api.async_input_text_set(
             react_event.session,
             react_event.context, 
@@ -18,7 +18,7 @@ class LightApi(PluginApiBase[LightConfig]):
     async def async_light_turn_on(self, session: Session, context: Context, entity_id: str, light_provider: str):
         try:
             full_entity_id = f"light.{entity_id}"
-            session.debug(self.logger, f"Turning on {full_entity_id}")
+            session.debug(self.logger, lambda: f"Turning on {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -35,7 +35,7 @@ class LightApi(PluginApiBase[LightConfig]):
     async def async_light_turn_off(self, session: Session, context: Context, entity_id: str, light_provider: str):
         try:
             full_entity_id = f"light.{entity_id}"
-            session.debug(self.logger, f"Turning off {full_entity_id}")
+            session.debug(self.logger, lambda: f"Turning off {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -52,7 +52,7 @@ class LightApi(PluginApiBase[LightConfig]):
     async def async_light_toggle(self, session: Session, context: Context, entity_id: str, light_provider: str):
         try:
             full_entity_id = f"light.{entity_id}"
-            session.debug(self.logger, f"Toggling {full_entity_id}")
+            session.debug(self.logger, lambda: f"Toggling {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
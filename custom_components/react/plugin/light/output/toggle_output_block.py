@@ -26,7 +26,7 @@ class LightToggleOutputBlock(OutputBlock[LightConfig], ApiType[LightApi]):
 
 
     async def async_handle_event(self, react_event: LightToggleReactionEvent):
-        react_event.session.debug(self.logger, f"Light toggle reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Light toggle reaction caught: '{react_event.payload.entity}'")
         await self.api.async_light_toggle(
             react_event.session,
             react_event.context, 
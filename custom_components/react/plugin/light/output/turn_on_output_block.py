@@ -26,7 +26,7 @@ class LightTurnOnOutputBlock(OutputBlock[LightConfig], ApiType[LightApi]):
 
 
     async def async_handle_event(self, react_event: LightTurnOnReactionEvent):
-        react_event.session.debug(self.logger, f"Light turn on reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Light turn on reaction caught: '{react_event.payload.entity}'")
         await self.api.async_light_turn_on(
             react_event.session,
             react_event.context, 
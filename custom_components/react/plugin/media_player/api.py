@@ -22,7 +22,7 @@ class MediaPlayerApi(PluginApiBase[MediaPlayerConfig]):
     ):
         try:
             full_entity_id = f"media_player.{entity_id}"
-            session.debug(self.logger, f"Playing favorite {favorite_id} on {full_entity_id}")
+            session.debug(self.logger, lambda: f"Playing favorite {favorite_id} on {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -45,7 +45,7 @@ class MediaPlayerApi(PluginApiBase[MediaPlayerConfig]):
     ):
         try:
             full_entity_id = f"media_player.{entity_id}"
-            session.debug(self.logger, f"Playing album {album_id} on {full_entity_id}")
+            session.debug(self.logger, lambda: f"Playing album {album_id} on {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -68,7 +68,7 @@ class MediaPlayerApi(PluginApiBase[MediaPlayerConfig]):
     ):
         try:
             full_entity_id = f"media_player.{entity_id}"
-            session.debug(self.logger, f"Playing playlist {playlist_id} on {full_entity_id}")
+            session.debug(self.logger, lambda: f"Playing playlist {playlist_id} on {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -90,7 +90,7 @@ class MediaPlayerApi(PluginApiBase[MediaPlayerConfig]):
     ):
         try:
             full_entity_id = f"media_player.{entity_id}"
-            session.debug(self.logger, f"Pausing {full_entity_id}")
+            session.debug(self.logger, lambda: f"Pausing {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -120,7 +120,7 @@ class MediaPlayerApi(PluginApiBase[MediaPlayerConfig]):
     ):
         try:
             full_entity_id = f"media_player.{entity_id}"
-            session.debug(self.logger, f"Speaking '{message}' on {full_entity_id}")
+            session.debug(self.logger, lambda: f"Speaking '{message}' on {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
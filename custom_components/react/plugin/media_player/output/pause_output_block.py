@@ -25,7 +25,7 @@ class MediaPlayerPauseOutputBlock(OutputBlock[MediaPlayerConfig], ApiType[MediaP
 
 
     async def async_handle_event(self, react_event: MediaPlayerPauseReactionEvent):
-        react_event.session.debug(self.logger, f"Mediaplayer pause reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Mediaplayer pause reaction caught: '{react_event.payload.entity}'")
         await self.api.async_pause(
             react_event.session,
             react_event.context, 
@@ -25,7 +25,7 @@ class MediaPlayerPlayAlbumOutputBlock(OutputBlock[MediaPlayerConfig], ApiType[Me
 
 
     async def async_handle_event(self, react_event: MediaPlayerPlayAlbumReactionEvent):
-        react_event.session.debug(self.logger, f"Mediaplayer play album reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Mediaplayer play album reaction caught: '{react_event.payload.entity}'")
         await self.api.async_play_album(
             react_event.session,
             react_event.context, 
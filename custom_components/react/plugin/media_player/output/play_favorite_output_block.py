@@ -25,7 +25,7 @@ class MediaPlayerPlayFavoriteOutputBlock(OutputBlock[MediaPlayerConfig], ApiType
 
 
     async def async_handle_event(self, react_event: MediaPlayerPlayFavoriteReactionEvent):
-        react_event.session.debug(self.logger, f"Mediaplayer play favorite reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Mediaplayer play favorite reaction caught: '{react_event.payload.entity}'")
         await self.api.async_play_favorite(
             react_event.session,
             react_event.context, 
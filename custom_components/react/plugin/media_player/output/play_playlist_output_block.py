@@ -25,7 +25,7 @@ class MediaPlayerPlayPlaylistOutputBlock(OutputBlock[MediaPlayerConfig], ApiType
 
 
     async def async_handle_event(self, react_event: MediaPlayerPlayPlaylistReactionEvent):
-        react_event.session.debug(self.logger, f"Mediaplayer play playlist reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Mediaplayer play playlist reaction caught: '{react_event.payload.entity}'")
         await self.api.async_play_playlist(
             react_event.session,
             react_event.context, 
@@ -28,7 +28,7 @@ class MediaPlayerSpeakOutputBlock(OutputBlock[MediaPlayerConfig], ApiType[MediaP
 
 
     async def async_handle_event(self, react_event: MediaPlayerSpeakReactionEvent):
-        react_event.session.debug(self.logger, f"Mediaplayer speak reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Mediaplayer speak reaction caught: '{react_event.payload.entity}'")
         await self.api.async_speak(
             react_event.session,
             react_event.context, 
@@ -42,7 +42,7 @@ class CallbackInputBlock(InputBlock[MobileAppConfig]):
 
 
     def create_action_event_payloads(self, source_event: CallbackActionEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Mobile app callback caught: '{source_event.payload.action}' action from device '{source_event.payload.device_id}'")
+        source_event.session.debug(self.logger, lambda: f"Mobile app callback caught: '{source_event.payload.action}' action from device '{source_event.payload.device_id}'")
         entity_id = self.entity_maps.get(source_event.payload.device_id, source_event.payload.device_id)
         return [{
             ATTR_ENTITY: entity_id,
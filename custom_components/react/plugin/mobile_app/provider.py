@@ -25,7 +25,7 @@ from custom_components.react.utils.session import Session
 class MobileAppProvider(NotifyProvider[MobileAppConfig]):
 
     async def async_notify(self, session: Session, context: Context, entity_id: str, message: str, feedback_items: list[FeedbackItem]):
-        session.debug(self.logger, f"Sending message to {entity_id}")
+        session.debug(self.logger, lambda: f"Sending message to {entity_id}")
         data = {
             ATTR_EVENT_MESSAGE: message,
         }
@@ -57,7 +57,7 @@ class MobileAppProvider(NotifyProvider[MobileAppConfig]):
         feedback: str,
         acknowledgement: str,
     ):
-        session.debug(self.logger, f"Confirming feedback '{feedback}'")
+        session.debug(self.logger, lambda: f"Confirming feedback '{feedback}'")
         data = {
             ATTR_EVENT_MESSAGE: MESSAGE_CLEAR_NOTIFICATION,
             ATTR_DATA: {
@@ -13,7 +13,7 @@ class MqttApi(PluginApiBase[MqttConfig]):
 
     async def async_mqtt_publish(self, session: Session, context: Context, entity_id: str, payload: PublishPayloadType, mqtt_provider: str):
         try:
-            session.debug(self.logger, f"Publishing to topic {entity_id}")
+            session.debug(self.logger, lambda: f"Publishing to topic {entity_id}")
             provider = self.get_mqtt_provider(session, mqtt_provider)
             if provider:
                 await provider.async_publish(session, context, entity_id, payload)
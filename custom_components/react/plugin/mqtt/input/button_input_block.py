@@ -49,7 +49,7 @@ class MqttButtonInputBlock(InputBlock[MqttConfig]):
 
     def create_action_event_payloads(self, source_event: MqttButtonEvent) -> list[dict]:
         entity_id = self.mapped_entity_ids.get(source_event.payload.entity_id, source_event.payload.entity_id)
-        source_event.session.debug(self.logger, f"Mqtt {self.event_description} event caught: entity id {source_event.payload.entity_id} mapped to {entity_id}")
+        source_event.session.debug(self.logger, lambda: f"Mqtt {self.event_description} event caught: entity id {source_event.payload.entity_id} mapped to {entity_id}")
         return [{
             ATTR_ENTITY: entity_id,
             ATTR_TYPE: REACT_TYPE_BUTTON,
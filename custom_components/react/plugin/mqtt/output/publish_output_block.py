@@ -27,7 +27,7 @@ class MqttPublishOutputBlock(OutputBlock[MqttConfig], ApiType[MqttApi]):
 
 
     async def async_handle_event(self, react_event: MqttPublishReactionEvent):
-        react_event.session.debug(self.logger, f"Mqtt publish reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Mqtt publish reaction caught: '{react_event.payload.entity}'")
         await self.api.async_mqtt_publish(
             react_event.session,
             react_event.context, 
@@ -26,7 +26,7 @@ class NotifyApi(PluginApiBase[NotifyConfig]):
         feedback_items: list[FeedbackItem],
         notify_provider: str,
     ):
-        session.debug(self.logger, f"Sending notify message '{message}' to {entity_id}")
+        session.debug(self.logger, lambda: f"Sending notify message '{message}' to {entity_id}")
         try:
             if not self.plugin.hass_api.hass_service_available(NOTIFY_DOMAIN, entity_id):
                 session.warning(self.plugin.logger, f"{NOTIFY_DOMAIN}.{entity_id} not found")
@@ -49,7 +49,7 @@ class NotifyApi(PluginApiBase[NotifyConfig]):
         acknowledgement: str,
         notify_provider: str, 
     ):
-        session.debug(self.logger, f"Confirming notify feedback '{feedback}'")
+        session.debug(self.logger, lambda: f"Confirming notify feedback '{feedback}'")
         try:
             provider = self.get_notify_provider(session, None, notify_provider)
             if provider:
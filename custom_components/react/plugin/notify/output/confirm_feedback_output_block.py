@@ -29,7 +29,7 @@ class NotifyConfirmFeedbackOutputBlock(OutputBlock[NotifyConfig], ApiType[Notify
 
 
     async def async_handle_event(self, react_event: NotifyConfirmFeedbackReactionEvent):
-        react_event.session.debug(self.logger, f"Notify confirm feedback reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Notify confirm feedback reaction caught: '{react_event.payload.entity}'")
         await self.api.async_confirm_feedback(
             react_event.session,
             react_event.context, 
@@ -30,7 +30,7 @@ class NotifySendMessageOutputBlock(OutputBlock[NotifyConfig], ApiType[NotifyApi]
 
 
     async def async_handle_event(self, react_event: NotifySendMessageReactionEvent):
-        react_event.session.debug(self.logger, f"Notify send message reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Notify send message reaction caught: '{react_event.payload.entity}'")
         await self.api.async_send_message(
             react_event.session,
             react_event.context,
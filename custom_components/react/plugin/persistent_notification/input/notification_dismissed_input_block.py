@@ -27,7 +27,7 @@ class NotificationDismissedInputBlock(InputBlock[DynamicData]):
 
 
     def create_action_event_payloads(self, source_event: PersistentNotificationStateChangeEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Persistent notification callback caught: '{source_event.payload.entity_id}' dismissed")
+        source_event.session.debug(self.logger, lambda: f"Persistent notification callback caught: '{source_event.payload.entity_id}' dismissed")
         return [{
             ATTR_ENTITY: PERSISTENT_NOTIFICATION_DOMAIN,
             ATTR_TYPE: REACT_TYPE_NOTIFY,
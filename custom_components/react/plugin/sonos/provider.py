@@ -30,7 +30,7 @@ class SonosProvider(MediaPlayerProvider[DynamicData]):
 
 
     async def async_suspend(self, session: Session, context: Context, entity_id: str):
-        session.debug(self.logger, f"Suspending {entity_id}")
+        session.debug(self.logger, lambda: f"Suspending {entity_id}")
         try:
             await self.plugin.hass_api.async_hass_call_service(
                 SONOS_DOMAIN,
@@ -45,7 +45,7 @@ class SonosProvider(MediaPlayerProvider[DynamicData]):
 
 
     async def async_resume(self, session: Session, context: Context, entity_id: str):
-        session.debug(self.logger, f"Resuming {entity_id}")
+        session.debug(self.logger, lambda: f"Resuming {entity_id}")
         try:
             await self.plugin.hass_api.async_hass_call_service(
                 SONOS_DOMAIN,
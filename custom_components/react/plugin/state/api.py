@@ -22,7 +22,7 @@ class StateApi(PluginApiBase[StateConfig]):
         timestamp: datetime,
         state_provider: str = None
     ):
-        session.debug(self.logger, f"Tracking state of entity {entity_id} ({str(old_state)} -> {str(new_state)})")
+        session.debug(self.logger, lambda: f"Tracking state of entity {entity_id} ({str(old_state)} -> {str(new_state)})")
         try:
             if not self.plugin.hass_api.hass_get_state(entity_id):
                 session.warning(self.plugin.logger, f"{entity_id} not found")
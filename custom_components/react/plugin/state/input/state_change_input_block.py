@@ -27,7 +27,7 @@ from custom_components.react.utils.struct import ActorRuntime, StateConfig
 class StateChangeInputBlock(InputBlock[StateConfig]):
     def __init__(self, react: ReactBase) -> None:
         super().__init__(react, StateChangedEvent)
-        self.state_track_keys: list[str] = []
+        self._actor_track_keys: dict[int, tuple[str, ...]] = {}
 
 
     def load(self):
@@ -45,7 +45,7 @@ class StateChangeInputBlock(InputBlock[StateConfig]):
 
 
     def create_action_event_payloads(self, source_event: StateChangedEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"State change caught: {source_event.payload.entity_id} ({source_event.payload.old_state.state if source_event.payload.old_state else None} -> {source_event.payload.new_state.state if source_event.payload.new_state else None})")
+        source_event.session.debug(self.logger, lambda: f"State change caught: {source_event.payload.entity_id} ({source_event.payload.old_state.state if source_event.payload.old_state else None} -> {source_event.payload.new_state.state if source_event.payload.new_state else None})")
         return [{
             ATTR_ENTITY: source_event.payload.entity_id,
             ATTR_TYPE: REACT_TYPE_STATE,
@@ -72,12 +72,20 @@ class StateChangeInputBlock(InputBlock[StateConfig]):
 
 
     def update_tracker(self, track: bool, actor: ActorRuntime):
-        if REACT_TYPE_STATE in actor.type:
+        state_track_keys: list[str] = []
+        if track and REACT_TYPE_STATE in actor.type:
             for entity in actor.entity:
                 state_track_key = track_key(self.__class__.__name__, entity)
-                if track and state_track_key not in self.state_track_keys:
-                    self.manager.track_state_change(ENTITY_ID_STATE_CHANGE_FILTER_STRATEGY.get_filter(entity, track_key=state_track_key), self)
-                    self.state_track_keys.append(state_track_key)
-                if not track and state_track_key in self.state_track_keys:
-                    self.manager.untrack_key(self, state_track_key)
-                    self.state_track_keys.remove(state_track_key)
+                if state_track_key in state_track_keys:
+                    continue
+                self.manager.acquire_state_change(
+                    self, 
+                    state_track_key, 
+                    lambda entity=entity, state_track_key=state_track_key: ENTITY_ID_STATE_CHANGE_FILTER_STRATEGY.get_filter(entity, track_key=state_track_key),
+                )
+                state_track_keys.append(state_track_key)
+
+        for state_track_key in self._actor_track_keys.pop(id(actor), ()):
+            self.manager.release_state_change(self, state_track_key)
+        if state_track_keys:
+            self._actor_track_keys[id(actor)] = tuple(state_track_keys)
@@ -28,7 +28,7 @@ class TrackStateOutputBlock(OutputBlock[StateConfig], ApiType[StateApi]):
 
 
     async def async_handle_event(self, react_event: TrackStateReactionEvent):
-        react_event.session.debug(self.logger, f"State track state reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"State track state reaction caught: '{react_event.payload.entity}'")
         await self.api.async_track_entity_state_change(
             react_event.session,
             react_event.context, 
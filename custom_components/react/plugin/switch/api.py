@@ -17,7 +17,7 @@ class SwitchApi(PluginApiBase[SwitchConfig]):
     async def async_switch_turn_on(self, session: Session, context: Context, entity_id: str, switch_provider: str):
         try:
             full_entity_id = f"switch.{entity_id}"
-            session.debug(self.logger, f"Turning on {full_entity_id}")
+            session.debug(self.logger, lambda: f"Turning on {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -34,7 +34,7 @@ class SwitchApi(PluginApiBase[SwitchConfig]):
     async def async_switch_turn_off(self, session: Session, context: Context, entity_id: str, switch_provider: str):
         try:
             full_entity_id = f"switch.{entity_id}"
-            session.debug(self.logger, f"Turning off {full_entity_id}")
+            session.debug(self.logger, lambda: f"Turning off {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -51,7 +51,7 @@ class SwitchApi(PluginApiBase[SwitchConfig]):
     async def async_switch_toggle(self, session: Session, context: Context, entity_id: str, switch_provider: str):
         try:
             full_entity_id = f"switch.{entity_id}"
-            session.debug(self.logger, f"Toggling {full_entity_id}")
+            session.debug(self.logger, lambda: f"Toggling {full_entity_id}")
             if state := self.plugin.hass_api.hass_get_state(full_entity_id):
                 value = state.state
             else:
@@ -26,7 +26,7 @@ class SwitchToggleOutputBlock(OutputBlock[LightConfig], ApiType[SwitchApi]):
 
 
     async def async_handle_event(self, react_event: SwitchToggleReactionEvent):
-        react_event.session.debug(self.logger, f"Switch toggle reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Switch toggle reaction caught: '{react_event.payload.entity}'")
         await self.api.async_switch_toggle(
             react_event.session,
             react_event.context, 
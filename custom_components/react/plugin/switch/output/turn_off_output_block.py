@@ -26,7 +26,7 @@ class SwitchTurnOffOutputBlock(OutputBlock[LightConfig], ApiType[SwitchApi]):
 
 
     async def async_handle_event(self, react_event: SwitchTurnOffReactionEvent):
-        react_event.session.debug(self.logger, f"Switch turn off reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Switch turn off reaction caught: '{react_event.payload.entity}'")
         await self.api.async_switch_turn_off(
             react_event.session,
             react_event.context, 
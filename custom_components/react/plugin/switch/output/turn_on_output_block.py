@@ -26,7 +26,7 @@ class SwitchTurnOnOutputBlock(OutputBlock[LightConfig], ApiType[SwitchApi]):
 
 
     async def async_handle_event(self, react_event: SwitchTurnOnReactionEvent):
-        react_event.session.debug(self.logger, f"Switch turn on reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Switch turn on reaction caught: '{react_event.payload.entity}'")
         await self.api.async_switch_turn_on(
             react_event.session,
             react_event.context, 
@@ -45,7 +45,7 @@ class CallbackInputBlock(InputBlock[TelegramConfig]):
 
 
     def create_action_event_payloads(self, source_event: CallbackActionEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Telegram callback caught: '{source_event.payload.feedback}' feedback from chat '{source_event.payload.chat_id}'")
+        source_event.session.debug(self.logger, lambda: f"Telegram callback caught: '{source_event.payload.feedback}' feedback from chat '{source_event.payload.chat_id}'")
         return [{
             ATTR_ENTITY: self.entity_maps.get(f"{source_event.payload.entity_source}", source_event.payload.entity_source),
             ATTR_TYPE: REACT_TYPE_NOTIFY,
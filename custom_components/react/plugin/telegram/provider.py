@@ -25,7 +25,7 @@ from custom_components.react.utils.session import Session
 class TelegramProvider(NotifyProvider[TelegramConfig]):
 
     async def async_notify(self, session: Session, context: Context, entity_id: str, message: str, feedback_items: list[FeedbackItem]):
-        session.debug(self.logger, f"Sending message to {entity_id}")
+        session.debug(self.logger, lambda: f"Sending message to {entity_id}")
         data: dict = {
             ATTR_EVENT_MESSAGE: escape_markdown(message),
         }
@@ -55,7 +55,7 @@ class TelegramProvider(NotifyProvider[TelegramConfig]):
         feedback: str,
         acknowledgement: str,
     ):
-        session.debug(self.logger, f"Confirming feedback '{feedback}' with acknowledgement '{acknowledgement}'")
+        session.debug(self.logger, lambda: f"Confirming feedback '{feedback}' with acknowledgement '{acknowledgement}'")
         data = {
             ATTR_MESSAGEID: message_id,
             ATTR_CHAT_ID: conversation_id,
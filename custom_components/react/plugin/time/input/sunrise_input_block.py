@@ -55,7 +55,7 @@ class SunriseInputBlock(InputBlock[DynamicData]):
 
 
     def create_action_event_payloads(self, source_event: TimeEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Sunrise caught: {source_event.payload.entity} value {source_event.payload.time_key} matched sunrise time ({dt_util.now(time_zone=dt_util.DEFAULT_TIME_ZONE).strftime('%H:%M:%S')})")
+        source_event.session.debug(self.logger, lambda: f"Sunrise caught: {source_event.payload.entity} value {source_event.payload.time_key} matched sunrise time ({dt_util.now(time_zone=dt_util.DEFAULT_TIME_ZONE).strftime('%H:%M:%S')})")
         return [{
             ATTR_ENTITY: SUN_EVENT_SUNRISE,
             ATTR_TYPE: ACTOR_TYPE_TIME,
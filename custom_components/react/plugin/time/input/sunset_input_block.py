@@ -55,7 +55,7 @@ class SunsetInputBlock(InputBlock[DynamicData]):
 
 
     def create_action_event_payloads(self, source_event: TimeEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Sunset caught: {source_event.payload.entity} value {source_event.payload.time_key} matched sunset time ({dt_util.now(time_zone=dt_util.DEFAULT_TIME_ZONE).strftime('%H:%M:%S')})")
+        source_event.session.debug(self.logger, lambda: f"Sunset caught: {source_event.payload.entity} value {source_event.payload.time_key} matched sunset time ({dt_util.now(time_zone=dt_util.DEFAULT_TIME_ZONE).strftime('%H:%M:%S')})")
         return [{
             ATTR_ENTITY: SUN_EVENT_SUNSET,
             ATTR_TYPE: ACTOR_TYPE_TIME,
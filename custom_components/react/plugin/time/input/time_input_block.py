@@ -43,7 +43,7 @@ class TimeInputBlock(InputBlock[DynamicData]):
 
 
     def create_action_event_payloads(self, source_event: TimeEvent) -> list[dict]:
-        source_event.session.debug(self.logger, f"Time change caught: {source_event.payload.entity} value {source_event.payload.time_key} matched current time ({dt_util.now(time_zone=dt_util.DEFAULT_TIME_ZONE).strftime('%H:%M:%S')})")
+        source_event.session.debug(self.logger, lambda: f"Time change caught: {source_event.payload.entity} value {source_event.payload.time_key} matched current time ({dt_util.now(time_zone=dt_util.DEFAULT_TIME_ZONE).strftime('%H:%M:%S')})")
         return [{
             ATTR_ENTITY: source_event.payload.entity,
             ATTR_TYPE: ACTOR_TYPE_TIME,
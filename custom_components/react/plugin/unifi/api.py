@@ -12,7 +12,7 @@ class UnifiApi(PluginApiBase[UnifiConfig]):
 
     async def async_unifi_reconnect_client(self, session: Session, context: Context, device_id: str, unifi_provider: str = None):
         try:
-            session.debug(self.logger, f"Reconnecting client with device_id {device_id}")
+            session.debug(self.logger, lambda: f"Reconnecting client with device_id {device_id}")
             if device := self.plugin.hass_api.hass_get_device(device_id):
                 if device.disabled:
                     session.warning(self.plugin.logger, f"Device with device_id {device_id} is disabled")
@@ -26,7 +26,7 @@ class UnifiReconnectClientOutputBlock(OutputBlock[UnifiConfig], ApiType[UnifiApi
 
 
     async def async_handle_event(self, react_event: UnifiReconnectClientReactionEvent):
-        react_event.session.debug(self.logger, f"Unifi reconnect client reaction caught: '{react_event.payload.entity}'")
+        react_event.session.debug(self.logger, lambda: f"Unifi reconnect client reaction caught: '{react_event.payload.entity}'")
         await self.api.async_unifi_reconnect_client(
             react_event.session,
             react_event.context, 
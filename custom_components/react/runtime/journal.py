@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.react.utils.logger import get_react_logger
+from custom_components.react.utils.store import ReactStore, get_store_for_key
+
+from custom_components.react.const import (
+    ATTR_ID,
+    JOURNAL_FLUSH_DELAY,
+    JOURNAL_SEGMENT_SIZE,
+    JOURNAL_STORE_KEY,
+    REACT_LOGGER_RUNTIME,
+)
+
+_LOGGER = get_react_logger(REACT_LOGGER_RUNTIME)
+
+ATTR_JOURNAL_OP = "op"
+ATTR_JOURNAL_RECORDS = "records"
+ATTR_JOURNAL_SEGMENTS = "segments"
+
+JOURNAL_OP_ADD = "add"
+JOURNAL_OP_REMOVE = "remove"
+
+
+class ReactionJournal:
+    """Append-only journal of pending reaction waits.
+
+    Records are appended to the current segment, which is flushed with a coalesced delayed save. Once a segment
+    is full it is sealed and a new one is started, so a change never rewrites more than one small segment.
+    When the sealed segments mostly contain records that no longer matter, the live entries are compacted
+    into a single new segment and the old segments are removed.
+    """
+
+    def __init__(self, hass: HomeAssistant, segment_size: int = JOURNAL_SEGMENT_SIZE, flush_delay: float = JOURNAL_FLUSH_DELAY) -> None:
+        self._hass = hass
+        self._segment_size = segment_size
+        self._flush_delay = flush_delay
+
+        self._entries: dict[str, dict] = {}
+        self._manifest_store = get_store_for_key(hass, JOURNAL_STORE_KEY)
+        self._segment_stores: dict[int, ReactStore] = {}
+        self._sealed_segments: dict[int, int] = {}
+        self._last_segment_id: int = 0
+        self._current_segment_id: int = 0
+        self._current_records: list[dict] = []
+        self._compacting = False
+        self._loaded = False
+
+
+    @property
+    def entries(self) -> list[dict]:
+        return list(self._entries.values())
+
+
+    async def async_load(self) -> list[dict]:
+        manifest = await self._manifest_store.async_load() or {}
+        segment_ids: list[int] = manifest.get(ATTR_JOURNAL_SEGMENTS, [])
+        for segment_id in segment_ids:
+            segment = await self._get_segment_store(segment_id).async_load() or {}
+            for record in segment.get(ATTR_JOURNAL_RECORDS, []):
+                self._apply(record)
+            self._sealed_segments[segment_id] = len(segment.get(ATTR_JOURNAL_RECORDS, []))
+
+        self._last_segment_id = max(segment_ids, default=0)
+        self._start_segment()
+        self._loaded = True
+        if segment_ids:
+            await self._async_compact()
+        _LOGGER.debug(f"Loaded {len(self._entries)} pending waits from journal")
+        return self.entries
+
+
+    @callback
+    def add(self, entry: dict):
+        self._entries[entry[ATTR_ID]] = entry
+        self._append({ATTR_JOURNAL_OP: JOURNAL_OP_ADD, **entry})
+
+
+    @callback
+    def remove(self, entry_id: str):
+        if self._entries.pop(entry_id, None) is None:
+            return
+        self._append({ATTR_JOURNAL_OP: JOURNAL_OP_REMOVE, ATTR_ID: entry_id})
+
+
+    def _apply(self, record: dict):
+        record = dict(record)
+        op = record.pop(ATTR_JOURNAL_OP, None)
+        if op == JOURNAL_OP_ADD:
+            self._entries[record[ATTR_ID]] = record
+        elif op == JOURNAL_OP_REMOVE:
+            self._entries.pop(record[ATTR_ID], None)
+
+
+    def _append(self, record: dict):
+        if not self._loaded:
+            self._start_segment()
+            self._loaded = True
+
+        records = self._current_records
+        records.append(record)
+        if len(records) == 1:
+            # First record of a new segment, the manifest needs to know about it
+            self._save_manifest()
+        self._get_segment_store(self._current_segment_id).async_delay_save(lambda: {ATTR_JOURNAL_RECORDS: records}, self._flush_delay)
+        if len(records) >= self._segment_size:
+            self._seal_segment()
+
+
+    def _start_segment(self):
+        self._last_segment_id += 1
+        self._current_segment_id = self._last_segment_id
+        self._current_records = []
+
+
+    def _seal_segment(self):
+        self._sealed_segments[self._current_segment_id] = len(self._current_records)
+        self._start_segment()
+        if sum(self._sealed_segments.values()) > max(self._segment_size, 2 * len(self._entries)):
+            self._hass.async_create_task(self._async_compact())
+        else:
+            self._save_manifest()
+
+
+    def _save_manifest(self):
+        self._manifest_store.async_delay_save(self._manifest_data, self._flush_delay)
+
+
+    def _manifest_data(self) -> dict:
+        return {ATTR_JOURNAL_SEGMENTS: [*self._sealed_segments, self._current_segment_id]}
+
+
+    async def _async_compact(self):
+        if self._compacting:
+            return
+        self._compacting = True
+        try:
+            # Records appended while compacting go to the current segment, which stays ordered after the compacted one
+            compacted_segment_ids = list(self._sealed_segments)
+            records = [ {ATTR_JOURNAL_OP: JOURNAL_OP_ADD, **entry} for entry in self._entries.values() ]
+            self._last_segment_id += 1
+            compacted_segment_id = self._last_segment_id
+            await self._get_segment_store(compacted_segment_id).async_save({ATTR_JOURNAL_RECORDS: records})
+
+            sealed_segments = { compacted_segment_id: len(records) }
+            for segment_id, record_count in self._sealed_segments.items():
+                if segment_id not in compacted_segment_ids:
+                    sealed_segments[segment_id] = record_count
+            self._sealed_segments = sealed_segments
+            await self._manifest_store.async_save(self._manifest_data())
+
+            for segment_id in compacted_segment_ids:
+                await self._get_segment_store(segment_id).async_remove()
+                self._segment_stores.pop(segment_id, None)
+            _LOGGER.debug(f"Compacted {len(compacted_segment_ids)} journal segments into segment {compacted_segment_id}")
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Compacting the reaction journal failed")
+        finally:
+            self._compacting = False
+
+
+    def _get_segment_store(self, segment_id: int) -> ReactStore:
+        # Stores are cached so delayed saves of the same segment are coalesced
+        if not (store := self._segment_stores.get(segment_id)):
+            store = self._segment_stores[segment_id] = get_store_for_key(self._hass, f"{JOURNAL_STORE_KEY}.{segment_id}")
+        return store
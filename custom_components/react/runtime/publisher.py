@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from custom_components.react.const import (
+    ATTR_ACTION,
+    ATTR_CHANGES,
+    ATTR_DATA,
+    ATTR_REVISION,
+    ATTR_RUN_ID,
+    REGISTRY_UPDATE_BACKLOG,
+)
+
+changes_listener_type = Callable[[list[dict]], None]
+
+
+class RegistryUpdatePublisher:
+    """Merges registry changes into a single bus event per loop iteration, or per window when one is configured.
+
+    Every change gets a monotonically increasing revision. The most recent changes are kept in a backlog so
+    subscribers that reconnect can resume from the last revision they have seen.
+    """
+
+    def __init__(self, hass: HomeAssistant, event_type: str, window: float = 0, backlog_size: int = REGISTRY_UPDATE_BACKLOG) -> None:
+        self._hass = hass
+        self._event_type = event_type
+        self._window = window
+        self._changes: list[dict] = []
+        self._backlog: deque[dict] = deque(maxlen=backlog_size)
+        self._listeners: list[changes_listener_type] = []
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._flush_scheduled = False
+        self.revision: int = 0
+
+
+    @callback
+    def async_publish(self, action: str, item_id: str, data: dict = None):
+        self.revision += 1
+        change = {ATTR_ACTION: action, ATTR_RUN_ID: item_id, ATTR_REVISION: self.revision}
+        if data is not None:
+            change[ATTR_DATA] = data
+        self._changes.append(change)
+        self._backlog.append(change)
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        if self._window > 0:
+            self._cancel_flush = async_call_later(self._hass, self._window, self._async_flush)
+        else:
+            self._hass.loop.call_soon(self._async_flush)
+
+
+    @callback
+    def async_flush(self):
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._async_flush()
+
+
+    @callback
+    def async_subscribe(self, listener: changes_listener_type) -> CALLBACK_TYPE:
+        self._listeners.append(listener)
+
+        @callback
+        def unsubscribe():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        return unsubscribe
+
+
+    def get_changes_since(self, revision: int) -> list[dict] | None:
+        """Return the changes after the given revision, or None when the backlog no longer reaches back that far."""
+        if revision > self.revision:
+            return None
+        if revision == self.revision:
+            return []
+        if not self._backlog or self._backlog[0][ATTR_REVISION] > revision + 1:
+            return None
+        return [ change for change in self._backlog if change[ATTR_REVISION] > revision ]
+
+
+    @callback
+    def _async_flush(self, *args):
+        self._cancel_flush = None
+        self._flush_scheduled = False
+        if not self._changes:
+            return
+        changes, self._changes = self._changes, []
+        self._hass.bus.async_fire(self._event_type, {ATTR_CHANGES: changes})
+        for listener in list(self._listeners):
+            listener(changes)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Union
+
+from homeassistant.core import CALLBACK_TYPE, Event as HaEvent, HassJob, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from custom_components.react.utils.events import ActionEvent
+from custom_components.react.utils.logger import get_react_logger
+from custom_components.react.utils.struct import ActorRuntime, MultiItem
+
+from custom_components.react.const import (
+    ATTR_ACTION,
+    ATTR_ENTITY,
+    ATTR_TYPE,
+    EVENT_REACT_ACTION,
+    REACT_LOGGER_RUNTIME,
+    SIGNAL_ACTION_HANDLER_CREATED,
+    SIGNAL_ACTION_HANDLER_DESTROYED,
+    SIGNAL_TRACK_UPDATE,
+)
+
+_LOGGER = get_react_logger(REACT_LOGGER_RUNTIME)
+
+ENTITY_WILDCARD = "*"
+
+action_handler_type = Callable[[ActionEvent, list[ActorRuntime]], Any]
+
+
+class ActorRoute:
+    def __init__(self, workflow_id: str, actor: ActorRuntime) -> None:
+        self.workflow_id = workflow_id
+        self.actor = actor
+        self.entity_keys: list[tuple[str, str, Union[str, None]]] = []
+        self.wildcard_keys: list[tuple[str, Union[str, None]]] = []
+        self.container_ids: list[int] = []
+
+
+class ActionRouter:
+    """Single EVENT_REACT_ACTION listener that dispatches action events to the workflows whose actors can match.
+
+    Actors are indexed by (type, entity, action). Actors with entity '*' go into a separate (type, action) bucket
+    and actors without an action are stored under action None so they match every action.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._handlers: dict[str, tuple[int, HassJob]] = {}
+        self._last_handler_order: int = 0
+        self._routes: dict[int, ActorRoute] = {}
+        self._routes_by_container: dict[int, ActorRoute] = {}
+        self._entity_index: dict[tuple[str, str, Union[str, None]], dict[int, ActorRoute]] = {}
+        self._wildcard_index: dict[tuple[str, Union[str, None]], dict[int, ActorRoute]] = {}
+
+        self._unsubscribers: list[CALLBACK_TYPE] = [
+            hass.bus.async_listen(EVENT_REACT_ACTION, self.async_route),
+            async_dispatcher_connect(hass, SIGNAL_ACTION_HANDLER_CREATED, self.async_add_actor),
+            async_dispatcher_connect(hass, SIGNAL_ACTION_HANDLER_DESTROYED, self.async_remove_actor),
+            async_dispatcher_connect(hass, SIGNAL_TRACK_UPDATE, self.async_track_update),
+        ]
+
+
+    def register_workflow(self, workflow_id: str, handler: action_handler_type) -> CALLBACK_TYPE:
+        self._last_handler_order += 1
+        self._handlers[workflow_id] = (self._last_handler_order, HassJob(handler, f"react action handler {workflow_id}"))
+
+        @callback
+        def unregister_workflow():
+            self._handlers.pop(workflow_id, None)
+        return unregister_workflow
+
+
+    @callback
+    def async_add_actor(self, workflow_id: str, actor: ActorRuntime):
+        route = ActorRoute(workflow_id, actor)
+        self._routes[id(actor)] = route
+        self._index_route(route)
+
+
+    @callback
+    def async_remove_actor(self, workflow_id: str, actor: ActorRuntime):
+        if route := self._routes.pop(id(actor), None):
+            self._unindex_route(route)
+
+
+    @callback
+    def async_track_update(self, value_container: Any, attr: str):
+        # A templated actor property (or an item of a templated list property) re-rendered
+        if route := self._routes_by_container.get(id(value_container)):
+            self._unindex_route(route)
+            self._index_route(route)
+
+
+    @callback
+    def async_route(self, ha_event: HaEvent):
+        type = ha_event.data.get(ATTR_TYPE)
+        entity = ha_event.data.get(ATTR_ENTITY)
+        action = ha_event.data.get(ATTR_ACTION)
+
+        candidates: dict[int, ActorRoute] = {}
+        try:
+            for bucket in (
+                self._entity_index.get((type, entity, action)),
+                self._entity_index.get((type, entity, None)),
+                self._wildcard_index.get((type, action)),
+                self._wildcard_index.get((type, None)),
+            ):
+                if bucket:
+                    candidates.update(bucket)
+        except TypeError:
+            # Unhashable event values can never match a configured actor
+            return
+
+        if not candidates:
+            return
+
+        matches: dict[str, list[ActorRuntime]] = {}
+        for route in candidates.values():
+            if route.workflow_id in self._handlers:
+                matches.setdefault(route.workflow_id, []).append(route.actor)
+        if not matches:
+            return
+
+        # Parse the event once and share it with every workflow that can handle it
+        action_event = ActionEvent(ha_event)
+        for workflow_id in sorted(matches, key=lambda workflow_id: self._handlers[workflow_id][0]):
+            actors = sorted(matches[workflow_id], key=lambda actor: actor.index or 0)
+            self._hass.async_run_hass_job(self._handlers[workflow_id][1], action_event, actors)
+
+
+    def destroy(self):
+        for unsubscriber in self._unsubscribers:
+            unsubscriber()
+        self._unsubscribers.clear()
+        self._handlers.clear()
+        self._routes.clear()
+        self._routes_by_container.clear()
+        self._entity_index.clear()
+        self._wildcard_index.clear()
+
+
+    def _index_route(self, route: ActorRoute):
+        actor = route.actor
+        route.container_ids = [id(actor)]
+        for attr in (ATTR_ENTITY, ATTR_TYPE, ATTR_ACTION):
+            if isinstance(value := actor.get(attr), MultiItem):
+                route.container_ids.append(id(value))
+        for container_id in route.container_ids:
+            self._routes_by_container[container_id] = route
+
+        types = _route_values(actor.type)
+        actions = _route_values(actor.action) if actor.action is not None else [None]
+        if actor.entity == ENTITY_WILDCARD:
+            route.wildcard_keys = [ (type, action) for type in types for action in actions ]
+            route.entity_keys = []
+        else:
+            entities = _route_values(actor.entity)
+            route.wildcard_keys = []
+            route.entity_keys = [ (type, entity, action) for type in types for entity in entities for action in actions ]
+
+        for key in route.entity_keys:
+            self._entity_index.setdefault(key, {})[id(actor)] = route
+        for key in route.wildcard_keys:
+            self._wildcard_index.setdefault(key, {})[id(actor)] = route
+
+
+    def _unindex_route(self, route: ActorRoute):
+        actor_id = id(route.actor)
+        for container_id in route.container_ids:
+            self._routes_by_container.pop(container_id, None)
+        _unindex_keys(self._entity_index, route.entity_keys, actor_id)
+        _unindex_keys(self._wildcard_index, route.wildcard_keys, actor_id)
+        route.container_ids = []
+        route.entity_keys = []
+        route.wildcard_keys = []
+
+
+def _route_values(value: Any) -> list:
+    if value is None:
+        return []
+    if isinstance(value, MultiItem):
+        return [ item for item in value if item is not None ]
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _unindex_keys(index: dict[Any, dict[int, ActorRoute]], keys: list, actor_id: int):
+    for key in keys:
+        if bucket := index.get(key):
+            bucket.pop(actor_id, None)
+            if not bucket:
+                del index[key]
@@ -5,12 +5,14 @@ from collections import deque
 from contextvars import ContextVar
 from datetime import datetime
 from decimal import InvalidOperation
+from logging import DEBUG
 from itertools import product
 from typing import Callable, Generator, Union
 
 from homeassistant.core import HomeAssistant, callback, Context, CALLBACK_TYPE
 from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
-from homeassistant.helpers.event import async_track_template, async_track_point_in_utc_time
+from homeassistant.helpers.event import async_track_template
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
@@ -18,12 +20,17 @@ from custom_components.react.enums import YIELD_RESULTS, StepResult
 
 from custom_components.react.config.config import Workflow, calculate_reaction_datetime
 from custom_components.react.reactions.base import ReactionData
+from custom_components.react.runtime.journal import ReactionJournal
+from custom_components.react.runtime.publisher import RegistryUpdatePublisher
+from custom_components.react.runtime.router import ActionRouter
+from custom_components.react.runtime.timer import TimerService
+from custom_components.react.runtime.trace_store import TraceStore
 from custom_components.react.runtime.snapshots import WorkflowSnapshot
 from custom_components.react.utils.events import ActionEventPayload
 from custom_components.react.utils.logger import format_data, get_react_logger
-from custom_components.react.utils.session import Session
+from custom_components.react.utils.session import Session, message_type, render_message
 from custom_components.react.utils.struct import ReactorRuntime
-from custom_components.react.utils.trace import ReactTrace, create_trace
+from custom_components.react.utils.trace import ErrorReactTrace, NoopReactTrace, ReactTrace, create_trace
 
 from custom_components.react.const import (
     ACTION_AVAILABLE, 
@@ -37,8 +44,11 @@ from custom_components.react.const import (
     ATTR_DONE, 
     ATTR_EVENT, 
     ATTR_ID,
+    ATTR_REACTION,
     ATTR_REACTOR_ID,
     ATTR_REMAINING,
+    ATTR_RESET_WORKFLOW,
+    ATTR_RESTART_MODE,
     ATTR_RUN_ID, 
     ATTR_SCHEDULE,
     ATTR_START_TIME, 
@@ -57,7 +67,12 @@ from custom_components.react.const import (
     EVENT_RUN_REGISTRY_UPDATED,
     PACKAGE_NAME,
     REACT_LOGGER_RUNTIME,
+    REGISTRY_ACTION_CREATE,
+    REGISTRY_ACTION_REMOVE,
+    REGISTRY_ACTION_UPDATE,
+    REGISTRY_UPDATE_WINDOW,
     RESTART_MODE_FORCE, 
+    RESTART_MODE_RERUN,
     SIGNAL_WORKFLOW_RESET, 
     TRACE_PATH_ACTOR, 
     TRACE_PATH_CONDITION,
@@ -98,8 +113,12 @@ def make_path(elements: Union[str, list[str]], parent: str = None):
 class ReactionRegistry:
     def __init__(self, hass: HomeAssistant) -> None:
         self._hass = hass
+        # Dicts keyed by reaction id are used as ordered sets, so removal is O(1)
         self._reactions_by_id: dict[str, Reaction] = {}
-        self._reactions_by_run: dict[str, list[Reaction]] = {}
+        self._reactions_by_run: dict[str, dict[str, Reaction]] = {}
+        self._reactions_by_reactor: dict[tuple[str, str], dict[str, Reaction]] = {}
+        self.publisher = RegistryUpdatePublisher(hass, EVENT_REACTION_REGISTRY_UPDATED, REGISTRY_UPDATE_WINDOW)
+        self.journal = ReactionJournal(hass)
 
 
     def get_all_reactions(self) -> list[dict]:
@@ -111,7 +130,7 @@ class ReactionRegistry:
 
 
     def get_reactions_by_run(self, workflow_run_id: str) -> list[Reaction]:
-        return list(self._reactions_by_run.get(workflow_run_id))
+        return list(self._reactions_by_run.get(workflow_run_id, {}).values())
 
 
     def register(self, reactor: ReactorRuntime, reaction: Reaction) -> Reaction:
@@ -121,26 +140,30 @@ class ReactionRegistry:
                 existing_reaction.stop()
 
         self._reactions_by_id[reaction.id] = reaction
-        if not reaction.workflow_run_id in self._reactions_by_run:
-            self._reactions_by_run[reaction.workflow_run_id] = []
-        self._reactions_by_run[reaction.workflow_run_id].append(reaction)
+        self._reactions_by_run.setdefault(reaction.workflow_run_id, {})[reaction.id] = reaction
+        self._reactions_by_reactor.setdefault((reaction.workflow_id, reaction.reactor_id), {})[reaction.id] = reaction
 
-        self._hass.bus.fire(
-            EVENT_REACTION_REGISTRY_UPDATED, {"action": "create", "run_id": reaction.id}
-        )
+        self.publisher.async_publish(REGISTRY_ACTION_CREATE, reaction.id, reaction.as_short_dict())
         return reaction
 
 
+    def update(self, reaction: Reaction):
+        if reaction.id in self._reactions_by_id:
+            self.publisher.async_publish(REGISTRY_ACTION_UPDATE, reaction.id, reaction.as_short_dict())
+
+
     def remove(self, reaction: Reaction):
         self._reactions_by_id.pop(reaction.id)
-        self._reactions_by_run[reaction.workflow_run_id].remove(reaction)
+        _remove_from_index(self._reactions_by_run, reaction.workflow_run_id, reaction.id)
+        _remove_from_index(self._reactions_by_reactor, (reaction.workflow_id, reaction.reactor_id), reaction.id)
 
-        self._hass.bus.fire(
-            EVENT_REACTION_REGISTRY_UPDATED, {"action": "remove", "run_id": reaction.id}
-        )
+        self.publisher.async_publish(REGISTRY_ACTION_REMOVE, reaction.id)
 
 
     def find(self, workflow_id: str = None, reactor_id: str = None) -> Generator[Reaction, None, None]:
+        if workflow_id is not None and reactor_id is not None:
+            yield from list(self._reactions_by_reactor.get((workflow_id, reactor_id), {}).values())
+            return
         for reaction in list(self._reactions_by_id.values()):
             if ((workflow_id is None or reaction.workflow_id == workflow_id) and
                 (reactor_id is None or reaction.reactor_id == reactor_id)):
@@ -150,8 +173,9 @@ class ReactionRegistry:
 class RunRegistry:
     def __init__(self, hass: HomeAssistant) -> None:
         self._hass = hass
-        self._runs: dict[str, list[WorkflowRun]] = {}
+        self._runs: dict[str, dict[str, WorkflowRun]] = {}
         self._runs_by_id: dict[str, WorkflowRun] = {}
+        self.publisher = RegistryUpdatePublisher(hass, EVENT_RUN_REGISTRY_UPDATED, REGISTRY_UPDATE_WINDOW)
 
 
     def get_all_runs(self) -> list[dict]:
@@ -159,7 +183,11 @@ class RunRegistry:
 
 
     def get_runs(self, workflow_id: str) -> list[WorkflowRun]:
-        return self._runs.get(workflow_id, [])
+        return list(self._runs.get(workflow_id, {}).values())
+
+
+    def get_run_count(self, workflow_id: str) -> int:
+        return len(self._runs.get(workflow_id, {}))
 
 
     def get_run(self, run_id: str) -> WorkflowRun:
@@ -167,30 +195,32 @@ class RunRegistry:
 
 
     def register(self, run: WorkflowRun):
-        if not run.workflow_id in self._runs:
-            self._runs[run.workflow_id] = []
-        self._runs[run.workflow_id].append(run)
+        self._runs.setdefault(run.workflow_id, {})[run.id] = run
         self._runs_by_id[run.id] = run
 
-        self._hass.bus.fire(
-            EVENT_RUN_REGISTRY_UPDATED, {"action": "create", "run_id": run.id}
-        )
+        self.publisher.async_publish(REGISTRY_ACTION_CREATE, run.id, run.as_short_dict())
         return run
 
 
     def remove(self, workflow_id: str, workflow_run: WorkflowRun):
-        self._runs[workflow_id].remove(workflow_run)
+        _remove_from_index(self._runs, workflow_id, workflow_run.id)
         self._runs_by_id.pop(workflow_run.id)
 
-        self._hass.bus.fire(
-            EVENT_RUN_REGISTRY_UPDATED, {"action": "remove", "run_id": workflow_run.id}
-        )
+        self.publisher.async_publish(REGISTRY_ACTION_REMOVE, workflow_run.id)
 
 
     def find(self, workflow_id: str = None) -> Generator[Reaction, None, None]:
-        for run in list(self._runs_by_id.values()):
-            if (workflow_id is None or run.workflow_id == workflow_id):
-                yield run
+        if workflow_id is not None:
+            yield from self.get_runs(workflow_id)
+            return
+        yield from list(self._runs_by_id.values())
+
+
+def _remove_from_index(index: dict, key, item_id: str):
+    if (items := index.get(key)) is not None:
+        items.pop(item_id, None)
+        if not items:
+            del index[key]
 
 
 class ReactRuntime:
@@ -200,17 +230,21 @@ class ReactRuntime:
         self._workflow_runtimes: dict[str, WorkflowRuntime] = {}
         self.run_registry = RunRegistry(hass)
         self.reaction_registry = ReactionRegistry(hass)
+        self.action_router = ActionRouter(hass)
+        self.timer_service = TimerService(hass)
+        self.trace_store = TraceStore(hass)
 
         @callback
         async def async_reset(workflow_id: str, source_session: Session):
             if workflow_runtime := self.get_workflow_runtime(workflow_id):
                 await workflow_runtime.async_stop_all_runs(source_session=source_session)
         self._cancel_reset = async_dispatcher_connect(hass, SIGNAL_WORKFLOW_RESET, async_reset)
+        self._cancel_restore: CALLBACK_TYPE | None = None
 
 
     def create_workflow_runtime(self, workflow_config: Workflow) -> WorkflowRuntime:
         _LOGGER.debug(f"Creating workflowruntime for react.{workflow_config.id}")
-        result = WorkflowRuntime(self._hass, self.run_registry, self.reaction_registry, workflow_config)
+        result = WorkflowRuntime(self._hass, self.run_registry, self.reaction_registry, self.timer_service, self.trace_store, workflow_config)
         self._workflow_runtimes[workflow_config.id] = result
         return result
 
@@ -247,6 +281,55 @@ class ReactRuntime:
             await workflow_runtime.async_run(snapshot, entity_vars, hass_run_context, source_session)
 
 
+    async def async_restore_reactions(self):
+        entries = await self.reaction_registry.journal.async_load()
+
+        # Workflow runtimes are created and enabled by the workflow entities, which are only set up once hass has started
+        @callback
+        def async_restore(hass: HomeAssistant):
+            self._cancel_restore = None
+            for entry in entries:
+                self._restore_reaction(entry)
+        self._cancel_restore = async_at_started(self._hass, async_restore)
+
+
+    def _restore_reaction(self, entry: dict):
+        when = dt_util.parse_datetime(entry[ATTR_WHEN]) if entry.get(ATTR_WHEN) else None
+        if not when or not self._can_resume_reaction(entry):
+            self.reaction_registry.journal.remove(entry[ATTR_ID])
+            return
+
+        @callback
+        def async_resume(now: datetime):
+            # The workflow could have been disabled or reloaded without the reactor while waiting
+            if not self._can_resume_reaction(entry):
+                self.reaction_registry.journal.remove(entry[ATTR_ID])
+                return
+            _LOGGER.debug(f"Resuming reaction {entry[ATTR_ID]} of react.{entry[ATTR_WORKFLOW_ID]} restored from journal")
+            if reset_workflow := entry.get(ATTR_RESET_WORKFLOW):
+                async_dispatcher_send(self._hass, SIGNAL_WORKFLOW_RESET, reset_workflow, None)
+            else:
+                self._hass.bus.async_fire(EVENT_REACT_REACTION, entry[ATTR_REACTION])
+            self.reaction_registry.journal.remove(entry[ATTR_ID])
+
+        _LOGGER.debug(f"Restoring reaction {entry[ATTR_ID]} of react.{entry[ATTR_WORKFLOW_ID]}, will resume at {when.astimezone(dt_util.DEFAULT_TIME_ZONE).strftime(DATETIME_FORMAT_READABLE)}")
+        self.timer_service.async_schedule(max(when, utcnow()), async_resume)
+
+
+    def _can_resume_reaction(self, entry: dict) -> bool:
+        workflow_runtime = self.get_workflow_runtime(entry[ATTR_WORKFLOW_ID])
+        if not workflow_runtime:
+            reason = "workflow does not exist"
+        elif not workflow_runtime.running:
+            reason = "workflow is disabled"
+        elif not workflow_runtime.has_reactor(entry.get(ATTR_REACTOR_ID)):
+            reason = "reactor does not exist anymore"
+        else:
+            return True
+        _LOGGER.debug(f"Dropping reaction {entry[ATTR_ID]} of react.{entry[ATTR_WORKFLOW_ID]} restored from journal ({reason})")
+        return False
+
+
     def run_now(self, run_id: str):
         workflow_run = self.run_registry.get_run(run_id)
         if workflow_run:
@@ -283,8 +366,14 @@ class ReactRuntime:
         if self._cancel_reset:
             self._cancel_reset()
             self._cancel_reset = None
+        if self._cancel_restore:
+            self._cancel_restore()
+            self._cancel_restore = None
         for workflow_id in list(self._workflow_runtimes):
             await self.async_destroy_workflow_runtime(workflow_id, is_hass_shutdown=is_hass_shutdown)
+        self.action_router.destroy()
+        self.timer_service.destroy()
+        await self.trace_store.async_shutdown()
 
     
 class WorkflowRuntime:
@@ -293,20 +382,33 @@ class WorkflowRuntime:
         hass: HomeAssistant, 
         run_registry: RunRegistry, 
         reaction_registry: ReactionRegistry, 
+        timer_service: TimerService,
+        trace_store: TraceStore,
         workflow_config: Workflow
     ) -> None:
         self._hass = hass
         self._run_registry = run_registry
         self._reaction_registry = reaction_registry
+        self._timer_service = timer_service
+        self._trace_store = trace_store
         self._workflow_config = workflow_config
         self._queue: deque[(WorkflowRun, Session)] = deque()
         self.running = False
         
 
+    @property
+    def workflow_config(self) -> Workflow:
+        return self._workflow_config
+
+
     def get_runs(self) -> list[WorkflowRun]:
         return self._run_registry.get_runs(self._workflow_config.id)
 
 
+    def has_reactor(self, reactor_id: str) -> bool:
+        return any(reactor.id == reactor_id for reactor in self._workflow_config.reactors)
+
+
     def start(self):
         _LOGGER.debug(f"Starting react.{self._workflow_config.id} runtime")
         self.running = True
@@ -320,12 +422,14 @@ class WorkflowRuntime:
 
     async def async_run(self, snapshot: WorkflowSnapshot, entity_vars: dict, hass_run_context: Context, source_session: Session):
         run_session = source_session.create_child_session() 
-        source_session.debug(_LOGGER, f"Creating run {run_session.id} from react.{self._workflow_config.id} for event: {format_data(**snapshot.action_event.payload.source)}")
+        source_session.debug(_LOGGER, lambda: f"Creating run {run_session.id} from react.{self._workflow_config.id} for event: {format_data(**snapshot.action_event.payload.source)}")
         if not self.running:
-            source_session.debug(_LOGGER, f"Skipping react.{self._workflow_config.id} (workflow is disabled)")
+            source_session.debug(_LOGGER, lambda: f"Skipping react.{self._workflow_config.id} (workflow is disabled)")
+            run_session.release()
             return
         elif self._workflow_config.mode == WORKFLOW_MODE_SINGLE and self.runs > 0:
-            source_session.debug(_LOGGER, f"Skipping react.{self._workflow_config.id} (workflow is in 'Single' mode and another run is active)")
+            source_session.debug(_LOGGER, lambda: f"Skipping react.{self._workflow_config.id} (workflow is in 'Single' mode and another run is active)")
+            run_session.release()
             return
 
         # Prevent non-allowed recursive calls which will cause deadlocks when we try to
@@ -336,13 +440,20 @@ class WorkflowRuntime:
             and (run_stack := run_stack_cv.get()) is not None
             and id(self) in run_stack
         ):
-            source_session.debug(_LOGGER, f"Skipping react.{self._workflow_config.id} (workflow is in 'Restart' or 'Queued' mode and a recursion was detected)")
+            source_session.debug(_LOGGER, lambda: f"Skipping react.{self._workflow_config.id} (workflow is in 'Restart' or 'Queued' mode and a recursion was detected)")
+            run_session.release()
             return
 
+        # The run can be queued or wait for other runs to stop, reactors still need to be rendered against the
+        # state at the time of the event
+        snapshot.materialize()
+
         run = WorkflowRun(
             self._hass, 
             self._workflow_config,
             self._reaction_registry,
+            self._timer_service,
+            self._trace_store,
             id(self), 
             snapshot, 
             dict(entity_vars), 
@@ -363,7 +474,7 @@ class WorkflowRuntime:
 
     async def async_run_now(self, run: WorkflowRun, source_session: Session):
         try:
-            source_session.debug(_LOGGER, f"Scheduling run {run.id} now")
+            source_session.debug(_LOGGER, lambda: f"Scheduling run {run.id} now")
             await run.async_run()
         except asyncio.CancelledError:
             run.stop()
@@ -383,17 +494,17 @@ class WorkflowRuntime:
         spare: WorkflowRun | None = None,
         source_session: Session = None,
     ) -> None:
-        self._debug(f"Stopping all react.{self._workflow_config.id} jobs", source_session)
+        self._debug(lambda: f"Stopping all react.{self._workflow_config.id} jobs", source_session)
         self._queue.clear()
         for run in [item for item in self.get_runs() if item != spare]:
             run.stop(is_hass_shutdown)\
 
     
-    def _debug(self, message: str, session: Session = None):
+    def _debug(self, message: message_type, session: Session = None):
         if session:
             session.debug(_LOGGER, message)
-        else:
-            _LOGGER.debug(message)
+        elif _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug(render_message(message, ()))
 
 
     async def _async_stop_all_runs(self, aws: list[asyncio.Task]) -> None:
@@ -402,7 +513,7 @@ class WorkflowRuntime:
 
     @property
     def runs(self) -> int:
-        return len(self.get_runs())
+        return self._run_registry.get_run_count(self._workflow_config.id)
 
     
     @property
@@ -415,6 +526,8 @@ class WorkflowRun:
         hass: HomeAssistant, 
         workflow_config: Workflow,
         reaction_registry: ReactionRegistry,
+        timer_service: TimerService,
+        trace_store: TraceStore,
         runtime_id: int,
         snapshot: WorkflowSnapshot, 
         entity_vars: dict, 
@@ -426,6 +539,8 @@ class WorkflowRun:
         self._hass = hass
         self._workflow = workflow_config
         self._reaction_registry = reaction_registry
+        self._timer_service = timer_service
+        self._trace_store = trace_store
         self._runtime_id = runtime_id
         self.snapshot = snapshot
         self._entity_vars = entity_vars
@@ -452,7 +567,7 @@ class WorkflowRun:
 
     
     def stop(self, is_hass_shutdown: bool = False) -> None:
-        self.session.debug(_LOGGER, f"Stopping run")
+        self.session.debug(_LOGGER, lambda: f"Stopping run")
 
         self._stopped = True
         for reaction in self._get_reactions():
@@ -460,9 +575,10 @@ class WorkflowRun:
 
 
     def finish(self) -> None:
-        self.session.debug(_LOGGER, f"Finishing run")
+        self.session.debug(_LOGGER, lambda: f"Finishing run")
         self.trace.finished()
         self._run_done_callback(self)
+        self.session.release()
 
 
     @callback
@@ -474,7 +590,7 @@ class WorkflowRun:
         run_stack.append(self._runtime_id)
 
         try:
-            self.session.debug(_LOGGER, f"Starting run")
+            self.session.debug(_LOGGER, lambda: f"Starting run")
             await self.async_step_main()
         except _ConditionFail:
             self.finish()
@@ -502,7 +618,7 @@ class WorkflowRun:
                 ATTR_CONTEXT: self.snapshot.action_event.context
             }
         }
-        self.trace = create_trace(self._hass, self._workflow, self._hass_run_context, variables)        
+        self.trace = create_trace(self._hass, self._workflow, self._hass_run_context, variables, self._trace_store)        
 
 
     def step_actor_root(self):
@@ -521,7 +637,7 @@ class WorkflowRun:
             self.trace.trace_node(make_path(TRACE_PATH_CONDITION, parent_path), result=condition_result)
             
         if not condition_result:
-            self.session.debug(_LOGGER, f"Cancelling run (actor {self.snapshot.actor.id} condition false)")
+            self.session.debug(_LOGGER, lambda: f"Cancelling run (actor {self.snapshot.actor.id} condition false)")
             raise _ConditionFail()
         
 
@@ -535,7 +651,7 @@ class WorkflowRun:
         
         def create_reaction(reactor: ReactorRuntime) -> Reaction:
             reaction_session = self.session.create_child_session()
-            self.session.debug(_LOGGER, f"Creating reaction {reaction_session.id} from reactor {reactor.id}")
+            self.session.debug(_LOGGER, lambda: f"Creating reaction {reaction_session.id} from reactor {reactor.id}")
             reaction = Reaction(
                 self._hass, 
                 self.id, 
@@ -544,7 +660,10 @@ class WorkflowRun:
                 reactor, 
                 self.trace, 
                 self.reaction_done,
+                self._reaction_registry.update,
                 reaction_session,
+                self._timer_service,
+                self._reaction_registry.journal,
             )
             self._reaction_registry.register(reactor, reaction)
             return reaction
@@ -585,9 +704,12 @@ class Reaction:
         workflow_id: str, 
         event_payload: ActionEventPayload,
         reactor: ReactorRuntime,
-        trace: ReactTrace,
+        trace: ReactTrace | ErrorReactTrace | NoopReactTrace,
         reaction_done_callback: Callable[[Reaction], None],
+        reaction_update_callback: Callable[[Reaction], None],
         session: Session,
+        timer_service: TimerService,
+        journal: ReactionJournal,
     ) -> None:
 
         self._hass = hass
@@ -597,7 +719,11 @@ class Reaction:
         self._reactor = reactor
         self._trace = trace
         self._reaction_done_callback = reaction_done_callback
+        self._reaction_update_callback = reaction_update_callback
         self.session = session
+        self._timer_service = timer_service
+        self._journal = journal
+        self._journaled = False
 
         self._steps = self.run_steps()
         self._path = make_path([TRACE_PATH_REACTOR, str(self._reactor.index)])
@@ -631,10 +757,13 @@ class Reaction:
 
 
     def stop(self, is_hass_shutdown: bool = False):
-        self.session.debug(_LOGGER, f"Stopping reaction")
+        self.session.debug(_LOGGER, lambda: f"Stopping reaction")
         if is_hass_shutdown and self._restart_mode == RESTART_MODE_FORCE:
             self.force_resume()
         else:
+            if is_hass_shutdown and self._restart_mode == RESTART_MODE_RERUN:
+                # Keep the journal entry so the wait is picked up again after the restart
+                self._journaled = False
             self.yield_done()
             self._steps.close()
             self.result = StepResult.STOP
@@ -647,8 +776,35 @@ class Reaction:
 
 
     def finish(self):
-        self.session.debug(_LOGGER, f"Finishing reaction")
+        self.session.debug(_LOGGER, lambda: f"Finishing reaction")
+        self.release_journal()
         self._reaction_done_callback(self)
+        self.session.release()
+
+
+    def journal_wait(self, reaction: ReactionData):
+        # Only delay and schedule waits are journaled. A state wait is left out, its condition is a template
+        # that is tracked with the variables of the run, which can't be persisted.
+        if self._restart_mode != RESTART_MODE_RERUN:
+            return
+        self._journal.add({
+            ATTR_ID: self.id,
+            ATTR_WORKFLOW_ID: self.workflow_id,
+            ATTR_RUN_ID: self.workflow_run_id,
+            ATTR_REACTOR_ID: self._reactor.id,
+            ATTR_WHEN: self._when.isoformat(),
+            ATTR_RESTART_MODE: self._restart_mode,
+            ATTR_RESET_WORKFLOW: self._reactor.reset_workflow,
+            # Session ids are not stable across restarts
+            ATTR_REACTION: vars(reaction) | {"session_id": None},
+        })
+        self._journaled = True
+
+
+    def release_journal(self):
+        if self._journaled:
+            self._journal.remove(self.id)
+            self._journaled = False
 
 
     def yield_done(self):
@@ -660,15 +816,18 @@ class Reaction:
     @callback
     def run(self, *args):
         try:
-            self.session.debug(_LOGGER, f"{'Resuming' if self.result in YIELD_RESULTS else 'Starting'} reaction" )
+            self.session.debug(_LOGGER, lambda: f"{'Resuming' if self.result in YIELD_RESULTS else 'Starting'} reaction" )
             if self.result in DONE_RESULTS:
                 raise InvalidOperation()
             self.result = next(self._steps, StepResult.SUCCESS)
             if self.result in DONE_RESULTS:
                 self._steps.close()
                 self.finish()
-        except Exception:
+            elif self.result in YIELD_RESULTS:
+                self._reaction_update_callback(self)
+        except Exception as ex:
             self.session.exception(_LOGGER, 'Step failed')
+            self._trace.set_error(ex)
             self.result = StepResult.FAIL
             self.finish()
 
@@ -678,7 +837,7 @@ class Reaction:
             self.step_reactor_condition()
             yield from self.step_reactor_event()
         except _ConditionFail:
-            self.session.debug(_LOGGER, f"Cancelling reaction (condition false)")
+            self.session.debug(_LOGGER, lambda: f"Cancelling reaction (condition false)")
             pass
 
     
@@ -691,6 +850,8 @@ class Reaction:
 
 
     def step_reactor_event(self) -> Generator[StepResult, None, None]:
+        # Normally rendered when the run was created already, this covers reactions that are created otherwise
+        self._reactor.materialize()
         reactor_action = [ self._event_payload.action ] if self._reactor.forward_action else self._reactor.action
         reactor_data = [ self._event_payload.data ] if self._reactor.forward_data else self._reactor.data
         for entity, type, action, data in product(self._reactor.entity or [None], self._reactor.type or [None], reactor_action or [None], reactor_data or [None]):
@@ -703,9 +864,9 @@ class Reaction:
             if ATTR_STATE in self._reactor.wait.keys():
                 yield from self.step_reaction_state()
             if ATTR_DELAY in self._reactor.wait.keys():
-                yield from self.step_reaction_delay()
+                yield from self.step_reaction_delay(reaction)
             elif ATTR_SCHEDULE in self._reactor.wait.keys():
-                yield from self.step_reaction_schedule()
+                yield from self.step_reaction_schedule(reaction)
         if self._reactor.reset_workflow:
             self.step_reaction_reset()
         else:
@@ -727,14 +888,14 @@ class Reaction:
         wait_template_string = self._reactor.wait.state.get_template(ATTR_CONDITION)
         wait_template = Template(wait_template_string, self._hass)
         self._cancel_yield = async_track_template(self._hass, wait_template, self.run, self._trace.get_vars(self.id))
-        self.session.debug(_LOGGER, f"Yielding reaction on state")
+        self.session.debug(_LOGGER, lambda: f"Yielding reaction on state")
         yield StepResult.YIELD_STATE
 
         wait[ATTR_DONE] = True
         self.yield_done()
 
 
-    def step_reaction_delay(self) -> Generator[StepResult, None, None]:
+    def step_reaction_delay(self, reaction: ReactionData) -> Generator[StepResult, None, None]:
         self._when = calculate_reaction_datetime(delay = self._reactor.wait.delay)
         trace_timestamp = self._when.astimezone(dt_util.DEFAULT_TIME_ZONE).strftime(DATETIME_FORMAT_TRACE)
         wait = {ATTR_DELAY: self._reactor.wait.delay, ATTR_TIMESTAMP: trace_timestamp, ATTR_DONE: False}
@@ -742,15 +903,17 @@ class Reaction:
         self._trace.trace_section_node(self.id, self.make_reactor_path(TRACE_PATH_DELAY), wait=wait)
 
         self._restart_mode = self._reactor.wait.delay.restart_mode
-        self._cancel_yield = async_track_point_in_utc_time(self._hass, self.run, self._when)
-        self.session.debug(_LOGGER, f"Yielding reaction with delay, will resume at {self._when.astimezone(dt_util.DEFAULT_TIME_ZONE).strftime(DATETIME_FORMAT_READABLE)}")
+        self._cancel_yield = self._timer_service.async_schedule(self._when, self.run)
+        self.journal_wait(reaction)
+        self.session.debug(_LOGGER, lambda: f"Yielding reaction with delay, will resume at {self._when.astimezone(dt_util.DEFAULT_TIME_ZONE).strftime(DATETIME_FORMAT_READABLE)}")
         yield StepResult.YIELD_DELAY
         
         wait[ATTR_DONE] = True
         self.yield_done()
+        self.release_journal()
 
 
-    def step_reaction_schedule(self) -> Generator[StepResult, None, None]:
+    def step_reaction_schedule(self, reaction: ReactionData) -> Generator[StepResult, None, None]:
         self._when = calculate_reaction_datetime(schedule = self._reactor.wait.schedule)
         trace_timestamp = self._when.astimezone(dt_util.DEFAULT_TIME_ZONE).strftime(DATETIME_FORMAT_TRACE)
         wait = {ATTR_SCHEDULE: self._reactor.wait.schedule.as_dict(), ATTR_TIMESTAMP: trace_timestamp, ATTR_DONE: False}
@@ -758,17 +921,19 @@ class Reaction:
         self._trace.trace_section_node(self.id, self.make_reactor_path(TRACE_PATH_SCHEDULE), wait=wait)
 
         self._restart_mode = self._reactor.wait.schedule.restart_mode
-        self._cancel_yield = async_track_point_in_utc_time(self._hass, self.run, self._when)
-        self.session.debug(_LOGGER, f"Yielding reaction with schedule, will resume at {self._when.astimezone(dt_util.DEFAULT_TIME_ZONE).strftime(DATETIME_FORMAT_READABLE)}")
+        self._cancel_yield = self._timer_service.async_schedule(self._when, self.run)
+        self.journal_wait(reaction)
+        self.session.debug(_LOGGER, lambda: f"Yielding reaction with schedule, will resume at {self._when.astimezone(dt_util.DEFAULT_TIME_ZONE).strftime(DATETIME_FORMAT_READABLE)}")
         yield StepResult.YIELD_SCHEDULE
  
         wait[ATTR_DONE] = True
         self.yield_done()
+        self.release_journal()
 
 
     def step_reaction_reset(self):
         self._trace.trace_section_node(self.id, self.make_reactor_path(TRACE_PATH_RESET), reset_workflow=self._reactor.reset_workflow)
-        self.session.debug(_LOGGER, f"Dispatching reset react.{self._reactor.reset_workflow} from reaction")
+        self.session.debug(_LOGGER, lambda: f"Dispatching reset react.{self._reactor.reset_workflow} from reaction")
         async_dispatcher_send(self._hass, SIGNAL_WORKFLOW_RESET, self._reactor.reset_workflow, self.session)
 
 
@@ -776,15 +941,15 @@ class Reaction:
         node = self._trace.trace_section_node(self.id, self.make_reactor_path(TRACE_PATH_DISPATCH))
         if self._reactor.forward_action and self._event_payload.action == ACTION_TOGGLE:
             # Don't forward toggle actions as they are always accompanied by other actions which will be forwarded
-            self.session.debug(_LOGGER, f"Cancelling reaction (action 'toggle' with forward_action)")
+            self.session.debug(_LOGGER, lambda: f"Cancelling reaction (action 'toggle' with forward_action)")
             node.set_result(message="Skipped, toggle with forward-action")
                 
         elif self._reactor.forward_action and (self._event_payload.action == ACTION_AVAILABLE or self._event_payload.action == ACTION_UNAVAILABLE):
             # Don't forward availabililty actions as reactors don't support them
-            self.session.debug(_LOGGER, f"Cancelling reaction (availability action with forward_action)")
+            self.session.debug(_LOGGER, lambda: f"Cancelling reaction (availability action with forward_action)")
             node.set_result(message="Skipped, availability action with forward-action")
 
         else:
-            self.session.debug(_LOGGER, f"Dispatching reaction event with data {format_data(**vars(reaction))}")
+            self.session.debug(_LOGGER, lambda: f"Dispatching reaction event with data {format_data(**vars(reaction))}")
             self._hass.bus.async_fire(EVENT_REACT_REACTION, vars(reaction))
             node.set_result(reaction=reaction.to_trace_result())
@@ -4,10 +4,15 @@ from homeassistant.core import HomeAssistant
 
 from custom_components.react.utils.context import ActorTemplateContextDataProvider
 from custom_components.react.utils.events import ActionEvent
-from custom_components.react.utils.jit import ObjectJitter
+from custom_components.react.utils.jit import JitterRenderContext, ObjectJitter
 from custom_components.react.utils.struct import ActorRuntime, DynamicData, ReactorRuntime
 from custom_components.react.utils.track import ObjectTracker
 
+from custom_components.react.const import ATTR_CONDITION
+
+# Reactor attributes that are always needed, other templated attributes are rendered when a reaction gets to them
+REACTOR_EAGER_ATTRS = (ATTR_CONDITION,)
+
 
 class WorkflowSnapshot:
     def __init__(self,
@@ -22,6 +27,15 @@ class WorkflowSnapshot:
         self.action_event = action_event
 
 
+    def materialize(self):
+        """Render the deferred attributes of the reactors that are going to react against the current state."""
+        if not self.actor.condition:
+            return
+        for reactor in self.reactors:
+            if reactor.condition:
+                reactor.materialize()
+
+
 def create_snapshot(
     hass: HomeAssistant, 
     variables_tracker: ObjectTracker[DynamicData],
@@ -29,12 +43,13 @@ def create_snapshot(
     reactor_jitters: list[ObjectJitter[ReactorRuntime]], 
     action_event: ActionEvent
 ):
-    template_context_data_provider = ActorTemplateContextDataProvider(hass, action_event.payload, actor_tracker.value_container.id)
+    # The template variables are built once and shared by all reactors of the snapshot
+    render_context = JitterRenderContext(ActorTemplateContextDataProvider(hass, action_event.payload, actor_tracker.value_container.id))
 
     result = WorkflowSnapshot(
         action_event = action_event,
         variables = variables_tracker.value_container,
         actor = actor_tracker.value_container,
-        reactors = [ jitter.render(template_context_data_provider) for jitter in reactor_jitters ]
+        reactors = [ jitter.render_deferred(render_context, REACTOR_EAGER_ATTRS) for jitter in reactor_jitters ]
     )
     return result
\ No newline at end of file
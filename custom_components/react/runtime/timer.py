@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import heapq
+from itertools import count
+from typing import Callable
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from custom_components.react.utils.logger import get_react_logger
+
+from custom_components.react.const import (
+    REACT_LOGGER_RUNTIME,
+    TIMER_CATCH_UP_INTERVAL,
+)
+
+_LOGGER = get_react_logger(REACT_LOGGER_RUNTIME)
+
+timer_action_type = Callable[[datetime], None]
+
+
+class TimerEntry:
+    __slots__ = ("timestamp", "sequence", "action", "queued")
+
+    def __init__(self, timestamp: float, sequence: int, action: timer_action_type) -> None:
+        self.timestamp = timestamp
+        self.sequence = sequence
+        self.action = action
+        # Whether the entry is still in the heap, due entries are taken out before their actions run
+        self.queued = True
+
+
+    def __lt__(self, other: TimerEntry) -> bool:
+        return (self.timestamp, self.sequence) < (other.timestamp, other.sequence)
+
+
+class TimerService:
+    """React-wide timer that keeps a single loop timer armed for the earliest pending deadline.
+
+    Cancelled entries are only marked and dropped lazily when they reach the top of the heap, the heap is
+    rebuilt when more than half of it consists of cancelled entries.
+
+    The loop timer follows the monotonic clock, so it fires late when the wall clock jumps ahead or the system
+    resumes from suspend. While entries are pending, due actions are also run by a periodic wall clock check and
+    when the core config (e.g. the time zone) is updated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._heap: list[TimerEntry] = []
+        self._sequence = count()
+        self._cancelled_count: int = 0
+        self._armed_timestamp: float | None = None
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._cancel_catch_up: list[CALLBACK_TYPE] = []
+
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._heap) - self._cancelled_count
+
+
+    @callback
+    def async_schedule(self, when: datetime, action: timer_action_type) -> CALLBACK_TYPE:
+        entry = TimerEntry(dt_util.as_utc(when).timestamp(), next(self._sequence), action)
+        heapq.heappush(self._heap, entry)
+        if self._armed_timestamp is None or entry.timestamp < self._armed_timestamp:
+            self._arm()
+
+        @callback
+        def cancel():
+            self._cancel_entry(entry)
+        return cancel
+
+
+    @callback
+    def async_fire_due(self, now: datetime | None = None):
+        """Run every action that is due, also used to catch up after a clock jump or system resume."""
+        now = max(now, dt_util.utcnow()) if now else dt_util.utcnow()
+        timestamp = now.timestamp()
+        due: list[TimerEntry] = []
+        while self._heap and self._heap[0].timestamp <= timestamp:
+            entry = heapq.heappop(self._heap)
+            entry.queued = False
+            if entry.action is None:
+                self._cancelled_count -= 1
+                continue
+            due.append(entry)
+
+        self._arm()
+        for entry in due:
+            # An action that ran before in this batch can cancel the ones after it, e.g. by stopping a reaction
+            if (action := entry.action) is None:
+                continue
+            entry.action = None
+            try:
+                action(now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while running timer action")
+
+
+    def destroy(self):
+        self._disarm()
+        self._stop_catch_up()
+        for entry in self._heap:
+            entry.queued = False
+        self._heap.clear()
+        self._cancelled_count = 0
+
+
+    def _cancel_entry(self, entry: TimerEntry):
+        if entry.action is None:
+            return
+        entry.action = None
+        if not entry.queued:
+            return
+        self._cancelled_count += 1
+        if self._cancelled_count > len(self._heap) // 2:
+            self._heap = [ item for item in self._heap if item.action is not None ]
+            heapq.heapify(self._heap)
+            self._cancelled_count = 0
+        if not self._heap:
+            self._disarm()
+            self._stop_catch_up()
+
+
+    def _arm(self):
+        while self._heap and self._heap[0].action is None:
+            heapq.heappop(self._heap).queued = False
+            self._cancelled_count -= 1
+        if not self._heap:
+            self._disarm()
+            self._stop_catch_up()
+            return
+
+        self._start_catch_up()
+        timestamp = self._heap[0].timestamp
+        if timestamp == self._armed_timestamp:
+            return
+        self._disarm()
+        self._armed_timestamp = timestamp
+        self._cancel_timer = async_track_point_in_utc_time(self._hass, self._async_timer_fired, dt_util.utc_from_timestamp(timestamp))
+
+
+    def _disarm(self):
+        if self._cancel_timer:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._armed_timestamp = None
+
+
+    def _start_catch_up(self):
+        if self._cancel_catch_up:
+            return
+
+        @callback
+        def async_core_config_updated(event: Event):
+            self.async_fire_due()
+
+        self._cancel_catch_up = [
+            async_track_time_interval(self._hass, self.async_fire_due, timedelta(seconds=TIMER_CATCH_UP_INTERVAL)),
+            self._hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, async_core_config_updated),
+        ]
+
+
+    def _stop_catch_up(self):
+        for cancel in self._cancel_catch_up:
+            cancel()
+        self._cancel_catch_up = []
+
+
+    @callback
+    def _async_timer_fired(self, now: datetime):
+        self._cancel_timer = None
+        self._armed_timestamp = None
+        self.async_fire_due(now)
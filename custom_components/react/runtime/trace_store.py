@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+
+from collections import OrderedDict
+from typing import IO
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import ExtendedJSONEncoder, json_bytes
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.json import json_loads
+
+from custom_components.react.utils.logger import get_react_logger
+from custom_components.react.utils.store import get_store_key
+
+from custom_components.react.const import (
+    REACT_LOGGER_RUNTIME,
+    TRACE_STORE_FLUSH_DELAY,
+    TRACE_STORE_SEGMENTS_KEY,
+    TRACE_STORE_SEGMENT_SIZE,
+    TRACE_STORE_WORKFLOW_BUDGET,
+)
+
+_LOGGER = get_react_logger(REACT_LOGGER_RUNTIME)
+
+ATTR_TRACE_RUN_ID = "run_id"
+ATTR_TRACE_SEGMENT = "segment"
+ATTR_TRACE_OFFSET = "offset"
+ATTR_TRACE_LENGTH = "length"
+ATTR_TRACE_SHORT = "short"
+
+SEGMENT_SUFFIX = ".jsonl"
+SEGMENT_INDEX_SUFFIX = ".index.jsonl"
+
+
+class WorkflowTraces:
+    """Index of the stored traces of a single workflow, oldest first."""
+
+    __slots__ = ("entries", "size", "segment_id", "segment_size", "segment_counts")
+
+    def __init__(self, segment_id: int = 1, segment_size: int = 0) -> None:
+        self.entries: OrderedDict[str, dict] = OrderedDict()
+        self.size: int = 0
+        self.segment_id: int = segment_id
+        self.segment_size: int = segment_size
+        self.segment_counts: dict[int, int] = {}
+
+
+    def add(self, entry: dict):
+        self.entries[entry[ATTR_TRACE_RUN_ID]] = entry
+        self.size += entry[ATTR_TRACE_LENGTH]
+        segment_id = entry[ATTR_TRACE_SEGMENT]
+        self.segment_counts[segment_id] = self.segment_counts.get(segment_id, 0) + 1
+
+
+    def evict(self, budget: int) -> list[int]:
+        """Drop the oldest traces until the budget is met and return the segments that became empty."""
+        empty_segments = []
+        while self.size > budget and self.entries:
+            _, entry = self.entries.popitem(last=False)
+            self.size -= entry[ATTR_TRACE_LENGTH]
+            segment_id = entry[ATTR_TRACE_SEGMENT]
+            self.segment_counts[segment_id] -= 1
+            if self.segment_counts[segment_id] == 0:
+                self.segment_counts.pop(segment_id)
+                if segment_id == self.segment_id:
+                    # Never write to a removed segment, the next trace starts a new one
+                    self.segment_id += 1
+                    self.segment_size = 0
+                empty_segments.append(segment_id)
+        return empty_segments
+
+
+class TraceStore:
+    """Persists finished traces in per-workflow segment files.
+
+    Finished traces are encoded when they are appended, queued and written to the current segment of their
+    workflow by a background job that writes them in batches. Next to every segment an index file gets a line with
+    the short dict and the location of each trace. Only that index is kept in memory (and read at startup), trace
+    bodies are read from their segment when they are requested. When the traces of a workflow exceed the byte
+    budget the oldest ones are evicted and segments without traces are removed together with their index.
+    """
+
+    def __init__(self, 
+        hass: HomeAssistant, 
+        workflow_budget: int = TRACE_STORE_WORKFLOW_BUDGET, 
+        segment_size: int = TRACE_STORE_SEGMENT_SIZE, 
+        flush_delay: float = TRACE_STORE_FLUSH_DELAY,
+    ) -> None:
+        self._hass = hass
+        self._workflow_budget = workflow_budget
+        self._segment_size = segment_size
+        self._flush_delay = flush_delay
+
+        self._path = hass.config.path(STORAGE_DIR, get_store_key(TRACE_STORE_SEGMENTS_KEY))
+        self._workflows: dict[str, WorkflowTraces] = {}
+        self._pending: dict[str, tuple[str, dict, bytes]] = {}
+        self._writing: dict[str, tuple[str, dict, bytes]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+
+    async def async_load(self):
+        # Holds the flush lock like a flush, so no batch is written while segments of the index are removed
+        async with self._flush_lock:
+            index = await self._hass.async_add_executor_job(self._read_index)
+            empty_segments: list[tuple[str, int]] = []
+            for workflow_id, (entries, segment_id, segment_size) in index.items():
+                workflow_traces = self._workflows[workflow_id] = WorkflowTraces(segment_id, segment_size)
+                for entry in entries:
+                    workflow_traces.add(entry)
+                empty_segments.extend((workflow_id, segment) for segment in workflow_traces.evict(self._workflow_budget))
+            if empty_segments:
+                await self._hass.async_add_executor_job(self._remove_segments, empty_segments)
+        _LOGGER.debug(f"Loaded trace index for {len(self._workflows)} workflows")
+
+
+    @callback
+    def async_append(self, workflow_id: str, run_id: str, short_dict: dict, body: dict):
+        # The body is encoded right away, so the executor never reads data the loop can still change. The short dict
+        # is a new dict of immutable values for every trace and is kept as is.
+        try:
+            data = encode_trace(body)
+        except (TypeError, ValueError):
+            _LOGGER.exception(f"Trace {run_id} of react.{workflow_id} could not be serialized")
+            return
+
+        self._pending[run_id] = (workflow_id, short_dict, data)
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(self._hass, self._flush_delay, self._async_schedule_flush)
+
+
+    def get_short_traces(self, workflow_id: str) -> list[dict]:
+        result = []
+        if workflow_traces := self._workflows.get(workflow_id):
+            result.extend(entry[ATTR_TRACE_SHORT] for entry in workflow_traces.entries.values())
+        for queued in (self._writing, self._pending):
+            result.extend(short_dict for queued_workflow_id, short_dict, _ in queued.values() if queued_workflow_id == workflow_id)
+        return result
+
+
+    async def async_get_trace(self, workflow_id: str, run_id: str) -> dict | None:
+        if (trace_json := await self.async_get_trace_json(workflow_id, run_id)) is None:
+            return None
+        return json_loads(trace_json)
+
+
+    async def async_get_trace_json(self, workflow_id: str, run_id: str) -> bytes | None:
+        """Return the trace as it was encoded when it was appended, without decoding it."""
+        for queued in (self._pending, self._writing):
+            if (item := queued.get(run_id)) and item[0] == workflow_id:
+                return item[2]
+        if not (workflow_traces := self._workflows.get(workflow_id)):
+            return None
+        if not (entry := workflow_traces.entries.get(run_id)):
+            return None
+        return await self._hass.async_add_executor_job(self._read_trace_json, workflow_id, entry)
+
+
+    async def async_flush(self):
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+
+        async with self._flush_lock:
+            while self._pending:
+                self._writing, self._pending = self._pending, {}
+                segments = { workflow_id: (workflow_traces.segment_id, workflow_traces.segment_size) for workflow_id, workflow_traces in self._workflows.items() }
+                try:
+                    entries, segments = await self._hass.async_add_executor_job(self._write_batch, self._writing, segments)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Writing traces failed")
+                    self._writing = {}
+                    return
+
+                empty_segments: list[tuple[str, int]] = []
+                for workflow_id, entry in entries:
+                    if not (workflow_traces := self._workflows.get(workflow_id)):
+                        workflow_traces = self._workflows[workflow_id] = WorkflowTraces()
+                    workflow_traces.add(entry)
+                for workflow_id, (segment_id, segment_size) in segments.items():
+                    workflow_traces = self._workflows[workflow_id]
+                    workflow_traces.segment_id, workflow_traces.segment_size = segment_id, segment_size
+                    empty_segments.extend((workflow_id, segment) for segment in workflow_traces.evict(self._workflow_budget))
+                self._writing = {}
+
+                if empty_segments:
+                    await self._hass.async_add_executor_job(self._remove_segments, empty_segments)
+
+
+    async def async_shutdown(self):
+        await self.async_flush()
+
+
+    @callback
+    def _async_schedule_flush(self, *args):
+        self._cancel_flush = None
+        self._hass.async_create_task(self.async_flush())
+
+
+    def _segment_path(self, workflow_id: str, segment_id: int, suffix: str = SEGMENT_SUFFIX) -> str:
+        return os.path.join(self._path, workflow_id, f"{segment_id}{suffix}")
+
+
+    def _read_index(self) -> dict[str, tuple[list[dict], int, int]]:
+        """Read the index files of every workflow (runs in the executor)."""
+        result: dict[str, tuple[list[dict], int, int]] = {}
+        if not os.path.isdir(self._path):
+            return result
+
+        for workflow_id in os.listdir(self._path):
+            segment_ids = sorted(
+                int(name[:-len(SEGMENT_INDEX_SUFFIX)])
+                for name in os.listdir(os.path.join(self._path, workflow_id))
+                if name.endswith(SEGMENT_INDEX_SUFFIX) and name[:-len(SEGMENT_INDEX_SUFFIX)].isdigit()
+            )
+            if not segment_ids:
+                continue
+
+            entries: list[dict] = []
+            segment_size = 0
+            for segment_id in segment_ids:
+                try:
+                    segment_size = os.path.getsize(self._segment_path(workflow_id, segment_id))
+                    with open(self._segment_path(workflow_id, segment_id, SEGMENT_INDEX_SUFFIX), "rb") as file:
+                        lines = file.readlines()
+                except OSError:
+                    _LOGGER.exception(f"Trace segment {segment_id} of react.{workflow_id} could not be read")
+                    segment_size = 0
+                    continue
+                for line in lines:
+                    try:
+                        entry = json_loads(line)
+                    except ValueError:
+                        # The last line is cut off when writing it was interrupted
+                        continue
+                    if entry[ATTR_TRACE_OFFSET] + entry[ATTR_TRACE_LENGTH] > segment_size:
+                        continue
+                    entry[ATTR_TRACE_SEGMENT] = segment_id
+                    entries.append(entry)
+            result[workflow_id] = (entries, segment_ids[-1], segment_size)
+        return result
+
+
+    def _write_batch(self, batch: dict[str, tuple[str, dict, bytes]], segments: dict[str, tuple[int, int]]) -> tuple[list[tuple[str, dict]], dict[str, tuple[int, int]]]:
+        """Append the traces to the segments of their workflows and their index (runs in the executor)."""
+        entries: list[tuple[str, dict]] = []
+        files: dict[str, tuple[IO[bytes], IO[bytes]]] = {}
+        try:
+            for run_id, (workflow_id, short_dict, data) in batch.items():
+                data = data + b"\n"
+                segment_id, segment_size = segments.get(workflow_id, (1, 0))
+                if segment_size and segment_size + len(data) > self._segment_size:
+                    for file in files.pop(workflow_id, ()):
+                        file.close()
+                    segment_id, segment_size = segment_id + 1, 0
+
+                if not (workflow_files := files.get(workflow_id)):
+                    os.makedirs(os.path.join(self._path, workflow_id), exist_ok=True)
+                    workflow_files = files[workflow_id] = (
+                        open(self._segment_path(workflow_id, segment_id), "ab"),
+                        open(self._segment_path(workflow_id, segment_id, SEGMENT_INDEX_SUFFIX), "ab"),
+                    )
+                segment_file, index_file = workflow_files
+
+                offset = segment_file.tell()
+                segment_file.write(data)
+                segments[workflow_id] = (segment_id, offset + len(data))
+                entry = {
+                    ATTR_TRACE_RUN_ID: run_id,
+                    ATTR_TRACE_OFFSET: offset,
+                    ATTR_TRACE_LENGTH: len(data),
+                    ATTR_TRACE_SHORT: short_dict,
+                }
+                # The body is flushed first, so an index line never points at a body that isn't there
+                segment_file.flush()
+                index_file.write(json_bytes(entry) + b"\n")
+                entries.append((workflow_id, {**entry, ATTR_TRACE_SEGMENT: segment_id}))
+        finally:
+            for workflow_files in files.values():
+                for file in workflow_files:
+                    file.close()
+        return entries, segments
+
+
+    def _read_trace_json(self, workflow_id: str, entry: dict) -> bytes | None:
+        """Read a single trace body from its segment (runs in the executor)."""
+        try:
+            with open(self._segment_path(workflow_id, entry[ATTR_TRACE_SEGMENT]), "rb") as file:
+                file.seek(entry[ATTR_TRACE_OFFSET])
+                return file.read(entry[ATTR_TRACE_LENGTH]).rstrip(b"\n")
+        except OSError:
+            _LOGGER.exception(f"Trace {entry[ATTR_TRACE_RUN_ID]} of react.{workflow_id} could not be read")
+            return None
+
+
+    def _remove_segments(self, segments: list[tuple[str, int]]):
+        for workflow_id, segment_id in segments:
+            for suffix in (SEGMENT_INDEX_SUFFIX, SEGMENT_SUFFIX):
+                try:
+                    os.remove(self._segment_path(workflow_id, segment_id, suffix))
+                except FileNotFoundError:
+                    pass
+
+
+def encode_trace(trace: dict) -> bytes:
+    try:
+        return json_bytes(trace)
+    except (TypeError, ValueError):
+        # Traces can hold values only the extended encoder knows how to handle
+        return json.dumps(trace, cls=ExtendedJSONEncoder, allow_nan=False).encode()
@@ -82,11 +82,15 @@ class StateChangeFilter(EventFilter):
         old_state: str = None, 
         new_state: str = None, 
         match_data: dict = None, 
-        *args
+        *args,
+        entity_id: str = None,
+        domain: str = None,
     ) -> None:
         super().__init__(event_type, filter_key, track_key, match_data, *args)
         self.old_state = old_state
         self.new_state = new_state
+        self.entity_id = entity_id
+        self.domain = domain
 
 
     def applies(self, ha_event: HaEvent) -> bool:
@@ -103,8 +107,8 @@ class StateChangeFilter(EventFilter):
 
 
 class StateChangeFilterStrategy(EventFilterStrategy):
-    def get_state_change_filter(self, filter_key: str, track_key: str = None, old_state: str = None, new_state: str = None, *args):
-        return StateChangeFilter(EVENT_STATE_CHANGED, filter_key, track_key=track_key, old_state=old_state, new_state=new_state, *args)
+    def get_state_change_filter(self, filter_key: str, track_key: str = None, old_state: str = None, new_state: str = None, *args, entity_id: str = None, domain: str = None):
+        return StateChangeFilter(EVENT_STATE_CHANGED, filter_key, track_key=track_key, old_state=old_state, new_state=new_state, *args, entity_id=entity_id, domain=domain)
     
 
 class DomainStateChangeFilterStrategy(StateChangeFilterStrategy):
@@ -127,7 +131,7 @@ class DomainStateChangeFilterStrategy(StateChangeFilterStrategy):
     
 
     def get_filter(self, domain: str, track_key: str = None, *args) -> EventFilter:
-        return self.get_state_change_filter(self._get_filter_key(domain), track_key=track_key, *args)
+        return self.get_state_change_filter(self._get_filter_key(domain), track_key=track_key, *args, domain=domain)
 
 
 class EntityIdStateChangeFilterStrategy(StateChangeFilterStrategy):
@@ -140,7 +144,7 @@ class EntityIdStateChangeFilterStrategy(StateChangeFilterStrategy):
     
 
     def get_filter(self, entity_id, track_key: str = None, old_state: str = None, new_state: str = None, *args) -> EventFilter:
-        return self.get_state_change_filter(self._get_filter_key(entity_id), track_key=track_key, old_state=old_state, new_state=new_state, *args)
+        return self.get_state_change_filter(self._get_filter_key(entity_id), track_key=track_key, old_state=old_state, new_state=new_state, *args, entity_id=entity_id)
 
 
 DOMAIN_STATE_CHANGE_FILTER_STRATEGY = DomainStateChangeFilterStrategy()
@@ -9,6 +9,7 @@ from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable
 
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
     EVENT_STATE_CHANGED,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -25,8 +26,8 @@ from custom_components.react.tasks.base import ReactTask, ReactTaskType
 from custom_components.react.tasks.filters import (
     ALL_EVENTTYPE_FILTER_STRATEGIES,
     ALL_REACTION_FILTER_STRATEGIES, 
-    ALL_STATE_CHANGE_FILTER_STRATEGIES,
     EventFilter,
+    StateChangeFilter,
 )
 from custom_components.react.utils.logger import get_react_logger
 from custom_components.react.utils.time import TimeData
@@ -40,10 +41,6 @@ TRACK_EVENT_LISTENERS = "react_track_event_listeners"
 TRACK_REACTION_CALLBACKS = "react_track_reaction_callbacks"
 TRACK_REACTION_LISTENER = "react_track_reaction_listener"
 
-TRACK_STATE_CHANGE_CALLBACKS = "react_track_state_change_callbacks"
-TRACK_STATE_CHANGE_FILTERS = "react_track_state_change_filters"
-TRACK_STATE_CHANGE_LISTENER = "react_track_state_change_listener"
-
 TRACK_TIME_CALLBACKS = "react_track_time_callbacks"
 TRACK_TIME_LISTENERS = "react_track_time_listeners"
 
@@ -60,6 +57,15 @@ class ReactTaskManager:
         self._tasks: dict[str, ReactTask] = {}
         self._unloaders: dict[str, dict[str, TaskUnloader]] = {}
 
+        # State change jobs per entity_id and per domain, compiled into tuples on track/untrack so dispatching never copies
+        self._state_change_entity_jobs: dict[str, list[tuple[HassJob[[HaEvent], Any], StateChangeFilter]]] = {}
+        self._state_change_domain_jobs: dict[str, list[tuple[HassJob[[HaEvent], Any], StateChangeFilter]]] = {}
+        self._state_change_entity_dispatch: dict[str, tuple[tuple[HassJob[[HaEvent], Any], StateChangeFilter], ...]] = {}
+        self._state_change_domain_dispatch: dict[str, tuple[tuple[HassJob[[HaEvent], Any], StateChangeFilter], ...]] = {}
+        self._state_change_listener: CALLBACK_TYPE | None = None
+        # Reference counts per task and track key, the underlying state change tracking only changes on 0 <-> 1
+        self._state_change_refs: dict[str, dict[str, int]] = {}
+
 
     @property
     def tasks(self) -> list[ReactTask]:
@@ -133,6 +139,7 @@ class ReactTaskManager:
 
 
     def unload_task(self, task: ReactTask):
+        self._state_change_refs.pop(task.id, None)
         unloaders = self._unloaders.pop(task.id, {})
         for unloader in unloaders.values():
             unloader.unload()
@@ -247,45 +254,87 @@ class ReactTaskManager:
         self.wrap_unloader(remove_listener, task.id, filter.track_key)
 
 
-    def track_state_change(self, filter: EventFilter, task: ReactTask):
-        state_change_callbacks: dict[str, list[tuple[HassJob[[HaEvent], Any], EventFilter]]] = self.react.hass.data.setdefault(
-            TRACK_STATE_CHANGE_CALLBACKS, {}
-        )
-
-        if TRACK_STATE_CHANGE_LISTENER not in self.react.hass.data:
-            @callback
-            def _async_state_change_dispatcher(ha_event: HaEvent) -> None:
-                for key in [ strategy.get_event_key(ha_event) for strategy in ALL_STATE_CHANGE_FILTER_STRATEGIES ]:
-                    if key in state_change_callbacks:
-                        for job,filter in state_change_callbacks[key][:]:
-                            if filter.applies(ha_event):
-                                try:
-                                    self.react.hass.async_run_hass_job(job, ha_event)
-                                except Exception:  # pylint: disable=broad-except
-                                    _LOGGER.exception(f"Error while processing state change for {key}")
-
-            self.react.hass.data[TRACK_STATE_CHANGE_LISTENER] = self.react.hass.bus.async_listen(
+    def track_state_change(self, filter: StateChangeFilter, task: ReactTask):
+        if not self._state_change_listener:
+            self._state_change_listener = self.react.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                _async_state_change_dispatcher,
+                self._async_state_change_dispatcher,
+                event_filter=self._async_state_change_filter,
             )
 
         job = HassJob(task.execute_task, f"track state change {filter.filter_key}")
+        if filter.entity_id is not None:
+            jobs_by_key, compiled_jobs, key = self._state_change_entity_jobs, self._state_change_entity_dispatch, filter.entity_id
+        else:
+            jobs_by_key, compiled_jobs, key = self._state_change_domain_jobs, self._state_change_domain_dispatch, filter.domain
 
-        state_change_callbacks.setdefault(filter.filter_key, []).append((job, filter))
+        jobs = jobs_by_key.setdefault(key, [])
+        jobs.append((job, filter))
+        compiled_jobs[key] = tuple(jobs)
         
         @callback
         def remove_listener() -> None:
-            state_change_callbacks[filter.filter_key].remove((job, filter))
-            if len(state_change_callbacks[filter.filter_key]) == 0:
-                del state_change_callbacks[filter.filter_key]
+            jobs.remove((job, filter))
+            if jobs:
+                compiled_jobs[key] = tuple(jobs)
+            else:
+                del jobs_by_key[key]
+                del compiled_jobs[key]
 
-            if not state_change_callbacks:
-                self.react.hass.data[TRACK_STATE_CHANGE_LISTENER]()
-                del self.react.hass.data[TRACK_STATE_CHANGE_LISTENER]
+            if not self._state_change_entity_dispatch and not self._state_change_domain_dispatch and self._state_change_listener:
+                self._state_change_listener()
+                self._state_change_listener = None
 
         self.wrap_unloader(remove_listener, task.id, filter.track_key)
 
 
+    def acquire_state_change(self, task: ReactTask, track_key: str, create_filter: Callable[[], StateChangeFilter]):
+        refs = self._state_change_refs.setdefault(task.id, {})
+        count = refs.get(track_key, 0)
+        refs[track_key] = count + 1
+        if count == 0:
+            self.track_state_change(create_filter(), task)
+
+
+    def release_state_change(self, task: ReactTask, track_key: str):
+        refs = self._state_change_refs.get(task.id)
+        if not refs or not (count := refs.get(track_key, 0)):
+            return
+        if count > 1:
+            refs[track_key] = count - 1
+            return
+        del refs[track_key]
+        if not refs:
+            del self._state_change_refs[task.id]
+        self.untrack_key(task, track_key)
+
+
+    @callback
+    def _async_state_change_filter(self, event_data: dict) -> bool:
+        entity_id = event_data.get(ATTR_ENTITY_ID)
+        if not isinstance(entity_id, str):
+            return False
+        return (
+            entity_id in self._state_change_entity_dispatch or
+            entity_id.partition(".")[0] in self._state_change_domain_dispatch
+        )
+
+
+    @callback
+    def _async_state_change_dispatcher(self, ha_event: HaEvent) -> None:
+        entity_id: str = ha_event.data[ATTR_ENTITY_ID]
+        for jobs in (
+            self._state_change_domain_dispatch.get(entity_id.partition(".")[0], ()),
+            self._state_change_entity_dispatch.get(entity_id, ()),
+        ):
+            for job, filter in jobs:
+                if filter.applies(ha_event):
+                    try:
+                        self.react.hass.async_run_hass_job(job, ha_event)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(f"Error while processing state change for {filter.filter_key}")
+
+
     def track_sun(self,
         sun_event: str,
         track_key: str,
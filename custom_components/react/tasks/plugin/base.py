@@ -1,7 +1,7 @@
 from __future__ import annotations
 from logging import Logger
 
-from typing import TYPE_CHECKING, Dict, Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from homeassistant.const import (
     STATE_OFF,
@@ -79,21 +79,20 @@ class EventBlock(Generic[T_config], BlockBase[T_config]):
         super().__init__(react)
         
         self.e_type = e_type
-        self.react_events: Dict[str, ReactEvent] = {}
-        self.block_filter = self.async_filter
     
 
     @callback
-    def async_filter(self, ha_event: HaEvent) -> bool:
+    def async_filter(self, ha_event: HaEvent) -> ReactEvent | None:
         react_event = self.e_type(ha_event)
         if react_event.applies:
-            self.set_action_event(ha_event, react_event)
-            return True
-        return False
+            return react_event
+        return None
 
 
     async def async_execute(self, ha_event: HaEvent) -> None:
-        react_event = self.get_react_event(ha_event)
+        # Parse and filter in the same scope as the execution so the parsed event is never stored on the block
+        if not (react_event := self.async_filter(ha_event)):
+            return
         self.react.session_manager.load_session(react_event)
         await self.async_handle_event(react_event)
     
@@ -102,14 +101,6 @@ class EventBlock(Generic[T_config], BlockBase[T_config]):
         raise NotImplementedError()
 
 
-    def set_action_event(self, ha_event: HaEvent, react_event: ReactEvent):
-        self.react_events[id(ha_event)] = react_event
-
-
-    def get_react_event(self, ha_event: HaEvent) -> ReactEvent:
-        return self.react_events.get(id(ha_event))
-
-
 class InputBlock(Generic[T_config], EventBlock[T_config]):
     def __init__(self, react: ReactBase, e_type: type[ReactEvent]):
         super().__init__(react, e_type)
@@ -119,7 +110,7 @@ class InputBlock(Generic[T_config], EventBlock[T_config]):
         action_event_payloads = self.create_action_event_payloads(react_event)
         session_payload = {ATTR_SESSION_ID: react_event.session.id}
         for action_event_payload in action_event_payloads:
-            react_event.session.debug(self.logger, f"Sending action event: {format_data(**action_event_payload)}")
+            react_event.session.debug(self.logger, lambda: f"Sending action event: {format_data(**action_event_payload)}")
             self.react.hass.bus.async_fire(EVENT_REACT_ACTION, action_event_payload | session_payload)
 
 
@@ -132,7 +123,7 @@ class StateChangeInputBlock(Generic[T_config], InputBlock[T_config]):
         super().__init__(react, StateChangedEvent)
 
         self.type = type
-        self.entity_track_keys: list[str] = []
+        self._actor_track_keys: dict[int, tuple[str, ...]] = {}
 
 
     def load(self):
@@ -159,7 +150,7 @@ class StateChangeInputBlock(Generic[T_config], InputBlock[T_config]):
         if state_data:
             react_events = state_data.to_react_events(self.type)
             if react_events:
-                source_event.session.debug(self.logger, f"State change caught: {source_event.payload.entity_id} ({source_event.payload.old_state.state if source_event.payload.old_state else None} -> {source_event.payload.new_state.state if source_event.payload.new_state else None})")
+                source_event.session.debug(self.logger, lambda: f"State change caught: {source_event.payload.entity_id} ({source_event.payload.old_state.state if source_event.payload.old_state else None} -> {source_event.payload.new_state.state if source_event.payload.new_state else None})")
         return react_events
 
 
@@ -174,15 +165,24 @@ class StateChangeInputBlock(Generic[T_config], InputBlock[T_config]):
 
 
     def update_tracker(self, track: bool, actor: ActorRuntime):
-        if not self.type or self.type in actor.type:
+        entity_track_keys: list[str] = []
+        if track and (not self.type or self.type in actor.type):
             for entity in actor.entity:
                 entity_track_key = track_key(self.__class__.__name__, self.type, entity)
-                if track and entity_track_key not in self.entity_track_keys:
-                    self.manager.track_state_change(ENTITY_ID_STATE_CHANGE_FILTER_STRATEGY.get_filter(f"{self.type}.{entity}",track_key=entity_track_key), self)
-                    self.entity_track_keys.append(entity_track_key)
-                if not track and entity_track_key in self.entity_track_keys:
-                    self.manager.untrack_key(self, entity_track_key)
-                    self.entity_track_keys.remove(entity_track_key)
+                if entity_track_key in entity_track_keys:
+                    continue
+                self.manager.acquire_state_change(
+                    self, 
+                    entity_track_key, 
+                    lambda entity=entity, entity_track_key=entity_track_key: ENTITY_ID_STATE_CHANGE_FILTER_STRATEGY.get_filter(f"{self.type}.{entity}", track_key=entity_track_key),
+                )
+                entity_track_keys.append(entity_track_key)
+
+        # Release what the actor held before only after acquiring the new keys, so shared entities stay tracked
+        for entity_track_key in self._actor_track_keys.pop(id(actor), ()):
+            self.manager.release_state_change(self, entity_track_key)
+        if entity_track_keys:
+            self._actor_track_keys[id(actor)] = tuple(entity_track_keys)
 
 
 class OutputBlock(Generic[T_config], EventBlock[T_config]):
@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-from homeassistant.components.trace.util import async_restore_traces
-from homeassistant.components.trace.const import DATA_TRACE_STORE
-
 from custom_components.react.base import ReactBase
 from custom_components.react.tasks.base import ReactTask, ReactTaskType
 
@@ -23,6 +20,5 @@ class Task(ReactTask):
 
 
     async def async_execute(self) -> None:
-        self.task_logger.debug("Restoring trace data")
-        if DATA_TRACE_STORE in self.react.hass.data:
-            await async_restore_traces(self.react.hass)
+        self.task_logger.debug("Restoring trace index")
+        await self.react.runtime.trace_store.async_load()
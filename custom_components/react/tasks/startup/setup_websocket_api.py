@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -8,11 +7,17 @@ from homeassistant.components.trace.util import async_get_trace, async_list_trac
 from homeassistant.components.websocket_api import async_register_command
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.json import ExtendedJSONEncoder
 
 from custom_components.react.base import ReactBase
-from custom_components.react.const import DOMAIN
+from custom_components.react.const import (
+    ATTR_CHANGES,
+    ATTR_REVISION,
+    DOMAIN,
+)
+from custom_components.react.runtime.publisher import RegistryUpdatePublisher
+from custom_components.react.runtime.trace_store import encode_trace
 from custom_components.react.tasks.base import ReactTask, ReactTaskType
+from custom_components.react.utils.trace import get_trace_sampler
 
 
 async def async_setup_task(react: ReactBase) -> Task:
@@ -34,14 +39,21 @@ class Task(ReactTask):
         self.task_logger.debug("Setting up websocket commands")
         async_register_command(self.react.hass, react_get_traces)
         async_register_command(self.react.hass, react_get_trace)
+        async_register_command(self.react.hass, react_get_trace_sampler)
         async_register_command(self.react.hass, websocket_list_runs)
         async_register_command(self.react.hass, websocket_list_reactions)
+        async_register_command(self.react.hass, websocket_subscribe_runs)
+        async_register_command(self.react.hass, websocket_subscribe_reactions)
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "react/trace/list",
         vol.Required("workflow_id"): cv.string,
+        vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Exclusive("before", "cursor"): cv.string,
+        vol.Exclusive("after", "cursor"): cv.string,
+        vol.Optional("fields"): vol.All(cv.ensure_list, [cv.string]),
     }
 )
 @websocket_api.require_admin
@@ -54,8 +66,32 @@ async def react_get_traces(hass: HomeAssistant, connection: websocket_api.Active
     key = f"{DOMAIN}.{msg['workflow_id']}" if "workflow_id" in msg else None
 
     traces = await async_list_traces(hass, DOMAIN, key)
+    # Traces that are no longer in memory are listed from the trace store
+    run_ids = { trace["run_id"] for trace in traces }
+    stored_traces = [ trace for trace in react.runtime.trace_store.get_short_traces(workflow_id) if trace["run_id"] not in run_ids ]
+
+    connection.send_result(msg["id"], _paginate_traces(stored_traces + traces, msg))
+
+
+def _paginate_traces(traces: list[dict], msg: dict) -> list[dict]:
+    """Select a page of traces (oldest first) relative to the 'before' or 'after' run_id and project the requested fields."""
+    limit = msg.get("limit")
+    if (cursor := msg.get("before") or msg.get("after")) is not None:
+        index = next((i for i, trace in enumerate(traces) if trace["run_id"] == cursor), None)
+        if index is None:
+            traces = []
+        elif "before" in msg:
+            traces = traces[:index]
+        else:
+            traces = traces[index + 1:]
+
+    if limit is not None:
+        traces = traces[:limit] if "after" in msg else traces[-limit:]
 
-    connection.send_result(msg["id"], traces)
+    if fields := msg.get("fields"):
+        fields = {"run_id", *fields}
+        traces = [ { key: value for key, value in trace.items() if key in fields } for trace in traces ]
+    return traces
 
 
 @websocket_api.require_admin
@@ -68,22 +104,43 @@ async def react_get_traces(hass: HomeAssistant, connection: websocket_api.Active
 )
 @websocket_api.async_response
 async def react_get_trace(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict):
+    react: ReactBase = hass.data.get(DOMAIN)
     key = f"{DOMAIN}.{msg['workflow_id']}"
     run_id = msg["run_id"]
 
     try:
         requested_trace = await async_get_trace(hass, key, run_id)
     except KeyError:
-        connection.send_error(
-            msg["id"], websocket_api.ERR_NOT_FOUND, "The trace could not be found"
-        )
+        # Stored traces are already serialized, so they can be sent without decoding them first
+        if (trace_json := await react.runtime.trace_store.async_get_trace_json(msg["workflow_id"], run_id)) is None:
+            connection.send_error(
+                msg["id"], websocket_api.ERR_NOT_FOUND, "The trace could not be found"
+            )
+            return
+        connection.send_message(websocket_api.messages.construct_result_message(msg["id"], trace_json))
         return
 
-    message = websocket_api.messages.result_message(msg["id"], requested_trace)
+    # The trace is still live and may change while it is encoded, so it is encoded in the event loop
+    connection.send_message(encode_trace(websocket_api.messages.result_message(msg["id"], requested_trace)))
 
-    connection.send_message(
-        json.dumps(message, cls=ExtendedJSONEncoder, allow_nan=False)
-    )
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "react/trace/sampler",
+        vol.Required("workflow_id"): cv.string,
+    }
+)
+@websocket_api.require_admin
+@callback
+def react_get_trace_sampler(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict):
+    """Return the trace settings of a workflow with the number of runs that were traced and skipped."""
+    react: ReactBase = hass.data.get(DOMAIN)
+    if not (workflow_runtime := react.runtime.get_workflow_runtime(msg["workflow_id"])):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "The workflow could not be found"
+        )
+        return
+    connection.send_result(msg["id"], get_trace_sampler(hass, workflow_runtime.workflow_config).as_dict())
 
 
 @websocket_api.websocket_command({vol.Required("type"): "react/run/list"})
@@ -104,3 +161,55 @@ def websocket_list_reactions(hass: HomeAssistant, connection: websocket_api.Acti
         msg["id"],
         react.runtime.reaction_registry.get_all_reactions()
     )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "react/run/subscribe",
+        vol.Optional("revision"): vol.Coerce(int),
+    }
+)
+@callback
+def websocket_subscribe_runs(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict):
+    react: ReactBase = hass.data.get(DOMAIN)
+    registry = react.runtime.run_registry
+    _async_subscribe_registry(connection, msg, registry.publisher, registry.get_all_runs)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "react/reaction/subscribe",
+        vol.Optional("revision"): vol.Coerce(int),
+    }
+)
+@callback
+def websocket_subscribe_reactions(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict):
+    react: ReactBase = hass.data.get(DOMAIN)
+    registry = react.runtime.reaction_registry
+    _async_subscribe_registry(connection, msg, registry.publisher, registry.get_all_reactions)
+
+
+@callback
+def _async_subscribe_registry(
+    connection: websocket_api.ActiveConnection, 
+    msg: dict, 
+    publisher: RegistryUpdatePublisher, 
+    get_items: callable,
+):
+    """Send a snapshot (or the changes a resuming client missed) followed by every change after it."""
+    revision = publisher.revision
+
+    @callback
+    def async_send_changes(changes: list[dict]):
+        # Changes that were still pending when the snapshot was taken are already part of it
+        changes = [ change for change in changes if change[ATTR_REVISION] > revision ]
+        if changes:
+            connection.send_message(websocket_api.event_message(msg["id"], {ATTR_REVISION: changes[-1][ATTR_REVISION], ATTR_CHANGES: changes}))
+
+    connection.subscriptions[msg["id"]] = publisher.async_subscribe(async_send_changes)
+    connection.send_result(msg["id"])
+
+    if "revision" in msg and (missed_changes := publisher.get_changes_since(msg["revision"])) is not None:
+        connection.send_message(websocket_api.event_message(msg["id"], {ATTR_REVISION: revision, ATTR_CHANGES: missed_changes}))
+    else:
+        connection.send_message(websocket_api.event_message(msg["id"], {ATTR_REVISION: revision, "snapshot": get_items()}))
@@ -14,7 +14,7 @@ from custom_components.react.const import (
 )
 
 if TYPE_CHECKING:
-    from .track import ObjectTracker
+    from .track import ObjectTracker, TemplateTrackerGroup
 
 
 class TemplateContextDataProvider(Updatable):
@@ -63,6 +63,7 @@ class TemplateContext(Updatable):
         super().__init__(hass)
         
         self.template_context_data_provider = template_context_data_provider
+        self.tracker_group: TemplateTrackerGroup | None = None
         if template_context_data_provider:
             template_context_data_provider.on_update(self.async_update)
 
@@ -77,4 +78,6 @@ class TemplateContext(Updatable):
     def destroy(self) -> None:
         super().destroy()
         if self.template_context_data_provider:
-            self.template_context_data_provider.destroy()
\ No newline at end of file
+            self.template_context_data_provider.destroy()
+        if self.tracker_group:
+            self.tracker_group.destroy()
\ No newline at end of file
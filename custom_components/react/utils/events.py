@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Generic, Mapping, Type, TypeVar
 
 
 from homeassistant.const import (
@@ -24,7 +24,7 @@ from custom_components.react.const import (
     ATTR_TYPE,
 )
 from custom_components.react.utils.session import Session
-from custom_components.react.utils.struct import DynamicData
+from custom_components.react.utils.struct import DynamicData, DynamicRecord
 
 T_payload = TypeVar('T_payload', bound=DynamicData)
 T_data = TypeVar('T_data', bound=DynamicData)
@@ -56,7 +56,9 @@ class ReactEvent(Generic[T_payload]):
         self._session = session
 
 
-class ReactEventPayload(DynamicData, Generic[T_data]):
+class ReactEventPayload(DynamicRecord, Generic[T_data]):
+
+    __slots__ = ("entity", "type", "action", "data", "session_id")
 
     def __init__(self, t_dd_type: Type[T_data] = DynamicData) -> None:
         super().__init__()
@@ -84,6 +86,9 @@ class ReactEventPayload(DynamicData, Generic[T_data]):
 
 
 class ActionEventPayload(ReactEventPayload[T_data], Generic[T_data]):
+
+    __slots__ = ()
+
     def __init__(self, t_dd_type: Type[T_data] = DynamicData) -> None:
         super().__init__(t_dd_type)
 
@@ -102,6 +107,9 @@ class ActionEvent(ReactEvent[ActionEventPayload[T_data]], Generic[T_data]):
 
 
 class ReactionEventPayload(ReactEventPayload[T_data], Generic[T_data]):
+
+    __slots__ = ("reactor_id",)
+
     def __init__(self, t_dd_type: Type[T_data] = DynamicData) -> None:
         super().__init__(t_dd_type)
         self.reactor_id: str = None
@@ -115,26 +123,72 @@ class ReactionEvent(ReactEvent[ReactionEventPayload[T_data]], Generic[T_data]):
 ########## StateChanged event ##########
 
 
-class StateChangedEventPayloadState(DynamicData):
-    def __init__(self, source: State = None) -> None:
-        super().__init__()
+STATE_PAYLOAD_KEYS = (ATTR_ENTITY_ID, ATTR_STATE, ATTR_DOMAIN, ATTR_OBJECT_ID, ATTR_LAST_CHANGED, ATTR_ATTRIBUTES)
 
-        self.entity_id: str = None
-        self.state: str = None
-        self.domain: str = None
-        self.object_id: str = None
-        self.last_changed: datetime = None
-        self.attributes: dict[str, Any] = None
-
-        self.set(ATTR_ENTITY_ID, source.entity_id)
-        self.set(ATTR_STATE, source.state)
-        self.set(ATTR_DOMAIN, source.domain)
-        self.set(ATTR_OBJECT_ID, source.object_id)
-        self.set(ATTR_LAST_CHANGED, source.last_changed)
-        self.set(ATTR_ATTRIBUTES, source.attributes)
 
-    
-class StateChangedEventPayload(DynamicData):
+class StateChangedEventPayloadState():
+    """Read-only view of a State that reads its fields from the state when they are accessed.
+
+    as_dict returns the dict that the State caches itself, so it has the keys of State.as_dict.
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: State) -> None:
+        self.source = source
+
+
+    @property
+    def entity_id(self) -> str:
+        return self.source.entity_id
+
+
+    @property
+    def state(self) -> str:
+        return self.source.state
+
+
+    @property
+    def domain(self) -> str:
+        return self.source.domain
+
+
+    @property
+    def object_id(self) -> str:
+        return self.source.object_id
+
+
+    @property
+    def last_changed(self) -> datetime:
+        return self.source.last_changed
+
+
+    @property
+    def attributes(self) -> Mapping[str, Any]:
+        return self.source.attributes
+
+
+    def __contains__(self, key):
+        return key in STATE_PAYLOAD_KEYS
+
+
+    def keys(self):
+        return STATE_PAYLOAD_KEYS
+
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in STATE_PAYLOAD_KEYS:
+            return getattr(self.source, key)
+        return default
+
+
+    def as_dict(self, skip_none: bool = False) -> Mapping[str, Any]:
+        return self.source.as_dict()
+
+
+class StateChangedEventPayload(DynamicRecord):
+
+    __slots__ = ("entity_id", "old_state", "new_state")
 
     def __init__(self) -> None:
         super().__init__()
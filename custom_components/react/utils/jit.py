@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Generic, Type, TypeVar, Union
+from functools import partial
+from typing import Any, Generic, Iterable, Type, TypeVar, Union
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
@@ -18,7 +19,7 @@ from custom_components.react.const import (
 )
 from custom_components.react.utils.context import TemplateContext, TemplateContextDataProvider
 from custom_components.react.utils.logger import get_react_logger
-from custom_components.react.utils.struct import DynamicData, MultiItem
+from custom_components.react.utils.struct import DynamicData, MultiItem, freeze_list
 
 _JITTER_PROPERTY = "{}_jitter"
 
@@ -27,6 +28,27 @@ T = TypeVar('T', bound=DynamicData)
 _LOGGER = get_react_logger()
 
 
+class JitterRenderContext:
+    """Template variables for a single render.
+
+    The variables are only built when the first templated property is rendered and then shared by every other
+    templated property with the same template context.
+    """
+
+    __slots__ = ("template_context_data_provider", "_variables")
+
+    def __init__(self, template_context_data_provider: TemplateContextDataProvider = None) -> None:
+        self.template_context_data_provider = template_context_data_provider
+        self._variables: dict[int, dict] = {}
+
+
+    def get_variables(self, tctx: TemplateContext) -> dict:
+        if (variables := self._variables.get(id(tctx))) is None:
+            variables = self._variables[id(tctx)] = {}
+            tctx.build(variables, self.template_context_data_provider)
+        return variables
+
+
 class BaseJitter:
 
     def __init__(self, type_converter: Any = None) -> None:
@@ -38,7 +60,17 @@ class BaseJitter:
         raise NotImplementedError
 
 
+    @property
+    def is_static(self) -> bool:
+        """Whether rendering always results in the same value (no templates in this jitter or below it)."""
+        return False
+
+
     def render(self, template_context_data_provider: TemplateContextDataProvider) -> Any:
+        return self.render_with(JitterRenderContext(template_context_data_provider))
+
+
+    def render_with(self, render_context: JitterRenderContext) -> Any:
         raise NotImplementedError()
 
 
@@ -52,9 +84,12 @@ class CompositeJitter(BaseJitter, Generic[T]):
         self.t_type = t_type
 
         self.jit_attrs = []
+        self._render_plan: Union[list[tuple[str, Any, Union[BaseJitter, None]]], None] = None
+        self._static_result: Union[T, None] = None
 
         for attr in config_source.keys():
             self.add_jitter(attr, PROP_TYPE_SOURCE)
+        self.compile_render_plan()
         
 
     def add_jitter(self, attr: str, type_converter: Any, default: Any = None):
@@ -79,6 +114,8 @@ class CompositeJitter(BaseJitter, Generic[T]):
             self.set_jitter(attr, ValuePropertyJitter(default, PROP_TYPE_DEFAULT, type_converter))
             
         self.jit_attrs.append(attr)
+        self._render_plan = None
+        self._static_result = None
     
     
     def set_jitter(self, attr: str, value: BaseJitter):
@@ -91,20 +128,89 @@ class CompositeJitter(BaseJitter, Generic[T]):
         return getattr(self, jitter_prop, None)
  
 
-    def render(self, template_context_data_provider: TemplateContextDataProvider):
-        result = self.t_type()
+    @property
+    def is_static(self) -> bool:
+        return all(self.get_jitter(attr).is_static for attr in self.jit_attrs)
 
+
+    def compile(self) -> list[tuple[str, Any, Union[BaseJitter, None]]]:
+        """Create the render plan: static attributes are rendered once up front and their values (including whole
+        static subtrees) are reused by every render, only jitters with templates are rendered each time."""
+        plan = []
         for attr in self.jit_attrs:
             jitter = self.get_jitter(attr)
-            value = jitter.render(template_context_data_provider)
-            if value != None: 
+            if jitter.is_static:
+                value = jitter.render_with(JitterRenderContext())
+                # The value ends up in every render, so it is frozen to keep one run from changing it for the others
+                if isinstance(value, DynamicData):
+                    value.freeze()
+                elif isinstance(value, list):
+                    value = freeze_list(value)
+                if value != None:
+                    plan.append((attr, value, None))
+            else:
+                plan.append((attr, None, jitter))
+        return plan
+
+
+    def compile_render_plan(self):
+        self._render_plan = self.compile()
+        # Without any templates every render results in the same value, so all runs share one frozen result
+        if all(jitter is None for _, _, jitter in self._render_plan):
+            self._static_result = self._render_from_plan(None).freeze()
+
+
+    def render_with(self, render_context: JitterRenderContext):
+        if self._render_plan is None:
+            self.compile_render_plan()
+        if self._static_result is not None:
+            return self._static_result
+        return self._render_from_plan(render_context)
+
+
+    def render_deferred(self, render_context: JitterRenderContext, eager_attrs: Iterable[str] = ()):
+        """Render the eager attributes now and defer the other templated attributes until they are first accessed.
+
+        The template variables are captured now, so deferred attributes render against the same context.
+        """
+        if self._render_plan is None:
+            self.compile_render_plan()
+        if self._static_result is not None:
+            return self._static_result
+
+        render_context.get_variables(self.tctx)
+        result = self.t_type()
+        for attr, value, jitter in self._render_plan:
+            if jitter is None:
                 result.set(attr, value)
-                result.set_type(attr, jitter.prop_type)
-                if hasattr(jitter, "template"):
-                    result.set_template(attr, jitter.template.template)
+                result.set_type(attr, self.get_jitter(attr).prop_type)
+            elif attr in eager_attrs:
+                self._render_attr(result, attr, jitter, render_context)
+            else:
+                result.defer(attr, partial(self._render_attr, attr=attr, jitter=jitter, render_context=render_context))
         return result
 
 
+    def _render_from_plan(self, render_context: Union[JitterRenderContext, None]):
+        result = self.t_type()
+        for attr, value, jitter in self._render_plan:
+            if jitter is None:
+                result.set(attr, value)
+                result.set_type(attr, self.get_jitter(attr).prop_type)
+            else:
+                self._render_attr(result, attr, jitter, render_context)
+        return result
+
+
+    def _render_attr(self, result: DynamicData, attr: str, jitter: BaseJitter, render_context: JitterRenderContext):
+        value = jitter.render_with(render_context)
+        if value != None: 
+            result.set(attr, value)
+            result.set_type(attr, jitter.prop_type)
+            if isinstance(jitter, TemplatePropertyJitter):
+                result.set_template(attr, jitter.template.template)
+
+
 class MultiItemJitter(CompositeJitter):
 
     def __init__(self, hass: HomeAssistant, config_source: DynamicData, tctx: TemplateContext) -> None:
@@ -145,11 +251,13 @@ class ListJitter(BaseJitter):
         return PROP_TYPE_LIST
 
 
-    def render(self, template_context_data_provider: TemplateContextDataProvider) -> Any:
-        result = []
-        for jitter in self.jitters:
-            result.append(jitter.render(template_context_data_provider))
-        return result
+    @property
+    def is_static(self) -> bool:
+        return all(jitter.is_static for jitter in self.jitters)
+
+
+    def render_with(self, render_context: JitterRenderContext) -> Any:
+        return [ jitter.render_with(render_context) for jitter in self.jitters ]
 
 
 class ValuePropertyJitter(BaseJitter):
@@ -166,7 +274,12 @@ class ValuePropertyJitter(BaseJitter):
         return self._prop_type
 
     
-    def render(self, template_context_data_provider: TemplateContextDataProvider) -> Any:
+    @property
+    def is_static(self) -> bool:
+        return True
+
+
+    def render_with(self, render_context: JitterRenderContext) -> Any:
         if self.value == None: 
             return None
         return self.type_converter(self.value) if self.type_converter else self.value
@@ -190,12 +303,10 @@ class TemplatePropertyJitter(BaseJitter):
         return PROP_TYPE_TEMPLATE
 
 
-    def render(self, template_context_data_provider: TemplateContextDataProvider) -> Any:
+    def render_with(self, render_context: JitterRenderContext) -> Any:
         value = None
         try:
-            runtime_variables = {}
-            self.tctx.build(runtime_variables, template_context_data_provider)
-            value = self.template.async_render(runtime_variables)
+            value = self.template.async_render(render_context.get_variables(self.tctx))
         except TemplateError as te:
             _LOGGER.exception(f"Config: Error rendering {self.attr}: {te}")
         return self.type_converter(value) if self.type_converter else value
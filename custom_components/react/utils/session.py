@@ -1,73 +1,166 @@
 from __future__ import annotations
 
-from logging import Logger
-from typing import TYPE_CHECKING
-from custom_components.react.const import ATTR_SESSION_ID
+from collections import OrderedDict
+from logging import DEBUG, ERROR, INFO, WARNING, Logger
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Union
+from custom_components.react.const import (
+    ATTR_SESSION_ID,
+    SESSION_IDLE_MAX_COUNT,
+    SESSION_IDLE_TTL,
+)
 
 
 if TYPE_CHECKING:
     from custom_components.react.base import ReactBase
     from custom_components.react.utils.events import ReactEvent
-    
+
+message_type = Union[str, Callable[[], str]]
+
 
 class SessionManager:
-    def __init__(self, react: ReactBase) -> None:
+    def __init__(self, react: ReactBase, idle_max_count: int = SESSION_IDLE_MAX_COUNT, idle_ttl: float = SESSION_IDLE_TTL) -> None:
         self._react = react
+        self._idle_max_count = idle_max_count
+        self._idle_ttl = idle_ttl
 
         self._last_session_id: int = 0
-        self._sessions: dict[str, Session] = {}
+        # Sessions owned by an active run or reaction, these are never evicted
+        self._live_sessions: dict[str, Session] = {}
+        # Root sessions and released sessions, kept around for late lookups and evicted by LRU/TTL
+        self._idle_sessions: OrderedDict[str, Session] = OrderedDict()
+
+        self.evicted_count: int = 0
+        self.released_count: int = 0
+
+
+    @property
+    def live_count(self) -> int:
+        return len(self._live_sessions)
+
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle_sessions)
 
 
     def load_session(self, react_event: ReactEvent):
         result: Session = react_event.session
         if not result:
             if session_id := react_event.payload.get(ATTR_SESSION_ID, None):
-                result = self._sessions.get(session_id, None)
+                result = self.get_session(session_id)
         if not result:
             self._last_session_id += 1
-            result = self._register_new_session(str(self._last_session_id))
+            result = self._register_idle_session(Session(str(self._last_session_id), self))
         react_event.set_session(result)
 
 
-    def _register_new_session(self, session_id: str):
-        return self._sessions.setdefault(session_id, Session(session_id, self))
+    def get_session(self, session_id: str) -> Session | None:
+        if result := self._live_sessions.get(session_id, None):
+            return result
+        if result := self._idle_sessions.get(session_id, None):
+            result.touch()
+            self._idle_sessions.move_to_end(session_id)
+        return result
+
+
+    def release_session(self, session: Session):
+        if self._live_sessions.pop(session.id, None) is None:
+            return
+        self.released_count += 1
+        self._register_idle_session(session)
+
+
+    def _register_live_session(self, session: Session) -> Session:
+        self._live_sessions[session.id] = session
+        return session
+
+
+    def _register_idle_session(self, session: Session) -> Session:
+        session.touch()
+        self._idle_sessions[session.id] = session
+        self._idle_sessions.move_to_end(session.id)
+        self._evict_idle_sessions()
+        return session
+
+
+    def _evict_idle_sessions(self):
+        expire_before = monotonic() - self._idle_ttl
+        while self._idle_sessions:
+            session = next(iter(self._idle_sessions.values()))
+            if len(self._idle_sessions) <= self._idle_max_count and session.last_used >= expire_before:
+                break
+            self._idle_sessions.popitem(last=False)
+            self.evicted_count += 1
 
 
 class Session:
-    def __init__(self, id: str, session_manager: SessionManager) -> None:
+    def __init__(self, id: str, session_manager: SessionManager, parent: Session = None) -> None:
         self.id = id
         self.session_manager = session_manager
+        self.parent = parent
+        self.last_used: float = monotonic()
         self._last_child_session_id: int = 0
         self.child_sessions: dict[str, Session] = {}
 
 
-    def debug(self, logger: Logger, message: str):
-        logger.debug(self.format_message(message))
+    def touch(self):
+        self.last_used = monotonic()
+
+
+    def debug(self, logger: Logger, message: message_type, *args: Any):
+        """Log a debug message, which is only formatted when debug logging is enabled for the logger.
+
+        The message is either a %-style format string for args or a callable that returns the message. The
+        logger caches whether a level is enabled and clears that cache when a level changes.
+        """
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(self.format_message(render_message(message, args)))
 
 
-    def info(self, logger: Logger, message: str):
-        logger.info(self.format_message(message))
+    def info(self, logger: Logger, message: message_type, *args: Any):
+        if logger.isEnabledFor(INFO):
+            logger.info(self.format_message(render_message(message, args)))
 
 
-    def warning(self, logger: Logger, message: str):
-        logger.warning(self.format_message(message))
+    def warning(self, logger: Logger, message: message_type, *args: Any):
+        if logger.isEnabledFor(WARNING):
+            logger.warning(self.format_message(render_message(message, args)))
 
 
-    def error(self, logger: Logger, message: str):
-        logger.error(self.format_message(message))
+    def error(self, logger: Logger, message: message_type, *args: Any):
+        if logger.isEnabledFor(ERROR):
+            logger.error(self.format_message(render_message(message, args)))
 
 
-    def exception(self, logger: Logger, message: str):
-        logger.exception(self.format_message(message))
+    def exception(self, logger: Logger, message: message_type, *args: Any):
+        if logger.isEnabledFor(ERROR):
+            logger.exception(self.format_message(render_message(message, args)))
 
 
     def format_message(self, message: str):
         return f"{self.id} - {message}"
-        
+
 
     def create_child_session(self) -> Session:
         self._last_child_session_id += 1
         child_session_id = f"{self.id}.{self._last_child_session_id}"
-        child_session = self.session_manager._register_new_session(child_session_id)
+        child_session = self.session_manager._register_live_session(Session(child_session_id, self.session_manager, self))
         self.child_sessions[child_session_id] = child_session
         return child_session
+
+
+    def release(self):
+        """Release a session owned by a run or reaction once it has finished."""
+        if self.parent:
+            self.parent.child_sessions.pop(self.id, None)
+            self.parent = None
+        self.session_manager.release_session(self)
+
+
+def render_message(message: message_type, args: tuple) -> str:
+    if callable(message):
+        return message()
+    if args:
+        return message % args
+    return message
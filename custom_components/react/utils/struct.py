@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Union
+from typing import Any, Callable, Union
 
 from homeassistant.helpers.template import Template
 
@@ -23,10 +23,21 @@ from ..const import (
 
 class DynamicData():
 
+    # Records only store these and their declared fields, other subclasses also get a __dict__ for their keys
+    __slots__ = ("_keys", "_prop_types", "_templates", "_deferred", "_frozen", "type_hints", "source")
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> DynamicData:
+        # Plain DynamicData stores its keys as attributes, so it is created with the subclass that has a __dict__
+        return object.__new__(DynamicDataObject if cls is DynamicData else cls)
+
+
     def __init__(self, source: dict = None) -> None:
+        # Set by freeze() on objects that are shared and must not change anymore
+        self._frozen = False
         self._keys: list[str] = []
         self._prop_types: dict[str, str] = {}
         self._templates: dict[str, str] = {}
+        self._deferred: dict[str, Callable[[DynamicData], None]] = {}
 
         if not hasattr(self, "type_hints"):
             self.type_hints = {}
@@ -37,14 +48,73 @@ class DynamicData():
         self.source = source
 
 
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that don't exist (yet), which includes deferred ones
+        try:
+            deferred = object.__getattribute__(self, "_deferred")
+        except AttributeError:
+            deferred = None
+        if deferred and name in deferred:
+            self.materialize(name)
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
     def __contains__(self, key):
+        if self._deferred:
+            self.materialize()
         return key in self._keys
 
 
     def keys(self):
+        if self._deferred:
+            self.materialize()
         return self._keys
 
 
+    def defer(self, key: str, render: Callable[[DynamicData], None]):
+        """Set the value of key by calling render when it is first accessed instead of now."""
+        self.ensure_not_frozen(key)
+        if self.__dict__.get(key) is None:
+            self.__dict__.pop(key, None)
+        self._deferred[key] = render
+
+
+    def materialize(self, key: str = None):
+        """Render deferred values, either the one for key or all of them."""
+        for deferred_key in ([key] if key else list(self._deferred)):
+            if render := self._deferred.pop(deferred_key, None):
+                render(self)
+                if deferred_key not in self.__dict__:
+                    setattr(self, deferred_key, None)
+
+
+    def freeze(self) -> DynamicData:
+        """Make this object and the objects and lists it holds read-only, so it can be shared."""
+        if self._frozen:
+            return self
+        if self._deferred:
+            self.materialize()
+        for key in self._keys:
+            value = getattr(self, key, None)
+            if isinstance(value, DynamicData):
+                value.freeze()
+            elif isinstance(value, list):
+                self.store_value(key, freeze_list(value))
+        self._frozen = True
+        return self
+
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+
+    def ensure_not_frozen(self, key: str):
+        if self._frozen:
+            raise TypeError(f"Cannot change '{key}' of a frozen '{type(self).__name__}'")
+
+
     def load(self, source: Union[dict, DynamicData]) -> None:
         if not source:
             return
@@ -63,6 +133,8 @@ class DynamicData():
 
 
     def get(self, key: str, default: Any = None) -> Any:
+        if key in self._deferred:
+            self.materialize(key)
         if key in self._keys:
             return getattr(self, key)
         else:
@@ -73,49 +145,58 @@ class DynamicData():
         result = self.get(key, default)
         if isinstance(result, MultiItem) and len(result) == 1:
             result = result.first
-        elif isinstance(result, list) and len(result) == 1:
+        elif isinstance(result, (list, tuple)) and len(result) == 1:
             result = result[0]
         return result
 
 
     def set_type(self, key: str, prop_type: str = PROP_TYPE_VALUE):
+        self.ensure_not_frozen(key)
         if not key in self._prop_types:
             self._prop_types[key] = prop_type
 
 
     def set_template(self, key: str, template: str):
+        self.ensure_not_frozen(key)
         if not key in self._templates:
             self._templates[key] = template
 
 
     def set(self, key: str, value: Any):
+        self.ensure_not_frozen(key)
+        if self._deferred:
+            self._deferred.pop(key, None)
         if not key in self._keys:
             self._keys.append(key)
+        self.store_value(key, self.convert(key, value))
+
+
+    def store_value(self, key: str, value: Any):
+        """Store the value of a key that was already checked and converted."""
+        setattr(self, key, value)
+
+
+    def convert(self, key: str, value: Any) -> Any:
         if isinstance(value, (MultiItem, DynamicData)):
-            setattr(self, key, value)
+            return value
         elif isinstance(value, dict):
-            setattr(self, key, self.type_hint(key)(value))
+            return self.type_hint(key)(value)
         elif isinstance(value, list):
             if len(value):
                 if isinstance(value[0], dict):
-                    items = []
-                    for item in value:
-                        items.append(self.type_hint(key)(item))
-                    setattr(self, key, items)
+                    return [ self.type_hint(key)(item) for item in value ]
                 elif isinstance(value[0], DynamicData):
-                    setattr(self, key, value)
+                    return value
                 else:
-                    setattr(self, key, MultiItem( {f"_{index}":item for index,item in enumerate(value)} ))
-            else:
-                setattr(self, key, value)
-        else:
-            setattr(self, key, value)
+                    return MultiItem( {f"_{index}":item for index,item in enumerate(value)} )
+        return value
 
 
     def ensure(self, key: str, default: Any):
         if key in self._keys: return
 
         if hasattr(self, key) and getattr(self, key, None) != None:
+            self.ensure_not_frozen(key)
             self._keys.append(key)
             return
 
@@ -125,18 +206,17 @@ class DynamicData():
     def as_dict(self, skip_none: bool = False) -> dict:
         result = {}
 
-        for name in self._keys:
+        for name in self.keys():
             v = getattr(self, name)
             if isinstance(v, MultiItem) and v.has_data:
                 result[name] = v.as_dict()
             elif isinstance(v, DynamicData) and v.has_data:
                 result[name] = v.as_dict(skip_none)
-            elif isinstance(v, list):
-                if isinstance(v[0], DynamicData):
+            elif isinstance(v, (list, tuple)):
+                if len(v) and isinstance(v[0], DynamicData):
                     result[name] = [ x.as_dict(skip_none) for x in v ]
                 else:
-                    if not skip_none or v is not None:
-                        result[name] = v
+                    result[name] = list(v) if isinstance(v, tuple) else v
             else:
                 if not skip_none or v is not None:
                     result[name] = v
@@ -166,43 +246,155 @@ class DynamicData():
 
 
     def is_prop_type(self, key: str, prop_type: str) -> bool:
+        if key in self._deferred:
+            self.materialize(key)
         return self._prop_types.get(key, None) == prop_type
 
 
     def get_template(self, key: str) -> str:
+        if key in self._deferred:
+            self.materialize(key)
         return self._templates.get(key, None)
 
 
+class DynamicDataObject(DynamicData):
+    """DynamicData created as DynamicData(), it has a __dict__ for its keys."""
+
+
+RECORD_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), datetime})
+
+
+class DynamicRecord(DynamicData):
+    """DynamicData with fields that are declared once in __slots__.
+
+    The declared fields are compiled into record_fields when the class is created. They are stored in slots and
+    scalar values are stored without going through the type dispatch of convert. A record has no __dict__, keys
+    that are not declared are kept in a dict that is only created when such a key is set. Values of a record can't
+    be deferred.
+    """
+
+    __slots__ = ("_extra",)
+
+    record_fields: tuple[str, ...] = ()
+    _record_field_set: frozenset[str] = frozenset()
+
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            if issubclass(klass, DynamicRecord) and klass is not DynamicRecord:
+                fields.update(dict.fromkeys(klass.__dict__.get("__slots__", ())))
+        cls.record_fields = tuple(fields)
+        cls._record_field_set = frozenset(fields)
+
+
+    def __init__(self, source: dict = None) -> None:
+        self._extra: dict[str, Any] | None = None
+        for field in self.record_fields:
+            setattr(self, field, None)
+        super().__init__(source)
+
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that don't exist, which includes the keys that are not declared
+        try:
+            extra = object.__getattribute__(self, "_extra")
+        except AttributeError:
+            extra = None
+        if extra and name in extra:
+            return extra[name]
+        return super().__getattr__(name)
+
+
+    def set(self, key: str, value: Any):
+        if key in self._record_field_set and type(value) in RECORD_SCALAR_TYPES:
+            if self._frozen:
+                self.ensure_not_frozen(key)
+            if not key in self._keys:
+                self._keys.append(key)
+            setattr(self, key, value)
+        else:
+            super().set(key, value)
+
+
+    def store_value(self, key: str, value: Any):
+        if key in self._record_field_set:
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+
+def freeze_list(items: list) -> tuple:
+    """Read-only copy of a list, with the objects in it frozen."""
+    return tuple( item.freeze() if isinstance(item, DynamicData) else item for item in items )
+
+
+class FrozenDict(dict):
+    """Read-only dict. Unlike a mapping proxy it is still a dict, so every JSON encoder handles it."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"Cannot change a frozen '{type(self).__name__}'")
+
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+    def __reduce__(self):
+        # Copies are built from a plain dict, the default goes through __setitem__
+        return (type(self), (dict(self),))
+
+
+def freeze_value(value: Any) -> Any:
+    """Read-only deep copy of data, dicts become frozen dicts, lists become tuples."""
+    if isinstance(value, dict):
+        return FrozenDict({ key: freeze_value(item) for key, item in value.items() })
+    if isinstance(value, (list, tuple)):
+        return tuple( freeze_value(item) for item in value )
+    if isinstance(value, DynamicData):
+        # Encoded through as_dict anyway, the object itself stays with its owner
+        return freeze_value(value.as_dict())
+    return value
+
+
 class MultiItem(DynamicData):
+    """List of values stored as '_0', '_1', ... keys.
+
+    Iteration and membership checks go through a tuple of the values and a frozenset built from it when it is
+    first needed. Both are reset whenever a value is set.
+    """
 
     def __init__(self, source: dict = None) -> None:
+        self._values: tuple | None = None
+        self._value_set: frozenset | None = None
+        self._unhashable = False
         super().__init__(source)
 
 
-    class MultiItemIterator:
-        
-        def __init__(self, parent: Any, keys: list[str]):
-            self.parent = parent
-            self._keys = keys
-            self.num = 0
-            self.end = len(keys) - 1
+    @property
+    def values(self) -> tuple:
+        if self._values is None:
+            self._values = tuple( getattr(self, name) for name in self._keys )
+        return self._values
 
 
-        def __next__(self):
-            if self.num > self.end:
-                raise StopIteration
-            else:
-                result = getattr(self.parent, self._keys[self.num])
-                self.num += 1
-                return result
+    def set(self, key: str, value: Any):
+        self.ensure_not_frozen(key)
+        self._values = None
+        self._value_set = None
+        self._unhashable = False
+        super().set(key, value)
 
 
     def as_dict(self):
-        return [getattr(self, name) for name in self._keys]
+        return list(self.values)
 
 
     def __iter__(self):
-        return MultiItem.MultiItemIterator(self, self._keys)
+        return iter(self.values)
 
 
     def __len__(self):
@@ -210,10 +402,18 @@ class MultiItem(DynamicData):
 
 
     def __contains__(self, key):
-        for value in self:
-            if value == key: 
-                return True
-        return False
+        if not self._unhashable:
+            if self._value_set is None:
+                try:
+                    self._value_set = frozenset(self.values)
+                except TypeError:
+                    self._unhashable = True
+            if self._value_set is not None:
+                try:
+                    return key in self._value_set
+                except TypeError:
+                    pass
+        return key in self.values
 
 
     @property
@@ -230,7 +430,7 @@ class MultiItem(DynamicData):
 
     def __getitem__(self, k):
         if self.any and len(self._keys) > k:
-            return self.get(self._keys[k])
+            return self.values[k]
         return None
 
     
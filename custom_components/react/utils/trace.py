@@ -1,9 +1,12 @@
 """Trace support for script."""
 from __future__ import annotations
 
-from collections import deque
+from bisect import insort
+from collections import ChainMap, deque
+from itertools import count
 from copy import deepcopy
-from typing import Any
+from time import monotonic
+from typing import Any, Iterable, MutableMapping
 
 from homeassistant.components.trace import ActionTrace, async_store_trace
 from homeassistant.components.trace.const import CONF_STORED_TRACES
@@ -15,32 +18,100 @@ from homeassistant.helpers.trace import (
 )
 from homeassistant.util import dt as dt_util
 
-from custom_components.react.const import DOMAIN
 from custom_components.react.config.config import Workflow
+from custom_components.react.runtime.trace_store import TraceStore
+
+from custom_components.react.const import (
+    ATTR_SKIPPED_COUNT,
+    ATTR_TRACED_COUNT,
+    CONF_TRACE_MODE,
+    CONF_TRACE_SAMPLE_EVERY,
+    CONF_TRACE_SAMPLE_INTERVAL,
+    DOMAIN,
+    TRACE_MODE_ERRORS,
+    TRACE_MODE_FULL,
+    TRACE_MODE_SAMPLED,
+)
 
 ROOT_SECTION = "root"
+TRACE_PATH_SORT_DEPTH = 2
+DATA_TRACE_SAMPLERS = f"{DOMAIN}_trace_samplers"
+DEFAULT_STORED_TRACES = 5
 
 
 class ReactTraceSection():
-    def __init__(self, variables: dict[str, Any], last_variables: dict[str, Any] = {}) -> None:
+    """Copy-on-write trace variables.
+
+    A branched section reads through to the variables of its parent as they were when it was branched, the parent
+    only copies its variables when it is written to after branching. Keys that were set since the last node are
+    tracked so a node only has to look at those.
+    """
+
+    def __init__(self, variables: MutableMapping[str, Any], changed_keys: Iterable[str] = ()) -> None:
         self.variables = variables
-        self.last_variables = last_variables
+        self.changed_keys: dict[str, None] = dict.fromkeys(changed_keys)
+        self._shared = False
+
+
+    def branch(self) -> ReactTraceSection:
+        self._shared = True
+        return ReactTraceSection(ChainMap({}, self.variables), self.changed_keys)
+
+
+    def set_var(self, name: str, value: Any):
+        if self._shared:
+            self.variables = dict(self.variables)
+            self._shared = False
+        self.variables[name] = value
+        self.changed_keys[name] = None
+
+
+    def take_changed_variables(self) -> dict[str, Any]:
+        if not self.changed_keys:
+            return {}
+        result = { key: self.variables[key] for key in self.changed_keys }
+        self.changed_keys = {}
+        return result
+
+
+class ReactTraceVariables():
+    """Trace variables per section, kept regardless of whether the trace is recorded."""
+
+    trace_sections: dict[str, ReactTraceSection]
+
+    def get_vars(self, section_id: str = ROOT_SECTION):
+        return self.get_trace_section(section_id).variables
 
 
-    def shift(self):
-        self.last_variables = dict(self.variables)
+    def set_var(self, name: str, value: Any, section_id: str = ROOT_SECTION):
+        self.get_trace_section(section_id).set_var(name, value)
+
+
+    def get_trace_section(self, section_id: str):
+        if not section_id in self.trace_sections:
+            self.trace_sections[section_id] = self.trace_sections[ROOT_SECTION].branch()
+        return self.trace_sections.get(section_id)
 
 
-class ReactTrace(ActionTrace):
+class ReactTrace(ReactTraceVariables, ActionTrace):
     _domain = DOMAIN
 
-    def __init__(self, workflow_id: str, workflow_config_dict: dict, context: Context, trace_variables: dict[str, Any]) -> None:
+    def __init__(self, 
+        workflow_id: str, 
+        workflow_config_dict: dict, 
+        context: Context, 
+        trace_variables: dict[str, Any], 
+        trace_store: TraceStore | None = None,
+    ) -> None:
         super().__init__(workflow_id, workflow_config_dict, {}, context)
         
+        self.workflow_id = workflow_id
+        self._trace_store = trace_store
         self._actor_description: str | None = None
         self.trace_nodes: dict[str, deque[ReactTraceElement]] = {}
-        self.trace_paths: dict[str, list[str]] = {}
-        self.trace_sections: dict[str, ReactTraceSection] = { ROOT_SECTION: ReactTraceSection(trace_variables) }
+        self.trace_paths: list[tuple[tuple, int, str]] = []
+        self._trace_path_sequence = count()
+        self.trace_sections: dict[str, ReactTraceSection] = { ROOT_SECTION: ReactTraceSection(trace_variables, trace_variables) }
         self.set_trace(self.trace_nodes)
 
 
@@ -57,14 +128,6 @@ class ReactTrace(ActionTrace):
         return result
 
 
-    def get_vars(self, section_id: str = ROOT_SECTION):
-        return self.get_trace_section(section_id).variables
-
-
-    def set_var(self, name: str, value: Any, section_id: str = ROOT_SECTION):
-        self.get_vars(section_id)[name] = value
-
-
     def trace_node(self, path: str, **kwargs: Any) -> ReactTraceElement:
         return self.trace_section_node(ROOT_SECTION, path, **kwargs)
 
@@ -73,48 +136,37 @@ class ReactTrace(ActionTrace):
         return self.trace_node_core(path, self.get_trace_section(section_id), **kwargs)
 
 
-    def get_trace_section(self, section_id: str):
-        if not section_id in self.trace_sections:
-            root_section = self.trace_sections.get(ROOT_SECTION)
-            self.trace_sections[section_id] = ReactTraceSection(dict(root_section.variables), dict(root_section.last_variables))
-        return self.trace_sections.get(section_id)
-
-
     def trace_node_core(self, path: str, section: ReactTraceSection, **kwargs: Any):
         node = ReactTraceElement(section, path)
-        if (path := node.path) not in self.trace_nodes:
-            self.trace_nodes[path] = deque()
-        self.trace_nodes[path].append(node)
+        self.insert_node(node.path, node)
         if kwargs:
             node.set_result(**kwargs)
         return node
 
 
     def insert_node(self, path: str, node: ReactTraceElement):
-        paths = path.split("/")
-        inserted = False
-        for i,existing_paths in enumerate(self.trace_paths):
-            if self.compare(existing_paths, paths) > 0:
-                self.trace_nodes[path].insert(i, node)
-                inserted = True
-                break
-        if not inserted:
-            self.trace_nodes[path].append(node)
-        self.trace_paths[path] = paths
-
-
-    def compare(self, paths1: list[str], paths2: list[str]):
-        if paths1[0] < paths2[0]:
-            return -1
-        elif paths1[0] > paths2[0]:
-            return 1
-        else:
-            if paths1[1] < paths2[1]:
-                return -1
-            elif paths1[1] > paths2[1]:
-                return 1
-        return 1
-            
+        """Add a node, keeping the paths ordered by their section (e.g. 'reactor/1') and then by insertion."""
+        if (nodes := self.trace_nodes.get(path)) is None:
+            nodes = self.trace_nodes[path] = deque()
+            insort(self.trace_paths, (node.path_key[:TRACE_PATH_SORT_DEPTH], next(self._trace_path_sequence), path))
+        nodes.append(node)
+
+
+    def as_extended_dict(self) -> dict[str, Any]:
+        self.set_trace({ path: self.trace_nodes[path] for _, _, path in self.trace_paths })
+        return super().as_extended_dict()
+
+
+    def finished(self) -> None:
+        super().finished()
+        self.persist()
+
+
+    def persist(self):
+        """Hand the finished trace to the trace store, which encodes its body right away (once per traced run)."""
+        if self._trace_store:
+            self._trace_store.async_append(self.workflow_id, self.run_id, self.as_short_dict(), self.as_dict())
+
 
 class ReactTraceElement(TraceElement):
     def __init__(self, section: ReactTraceSection, path: str) -> None:
@@ -123,24 +175,235 @@ class ReactTraceElement(TraceElement):
         self._child_run_id: str | None = None
         self._error: Exception | None = None
         self.path: str = path
+        self.path_key: tuple = parse_trace_path(path)
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
 
-        # if variables is None:
-        #     variables = {}
-        # last_variables = variables_cv.get() or {}
-        # variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
-            for key, value in section.variables.items()
-            if key not in section.last_variables or section.last_variables[key] != value
-        }
-        self._variables = changed_variables
-        section.shift()
+        self._variables = section.take_changed_variables()
         
 
-def create_trace(hass: HomeAssistant, workflow_config: Workflow, context: Context, trace_variables: dict[str, Any]) -> ReactTrace:
-    trace = ReactTrace(workflow_config.id, workflow_config.get_trace_config(), context, trace_variables)
-    async_store_trace(hass, trace, workflow_config.trace_config[CONF_STORED_TRACES])
+def parse_trace_path(path: str) -> tuple:
+    # Numeric parts compare as numbers so 'reactor/10' sorts after 'reactor/2'
+    return tuple( (0, int(part), "") if part.isdigit() else (1, 0, part) for part in path.split("/") )
+
+
+class NoopReactTraceElement():
+    """Trace node that records nothing."""
+
+    def set_result(self, **kwargs: Any) -> None:
+        pass
+
+
+    def update_result(self, **kwargs: Any) -> None:
+        pass
+
+
+    def set_error(self, ex: BaseException) -> None:
+        pass
+
+
+NOOP_TRACE_ELEMENT = NoopReactTraceElement()
+
+
+class PendingReactTraceElement():
+    """Node of an errors-only trace, only turned into a trace element when the trace gets stored."""
+
+    __slots__ = ("path", "variables", "timestamp", "result", "error")
+
+    def __init__(self, section: ReactTraceSection, path: str) -> None:
+        self.path = path
+        self.variables = section.take_changed_variables()
+        self.timestamp = dt_util.utcnow()
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
+    def set_result(self, **kwargs: Any) -> None:
+        self.result = kwargs
+
+
+    def update_result(self, **kwargs: Any) -> None:
+        if self.result is None:
+            self.result = {}
+        self.result.update(kwargs)
+
+
+    def set_error(self, ex: BaseException) -> None:
+        self.error = ex
+
+
+    def create_element(self) -> ReactTraceElement:
+        element = ReactTraceElement(ReactTraceSection(self.variables, self.variables), self.path)
+        element._timestamp = self.timestamp
+        if self.result is not None:
+            element.set_result(**self.result)
+        if self.error is not None:
+            element.set_error(self.error)
+        return element
+
+
+class ErrorReactTrace(ReactTraceVariables):
+    """Trace that is only stored when the run ran into an error.
+
+    Nodes are kept as pending elements, the trace itself is only built when there is an error to store.
+    """
+
+    def __init__(self, 
+        hass: HomeAssistant, 
+        sampler: TraceSampler, 
+        context: Context, 
+        trace_variables: dict[str, Any], 
+        trace_store: TraceStore | None = None,
+    ) -> None:
+        self._hass = hass
+        self._sampler = sampler
+        self._context = context
+        self._trace_store = trace_store
+        self._actor_description: str | None = None
+        self._error: BaseException | None = None
+        self._nodes: list[PendingReactTraceElement] = []
+        self._timestamp_start = dt_util.utcnow()
+        self.trace_sections: dict[str, ReactTraceSection] = { ROOT_SECTION: ReactTraceSection(trace_variables, trace_variables) }
+
+
+    def set_actor_description(self, trigger: str) -> None:
+        self._actor_description = trigger
+
+
+    def set_error(self, ex: BaseException) -> None:
+        self._error = ex
+
+
+    def trace_node(self, path: str, **kwargs: Any) -> PendingReactTraceElement:
+        return self.trace_section_node(ROOT_SECTION, path, **kwargs)
+
+
+    def trace_section_node(self, section_id: str, path: str, **kwargs: Any) -> PendingReactTraceElement:
+        node = PendingReactTraceElement(self.get_trace_section(section_id), path)
+        self._nodes.append(node)
+        if kwargs:
+            node.set_result(**kwargs)
+        return node
+
+
+    def finished(self) -> None:
+        if self._error is None:
+            self._sampler.skipped_count += 1
+            return
+
+        self._sampler.traced_count += 1
+        trace = ReactTrace(self._sampler.workflow_config.id, self._sampler.workflow_config.get_trace_config(), self._context, {}, self._trace_store)
+        trace._timestamp_start = self._timestamp_start
+        trace.set_actor_description(self._actor_description)
+        for node in self._nodes:
+            trace.insert_node(node.path, node.create_element())
+        trace.set_error(self._error)
+        async_store_trace(self._hass, trace, self._sampler.stored_traces)
+        trace.finished()
+
+
+class NoopReactTrace(ReactTraceVariables):
+    """Stand-in for a trace that is not recorded.
+
+    Variables are still kept per section because reactions use them to render their templates.
+    """
+
+    def __init__(self, trace_variables: dict[str, Any]) -> None:
+        self.trace_sections: dict[str, ReactTraceSection] = { ROOT_SECTION: ReactTraceSection(trace_variables) }
+
+
+    def set_actor_description(self, trigger: str) -> None:
+        pass
+
+
+    def set_error(self, ex: BaseException) -> None:
+        pass
+
+
+    def trace_node(self, path: str, **kwargs: Any) -> NoopReactTraceElement:
+        return NOOP_TRACE_ELEMENT
+
+
+    def trace_section_node(self, section_id: str, path: str, **kwargs: Any) -> NoopReactTraceElement:
+        return NOOP_TRACE_ELEMENT
+
+
+    def finished(self) -> None:
+        pass
+
+
+class TraceSampler():
+    """Decides per run of a workflow whether it gets traced and counts the traces that were skipped."""
+
+    def __init__(self, workflow_config: Workflow) -> None:
+        trace_config = workflow_config.trace_config or {}
+        self.workflow_config = workflow_config
+        self.mode: str = trace_config.get(CONF_TRACE_MODE, TRACE_MODE_FULL)
+        self.stored_traces: int = trace_config.get(CONF_STORED_TRACES, DEFAULT_STORED_TRACES)
+        self.sample_every: int = trace_config.get(CONF_TRACE_SAMPLE_EVERY, 1)
+        self.sample_interval: float = trace_config.get(CONF_TRACE_SAMPLE_INTERVAL, 0)
+        self.traced_count: int = 0
+        self.skipped_count: int = 0
+        self._run_count: int = 0
+        self._last_sampled: float | None = None
+
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            CONF_TRACE_MODE: self.mode,
+            CONF_STORED_TRACES: self.stored_traces,
+            CONF_TRACE_SAMPLE_EVERY: self.sample_every,
+            CONF_TRACE_SAMPLE_INTERVAL: self.sample_interval,
+            ATTR_TRACED_COUNT: self.traced_count,
+            ATTR_SKIPPED_COUNT: self.skipped_count,
+        }
+
+
+    def sample(self) -> bool:
+        if self.mode == TRACE_MODE_FULL:
+            return True
+        if self.mode != TRACE_MODE_SAMPLED:
+            return False
+
+        self._run_count += 1
+        if (self._run_count - 1) % self.sample_every:
+            return False
+        if self.sample_interval:
+            now = monotonic()
+            if self._last_sampled is not None and now - self._last_sampled < self.sample_interval:
+                return False
+            self._last_sampled = now
+        return True
+
+
+def get_trace_sampler(hass: HomeAssistant, workflow_config: Workflow) -> TraceSampler:
+    samplers: dict[str, TraceSampler] = hass.data.setdefault(DATA_TRACE_SAMPLERS, {})
+    sampler = samplers.get(workflow_config.id)
+    # A reloaded configuration gets a fresh sampler
+    if sampler is None or sampler.workflow_config is not workflow_config:
+        sampler = samplers[workflow_config.id] = TraceSampler(workflow_config)
+    return sampler
+
+
+def create_trace(
+    hass: HomeAssistant, 
+    workflow_config: Workflow, 
+    context: Context, 
+    trace_variables: dict[str, Any], 
+    trace_store: TraceStore | None = None,
+) -> ReactTrace | ErrorReactTrace | NoopReactTrace:
+    sampler = get_trace_sampler(hass, workflow_config)
+    if not sampler.stored_traces:
+        # Traces that aren't kept in memory aren't persisted either, so they aren't encoded at all
+        trace_store = None
+    if sampler.mode == TRACE_MODE_ERRORS:
+        return ErrorReactTrace(hass, sampler, context, trace_variables, trace_store)
+    if not sampler.sample():
+        sampler.skipped_count += 1
+        return NoopReactTrace(trace_variables)
+
+    sampler.traced_count += 1
+    trace = ReactTrace(workflow_config.id, workflow_config.get_trace_config(), context, trace_variables, trace_store)
+    async_store_trace(hass, trace, sampler.stored_traces)
     return trace
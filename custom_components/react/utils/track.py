@@ -5,10 +5,11 @@ from homeassistant.const import ATTR_ID
 from homeassistant.core import Event as HaEvent, callback, HomeAssistant
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import TrackTemplate, TrackTemplateResult, async_track_template_result
+from homeassistant.helpers.event import TrackTemplate, TrackTemplateResult, TrackTemplateResultInfo, async_track_template_result
 from homeassistant.helpers.template import Template, is_template_string
 
 from custom_components.react.const import (
+    DOMAIN,
     PROP_TYPE_DEFAULT,
     PROP_TYPE_LIST,
     PROP_TYPE_MULTI_ITEM,
@@ -28,6 +29,8 @@ T = TypeVar('T', bound=DynamicData)
 
 _LOGGER = get_react_logger()
 
+DATA_TEMPLATE_TRACKER_GROUP = f"{DOMAIN}_template_tracker_group"
+
 
 class BaseTracker(Updatable):
 
@@ -104,21 +107,25 @@ class CompositeTracker(BaseTracker, Generic[T], Destroyable):
 
 
     def start(self):
-        if self.tctx:
-            @callback
-            def async_update_template_trackers(*args):
-                for tracker in self.trackers:
-                    tracker.async_refresh()
-            self.tctx.on_update(async_update_template_trackers)
-        
-        for tracker in self.trackers:
-            tracker.start()
+        # Templates of nested trackers are all added before the group starts tracking them
+        template_group = get_template_tracker_group(self.hass, self.tctx)
+        template_group.hold()
+        try:
+            for tracker in self.trackers:
+                tracker.start()
+        finally:
+            template_group.release()
 
 
     def destroy(self) -> None:
         super().destroy()
-        for tracker in self.trackers:
-            tracker.destroy()
+        template_group = get_template_tracker_group(self.hass, self.tctx)
+        template_group.hold()
+        try:
+            for tracker in self.trackers:
+                tracker.destroy()
+        finally:
+            template_group.release()
 
 
 class MultiItemTracker(CompositeTracker[MultiItem]):
@@ -144,8 +151,7 @@ class TemplatePropertyTracker(BaseTracker, Destroyable):
         self.template = template
         self.type_converter = type_converter
         self.tctx = tctx
-
-        self.runtime_variables: dict = None
+        self.template_group = get_template_tracker_group(hass, tctx)
 
         template.hass = hass
         if update_callback:
@@ -154,33 +160,133 @@ class TemplatePropertyTracker(BaseTracker, Destroyable):
 
     def start(self):
         self.owner.set_property(self.property, None)
-        self.runtime_variables = {}
-        self.tctx.build(self.runtime_variables)
-        self.track_templates = [TrackTemplate(self.template, self.runtime_variables)]
-        self.result_info = async_track_template_result(self.hass, self.track_templates, self.async_update_template)
-        self.async_refresh()
+        self.template_group.add(self)
 
     
     def destroy(self) -> None:
         super().destroy()
+        self.template_group.remove(self)
+
+
+    @callback
+    def async_refresh(self):
+        self.template_group.async_refresh()
+
+
+    @callback
+    def async_update_result(self, result: Any):
+        if isinstance(result, TemplateError):
+            _LOGGER.error(f"Config: Error rendering {self.property}: {result}")
+            return
+
+        self.owner.set_property(self.property, self.type_converter(result))
+        self.async_update(result)
+
+
+class TemplateTrackerGroup(Destroyable):
+    """Tracks the templates of all property trackers that share a template context with a single template result
+    listener, so every state change is handled in one pass and entity listeners are shared between templates.
+
+    The listener is rebuilt when trackers are added or removed, hold the group while adding many trackers so it is
+    only rebuilt once. Results that did not change since they were last passed on are not passed on again.
+    """
+
+    def __init__(self, hass: HomeAssistant, tctx: Union[TemplateContext, None]) -> None:
+        self.hass = hass
+        self.tctx = tctx
+        self.runtime_variables: dict = {}
+        self.result_info: Union[TrackTemplateResultInfo, None] = None
+
+        self._trackers: dict[int, TemplatePropertyTracker] = {}
+        self._results: dict[int, Any] = {}
+        self._hold_count = 0
+        self._dirty = False
+
+        if tctx:
+            tctx.on_update(self.async_refresh)
+
+
+    def hold(self):
+        self._hold_count += 1
+
+
+    def release(self):
+        self._hold_count -= 1
+        if self._hold_count == 0 and self._dirty:
+            self._async_track_templates()
+
+
+    def add(self, tracker: TemplatePropertyTracker):
+        self._trackers[id(tracker.template)] = tracker
+        self._changed()
+
+
+    def remove(self, tracker: TemplatePropertyTracker):
+        if self._trackers.pop(id(tracker.template), None):
+            self._results.pop(id(tracker.template), None)
+            self._changed()
+
+
+    @callback
+    def async_refresh(self, *args):
+        if self.result_info:
+            self._build_variables()
+            self.result_info.async_refresh()
+
+
+    def destroy(self) -> None:
+        self._trackers.clear()
+        self._results.clear()
         if self.result_info:
             self.result_info.async_remove()
+            self.result_info = None
+
+
+    def _changed(self):
+        self._dirty = True
+        if self._hold_count == 0:
+            self._async_track_templates()
 
 
     @callback
-    def async_refresh(self):
+    def _async_track_templates(self):
+        self._dirty = False
         if self.result_info:
+            self.result_info.async_remove()
+            self.result_info = None
+        if not self._trackers:
+            return
+
+        self._build_variables()
+        track_templates = [ TrackTemplate(tracker.template, self.runtime_variables) for tracker in self._trackers.values() ]
+        self.result_info = async_track_template_result(self.hass, track_templates, self._async_update_templates)
+        self.result_info.async_refresh()
+
+
+    def _build_variables(self):
+        if self.tctx:
             self.tctx.build(self.runtime_variables)
-            self.result_info.async_refresh()
 
 
     @callback
-    def async_update_template(self, ha_event: Union[HaEvent, None], updates: list[TrackTemplateResult]):
-        if updates and len(updates) > 0:
-            result = updates.pop().result
-            if isinstance(result, TemplateError):
-                _LOGGER.error(f"Config: Error rendering {self.property}: {result}")
-                return
-
-            self.owner.set_property(self.property, self.type_converter(result))
-            self.async_update(result)
+    def _async_update_templates(self, ha_event: Union[HaEvent, None], updates: list[TrackTemplateResult]):
+        for update in updates:
+            key = id(update.template)
+            if not (tracker := self._trackers.get(key)):
+                continue
+            # A rebuild or refresh renders every template again, only changed results are passed on
+            if key in self._results and self._results[key] == update.result:
+                continue
+            self._results[key] = update.result
+            tracker.async_update_result(update.result)
+
+
+def get_template_tracker_group(hass: HomeAssistant, tctx: Union[TemplateContext, None]) -> TemplateTrackerGroup:
+    if tctx is None:
+        # Trackers without a template context share one group
+        if (result := hass.data.get(DATA_TEMPLATE_TRACKER_GROUP)) is None:
+            result = hass.data[DATA_TEMPLATE_TRACKER_GROUP] = TemplateTrackerGroup(hass, None)
+        return result
+    if tctx.tracker_group is None:
+        tctx.tracker_group = TemplateTrackerGroup(hass, tctx)
+    return tctx.tracker_group
@@ -1,29 +1,50 @@
+from asyncio import Handle
 from typing import Any, Callable, Coroutine, Union
 
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import callback, HassJob, HomeAssistant
 
 callable_type = Union[Callable[..., Any], Coroutine[Any, Any, Any]]
 
 
 class Updatable:
-    
+    """Notifies subscribers of updates from within the event loop.
+
+    Updates in the same loop iteration are merged into a single notification with the arguments of the last one.
+    Callbacks are called directly when the notification runs, only coroutines are scheduled as tasks.
+    """
+
     def __init__(self, hass: HomeAssistant) -> None:
-        self._on_update: Union[list[callable_type], None] = []
+        self._on_update: Union[list[HassJob], None] = []
         self._hass = hass
+        self._pending_args: tuple = ()
+        self._pending_notify: Union[Handle, None] = None
+
 
-        
     def on_update(self, callable: callable_type) -> None:
         if not self._on_update:
             self._on_update = []
-        self._on_update.append(callable)
+        self._on_update.append(HassJob(callable))
 
 
     @callback
     def async_update(self, *args) -> None:
-        if self._on_update:
-            for callable in self._on_update:
-                self._hass.add_job(callable, *args)
+        if not self._on_update:
+            return
+        self._pending_args = args
+        if self._pending_notify is None:
+            self._pending_notify = self._hass.loop.call_soon(self._async_notify)
+
+
+    @callback
+    def _async_notify(self) -> None:
+        args, self._pending_args = self._pending_args, ()
+        self._pending_notify = None
+        for job in list(self._on_update):
+            self._hass.async_run_hass_job(job, *args)
+
 
-    
     def destroy(self) -> None:
+        if self._pending_notify:
+            self._pending_notify.cancel()
+            self._pending_notify = None
         self._on_update.clear()
@@ -1,9 +1,38 @@
 import pytest
-from homeassistant.core import HomeAssistant
+from unittest.mock import patch
+
+from homeassistant.components.trace.const import DATA_TRACE
+from homeassistant.core import Context, HomeAssistant
+
+from custom_components.react.const import DOMAIN
+from custom_components.react.utils.trace import create_trace, get_trace_sampler
 
 from tests.common import FIXTURE_WORKFLOW_NAME
 from tests.tst_context import TstContext
 
+STORED_TRACE_COUNT = 5
+
+
+async def async_store_traces(test_context: TstContext) -> list[dict]:
+    """Put traces in the trace store, as if they were recorded before a restart."""
+    trace_store = test_context.react.runtime.trace_store
+    bodies = []
+    for index in range(STORED_TRACE_COUNT):
+        run_id = f"run_{index}"
+        short_dict = {"run_id": run_id, "state": "stopped", "actor": f"actor_{index}"}
+        body = {**short_dict, "trace": {"trigger": [{"path": "trigger", "result": {"index": index}}]}}
+        trace_store.async_append(test_context.workflow_id, run_id, short_dict, body)
+        bodies.append(body)
+    await trace_store.async_flush()
+    return bodies
+
+
+async def async_send_command(client, msg_id: int, msg: dict) -> dict:
+    await client.send_json({"id": msg_id, **msg})
+    result = await client.receive_json()
+    assert result["id"] == msg_id
+    return result
+
 @pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["trace_basic_test"])
 async def test_trace_basic_switched_off_actor_1(test_context: TstContext, workflow_name: str):
     """
@@ -105,3 +134,150 @@ async def test_trace_basic_switched_on_actor_2(test_context: TstContext, workflo
             expected_reactor_condition_results=[True, True]
         )
 
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["trace_off_test"])
+async def test_trace_off(test_context: TstContext, workflow_name: str):
+    """
+    Test for workflow with tracing turned off:
+    - One event should be sent
+    - No trace should be stored
+    - The skipped trace should be counted
+    """
+
+    await test_context.async_start_react()
+
+    async with test_context.async_listen_reaction_event():
+        await test_context.async_send_action_event()
+        await test_context.async_verify_reaction_event_received()
+        test_context.verify_reaction_event_data()
+        assert not test_context.hass.data.get(DATA_TRACE, {}).get(f"{DOMAIN}.{test_context.workflow_id}")
+        sampler = get_trace_sampler(test_context.hass, test_context.workflow_config)
+        assert sampler.traced_count == 0
+        assert sampler.skipped_count == 1
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["trace_errors_test"])
+async def test_trace_errors(test_context: TstContext, workflow_name: str):
+    """
+    Test for workflow that only traces errors:
+    - One event should be sent
+    - No trace should be stored for the run without an error
+    - A run with an error should store a trace with the nodes recorded before the error
+    """
+
+    await test_context.async_start_react()
+    trace_key = f"{DOMAIN}.{test_context.workflow_id}"
+    sampler = get_trace_sampler(test_context.hass, test_context.workflow_config)
+
+    async with test_context.async_listen_reaction_event():
+        await test_context.async_send_action_event()
+        await test_context.async_verify_reaction_event_received()
+        assert not test_context.hass.data.get(DATA_TRACE, {}).get(trace_key)
+        assert sampler.traced_count == 0
+        assert sampler.skipped_count == 1
+
+    trace = create_trace(test_context.hass, test_context.workflow_config, Context(), {"trigger": "errors_test"})
+    trace.trace_node("trigger", event={"action": "errors_test"})
+    trace.trace_section_node("reaction", "reactor/0/dispatch").set_error(ValueError("Dispatch failed"))
+    trace.set_error(ValueError("Dispatch failed"))
+    assert not test_context.hass.data.get(DATA_TRACE, {}).get(trace_key), "Expected the trace to be stored when the run finished"
+    trace.finished()
+
+    stored_traces = test_context.hass.data[DATA_TRACE][trace_key]
+    assert len(stored_traces) == 1
+    assert sampler.traced_count == 1
+    result = next(iter(stored_traces.values())).as_extended_dict()
+    assert result["error"] == "Dispatch failed"
+    assert list(result["trace"]) == ["trigger", "reactor/0/dispatch"]
+    assert result["trace"]["trigger"][0]["changed_variables"] == {"trigger": "errors_test"}
+    assert result["trace"]["trigger"][0]["result"] == {"event": {"action": "errors_test"}}
+    assert result["trace"]["reactor/0/dispatch"][0]["error"] == "Dispatch failed"
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["immediate"])
+async def test_trace_websocket_list(test_context: TstContext, workflow_name: str, hass_ws_client):
+    """
+    Test for listing stored traces through the websocket api:
+    - Traces are listed oldest first
+    - A page is selected with limit and the before or after cursor
+    - An unknown cursor results in an empty page
+    - Only the requested fields are sent, the run_id is always included
+    """
+
+    await test_context.async_start_react()
+    await async_store_traces(test_context)
+    client = await hass_ws_client(test_context.hass)
+    list_msg = {"type": "react/trace/list", "workflow_id": test_context.workflow_id}
+
+    async def async_list_run_ids(msg_id: int, **kwargs) -> list[str]:
+        result = await async_send_command(client, msg_id, {**list_msg, **kwargs})
+        assert result["success"]
+        return [ trace["run_id"] for trace in result["result"] ]
+
+    assert await async_list_run_ids(1) == [ f"run_{index}" for index in range(STORED_TRACE_COUNT) ]
+    assert await async_list_run_ids(2, limit=2) == ["run_3", "run_4"]
+    assert await async_list_run_ids(3, before="run_3", limit=2) == ["run_1", "run_2"]
+    assert await async_list_run_ids(4, after="run_1", limit=2) == ["run_2", "run_3"]
+    assert await async_list_run_ids(5, after="run_3") == ["run_4"]
+    assert await async_list_run_ids(6, before="run_unknown") == []
+    assert await async_list_run_ids(7, after="run_unknown", limit=2) == []
+
+    result = await async_send_command(client, 8, {**list_msg, "fields": ["state"], "limit": 1})
+    assert result["result"] == [{"run_id": "run_4", "state": "stopped"}]
+
+    result = await async_send_command(client, 9, {**list_msg, "before": "run_1", "after": "run_3"})
+    assert not result["success"], "Expected the before and after cursors to be exclusive"
+    await test_context.hass.async_block_till_done()
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["immediate"])
+async def test_trace_websocket_get_stored(test_context: TstContext, workflow_name: str, hass_ws_client):
+    """
+    Test for getting a stored trace through the websocket api:
+    - The trace is sent as it was encoded in the trace store, without decoding it
+    - An unknown run results in a not found error
+    """
+
+    await test_context.async_start_react()
+    bodies = await async_store_traces(test_context)
+    trace_store = test_context.react.runtime.trace_store
+    client = await hass_ws_client(test_context.hass)
+    get_msg = {"type": "react/trace/get", "workflow_id": test_context.workflow_id}
+
+    with patch.object(trace_store, "async_get_trace", side_effect=AssertionError("Stored traces should not be decoded")):
+        result = await async_send_command(client, 1, {**get_msg, "run_id": "run_2"})
+    assert result["success"]
+    assert result["result"] == bodies[2]
+
+    result = await async_send_command(client, 2, {**get_msg, "run_id": "run_unknown"})
+    assert not result["success"]
+    assert result["error"]["code"] == "not_found"
+    await test_context.hass.async_block_till_done()
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["trace_off_test"])
+async def test_trace_websocket_sampler(test_context: TstContext, workflow_name: str, hass_ws_client):
+    """
+    Test for getting the trace sampler of a workflow through the websocket api:
+    - The trace settings are sent with the number of traced and skipped runs
+    - An unknown workflow results in a not found error
+    """
+
+    await test_context.async_start_react()
+
+    async with test_context.async_listen_reaction_event():
+        await test_context.async_send_action_event()
+        await test_context.async_verify_reaction_event_received()
+
+    client = await hass_ws_client(test_context.hass)
+    result = await async_send_command(client, 1, {"type": "react/trace/sampler", "workflow_id": test_context.workflow_id})
+    assert result["success"]
+    assert result["result"]["mode"] == "off"
+    assert result["result"]["traced_count"] == 0
+    assert result["result"]["skipped_count"] == 1
+
+    result = await async_send_command(client, 2, {"type": "react/trace/sampler", "workflow_id": "workflow_unknown"})
+    assert not result["success"]
+    assert result["error"]["code"] == "not_found"
+    await test_context.hass.async_block_till_done()
@@ -0,0 +1,146 @@
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.react.const import (
+    ATTR_ACTION,
+    ATTR_CHANGES,
+    ATTR_DATA,
+    ATTR_REVISION,
+    ATTR_RUN_ID,
+    REGISTRY_ACTION_CREATE,
+    REGISTRY_ACTION_REMOVE,
+    REGISTRY_UPDATE_BACKLOG,
+)
+from custom_components.react.runtime.runtime import ReactionRegistry, RunRegistry
+
+from tests.common import FIXTURE_WORKFLOW_NAME
+from tests.tst_context import TstContext
+
+WORKFLOW_ID = "workflow_websocket_registry_test"
+
+
+class RegistryItem:
+    def __init__(self, index: int) -> None:
+        self.id = f"item_{index}"
+        self.workflow_id = WORKFLOW_ID
+        self.workflow_run_id = f"run_{index}"
+        self.reactor_id = f"reactor_{index}"
+
+
+    def as_short_dict(self) -> dict:
+        return {"id": self.id, "workflow_id": self.workflow_id}
+
+
+class RegistryReactor:
+    overwrite = False
+
+
+def register_run(registry: RunRegistry, item: RegistryItem):
+    registry.register(item)
+
+
+def remove_run(registry: RunRegistry, item: RegistryItem):
+    registry.remove(item.workflow_id, item)
+
+
+def register_reaction(registry: ReactionRegistry, item: RegistryItem):
+    registry.register(RegistryReactor(), item)
+
+
+def remove_reaction(registry: ReactionRegistry, item: RegistryItem):
+    registry.remove(item)
+
+
+REGISTRIES = [
+    ("react/run/subscribe", "run_registry", register_run, remove_run),
+    ("react/reaction/subscribe", "reaction_registry", register_reaction, remove_reaction),
+]
+
+
+async def async_subscribe(client, msg_id: int, command: str, revision: int = None) -> dict:
+    msg = {"id": msg_id, "type": command}
+    if revision is not None:
+        msg["revision"] = revision
+    await client.send_json(msg)
+    result = await client.receive_json()
+    assert result["id"] == msg_id
+    assert result["success"]
+    event = await client.receive_json()
+    assert event["id"] == msg_id
+    assert event["type"] == "event"
+    return event["event"]
+
+
+def verify_changes(changes: list[dict], expected: list[tuple[str, RegistryItem]]):
+    assert [ (change[ATTR_ACTION], change[ATTR_RUN_ID]) for change in changes ] == [ (action, item.id) for action, item in expected ]
+    revisions = [ change[ATTR_REVISION] for change in changes ]
+    assert revisions == sorted(revisions)
+    for change, (action, item) in zip(changes, expected):
+        if action == REGISTRY_ACTION_CREATE:
+            assert change[ATTR_DATA] == item.as_short_dict()
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["immediate"])
+@pytest.mark.parametrize("command,registry_attr,register,remove", REGISTRIES)
+async def test_websocket_registry_subscribe(test_context: TstContext, workflow_name: str, hass_ws_client, command: str, registry_attr: str, register: callable, remove: callable):
+    hass: HomeAssistant = test_context.hass
+    await test_context.async_start_react()
+    registry = getattr(test_context.react.runtime, registry_attr)
+    items = [ RegistryItem(index) for index in range(3) ]
+
+    register(registry, items[0])
+    registry.publisher.async_flush()
+
+    client = await hass_ws_client(hass)
+    snapshot = await async_subscribe(client, 1, command)
+    assert snapshot[ATTR_REVISION] == registry.publisher.revision
+    assert items[0].as_short_dict() in snapshot["snapshot"]
+
+    # Changes after the snapshot are streamed in order
+    register(registry, items[1])
+    remove(registry, items[0])
+    registry.publisher.async_flush()
+    delta = (await client.receive_json())["event"]
+    verify_changes(delta[ATTR_CHANGES], [(REGISTRY_ACTION_CREATE, items[1]), (REGISTRY_ACTION_REMOVE, items[0])])
+    assert delta[ATTR_REVISION] == registry.publisher.revision
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["immediate"])
+@pytest.mark.parametrize("command,registry_attr,register,remove", REGISTRIES)
+async def test_websocket_registry_resume(test_context: TstContext, workflow_name: str, hass_ws_client, command: str, registry_attr: str, register: callable, remove: callable):
+    hass: HomeAssistant = test_context.hass
+    await test_context.async_start_react()
+    registry = getattr(test_context.react.runtime, registry_attr)
+    items = [ RegistryItem(index) for index in range(3) ]
+
+    register(registry, items[0])
+    registry.publisher.async_flush()
+    last_seen_revision = registry.publisher.revision
+    register(registry, items[1])
+    remove(registry, items[0])
+    registry.publisher.async_flush()
+
+    # Resuming from a revision in the backlog only sends the missed changes
+    client = await hass_ws_client(hass)
+    missed = await async_subscribe(client, 1, command, last_seen_revision)
+    assert "snapshot" not in missed
+    assert missed[ATTR_REVISION] == registry.publisher.revision
+    verify_changes(missed[ATTR_CHANGES], [(REGISTRY_ACTION_CREATE, items[1]), (REGISTRY_ACTION_REMOVE, items[0])])
+
+    # Resuming from a revision the backlog no longer reaches back to sends a snapshot
+    for _ in range(REGISTRY_UPDATE_BACKLOG // 2 + 1):
+        register(registry, items[2])
+        remove(registry, items[2])
+    registry.publisher.async_flush()
+    snapshot = await async_subscribe(client, 2, command, last_seen_revision)
+    assert ATTR_CHANGES not in snapshot
+    assert snapshot[ATTR_REVISION] == registry.publisher.revision
+    assert items[1].as_short_dict() in snapshot["snapshot"]
+    assert items[0].as_short_dict() not in snapshot["snapshot"]
+
+    # A revision the publisher never reached also gets a snapshot
+    snapshot = await async_subscribe(client, 3, command, registry.publisher.revision + 1)
+    assert "snapshot" in snapshot
+    await hass.async_block_till_done()
@@ -0,0 +1,94 @@
+import time
+import tracemalloc
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
+from homeassistant.core import Event as HaEvent, HomeAssistant, State
+
+from custom_components.react.const import (
+    ATTR_ACTION,
+    ATTR_DATA,
+    ATTR_ENTITY,
+    ATTR_NEW_STATE,
+    ATTR_OLD_STATE,
+    ATTR_SESSION_ID,
+    ATTR_TYPE,
+)
+from custom_components.react.utils.events import ActionEvent, ReactEvent, StateChangedEvent
+from custom_components.react.utils.struct import DynamicData
+
+EVENT_COUNT = 10_000
+
+EVENT_DATA = {
+    ATTR_ENTITY: "action_entity_events",
+    ATTR_TYPE: "action_type_events",
+    ATTR_ACTION: "action_events",
+    ATTR_DATA: {"data1": 1, "data2": "value"},
+}
+
+
+class UnslottedActionEventPayload(DynamicData):
+    """Action event payload as it was before it became a record."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.type_hints: dict = {ATTR_DATA: DynamicData}
+
+        self.entity: str = None
+        self.type: str = None
+        self.action: str = None
+        self.data: DynamicData = None
+        self.session_id: int = None
+
+        self.ensure(ATTR_ENTITY, None)
+        self.ensure(ATTR_TYPE, None)
+        self.ensure(ATTR_ACTION, None)
+        self.ensure(ATTR_DATA, None)
+        self.ensure(ATTR_SESSION_ID, None)
+
+
+def run_event_benchmark(create_event: callable) -> tuple[float, int]:
+    ha_event = HaEvent("react_action_events", EVENT_DATA)
+
+    tracemalloc.start()
+    events = [ create_event(ha_event) for _ in range(EVENT_COUNT) ]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(EVENT_COUNT):
+        create_event(ha_event)
+    duration = time.perf_counter() - start
+
+    assert events[0].payload.as_dict() == {**EVENT_DATA, ATTR_SESSION_ID: None}
+    return duration / EVENT_COUNT, allocated // EVENT_COUNT
+
+
+async def test_runtime_events_action_event_record(hass: HomeAssistant):
+    unslotted_duration, unslotted_size = run_event_benchmark(lambda ha_event: ReactEvent(ha_event, UnslottedActionEventPayload))
+    record_duration, record_size = run_event_benchmark(ActionEvent)
+
+    payload = ActionEvent(HaEvent("react_action_events", EVENT_DATA | {"undeclared": "value"})).payload
+    assert not hasattr(payload, "__dict__"), "Expected a record payload to only have slots"
+    assert payload.data.data1 == 1
+    assert payload.undeclared == "value"
+    assert record_size < unslotted_size, f"Expected an action event to allocate less with a record payload ({unslotted_size} bytes, {unslotted_duration * 1e6:.1f}us vs {record_size} bytes, {record_duration * 1e6:.1f}us)"
+    await hass.async_block_till_done()
+
+
+async def test_runtime_events_state_changed_event_wraps_state(hass: HomeAssistant):
+    entity_id = "input_number.input_number_value_test"
+    new_state = State(entity_id, "2", {"unit_of_measurement": "s"})
+    event = StateChangedEvent(HaEvent(EVENT_STATE_CHANGED, {
+        ATTR_ENTITY_ID: entity_id,
+        ATTR_OLD_STATE: None,
+        ATTR_NEW_STATE: new_state,
+    }))
+
+    assert event.payload.old_state is None
+    assert event.payload.new_state.source is new_state
+    assert event.payload.new_state.state == "2"
+    assert event.payload.new_state.object_id == "input_number_value_test"
+    assert event.payload.new_state.attributes is new_state.attributes
+    assert event.payload.new_state.as_dict() is new_state.as_dict()
+    await hass.async_block_till_done()
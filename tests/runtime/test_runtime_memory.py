@@ -0,0 +1,56 @@
+import gc
+import pytest
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
+from homeassistant.core import Event as HaEvent, State
+
+from custom_components.react.const import ATTR_NEW_STATE, ATTR_OLD_STATE, ATTR_PLUGIN_MODULE
+from custom_components.react.plugin.const import ATTR_CONFIG
+from custom_components.react.plugin.state.input.state_change_input_block import StateChangeInputBlock
+
+from tests.common import FIXTURE_WORKFLOW_NAME
+from tests.const import TEST_CONFIG
+from tests.tst_context import TstContext
+
+STATE_CHANGE_COUNT = 5_000
+STATE_CHANGE_WARMUP_COUNT = 1_000
+STATE_CHANGE_BATCH_SIZE = 500
+# Less than the number of state changes, so retaining a single object per event fails the test
+MAX_OBJECT_GROWTH = STATE_CHANGE_COUNT // 2
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["state_track_test"])
+async def test_runtime_memory_state_change_input_block(test_context: TstContext, workflow_name: str):
+    entity_id = "input_number.input_number_value_test"
+    test_context.hass.data[TEST_CONFIG] = {}
+    await test_context.async_start_react([{
+        ATTR_PLUGIN_MODULE: "tests._plugins.state_mock",
+        ATTR_CONFIG: {},
+    }])
+
+    block = next(task for task in test_context.react.task_manager.tasks if isinstance(task, StateChangeInputBlock))
+
+    async def async_fire_state_changes(count: int):
+        for index in range(count):
+            await block.execute_task(HaEvent(EVENT_STATE_CHANGED, {
+                ATTR_ENTITY_ID: entity_id,
+                ATTR_OLD_STATE: State(entity_id, str(index)),
+                ATTR_NEW_STATE: State(entity_id, str(index + 1)),
+            }))
+            if index % STATE_CHANGE_BATCH_SIZE == 0:
+                await test_context.hass.async_block_till_done()
+                # The test log handler keeps every record, which is not what is being measured here
+                test_context.mock_log_handler.records.clear()
+        await test_context.hass.async_block_till_done()
+        test_context.mock_log_handler.records.clear()
+
+    await async_fire_state_changes(STATE_CHANGE_WARMUP_COUNT)
+    gc.collect()
+    object_count = len(gc.get_objects())
+    block_size = len(vars(block))
+
+    await async_fire_state_changes(STATE_CHANGE_COUNT)
+    gc.collect()
+
+    assert len(vars(block)) == block_size, "Expected the input block not to retain per-event state"
+    assert len(gc.get_objects()) - object_count < MAX_OBJECT_GROWTH, "Expected memory to stay bounded while processing state changes"
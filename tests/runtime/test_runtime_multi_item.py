@@ -0,0 +1,45 @@
+from homeassistant.core import HomeAssistant
+
+from custom_components.react.utils.struct import MultiItem
+
+ENTITY_COUNT = 1000
+
+
+def create_entity_list(count: int) -> MultiItem:
+    return MultiItem({ f"_{index}": f"binary_sensor.entity_{index}" for index in range(count) })
+
+
+async def test_runtime_multi_item_membership(hass: HomeAssistant):
+    entity_list = create_entity_list(ENTITY_COUNT)
+    assert entity_list._value_set is None, "Expected the value set to be built when it is first needed"
+
+    assert f"binary_sensor.entity_{ENTITY_COUNT - 1}" in entity_list
+    assert not "binary_sensor.missing" in entity_list
+    # Membership is checked against a frozenset of the values instead of scanning them
+    assert isinstance(entity_list._value_set, frozenset)
+    assert entity_list._value_set == frozenset(entity_list.values)
+    assert isinstance(entity_list.values, tuple)
+    await hass.async_block_till_done()
+
+
+async def test_runtime_multi_item_membership_unhashable(hass: HomeAssistant):
+    item_list = MultiItem({ "_0": "value", "_1": {"unhashable"} })
+    assert "value" in item_list
+    assert {"unhashable"} in item_list
+    assert not ["missing"] in item_list
+    assert item_list._value_set is None
+    assert item_list._unhashable
+    await hass.async_block_till_done()
+
+
+async def test_runtime_multi_item_append(hass: HomeAssistant):
+    entity_list = create_entity_list(2)
+    assert "binary_sensor.entity_0" in entity_list
+    assert not "binary_sensor.group_member" in entity_list
+
+    entity_list.append(["binary_sensor.group_member"])
+    assert entity_list._value_set is None, "Expected the value set to be reset when a value is added"
+    assert "binary_sensor.group_member" in entity_list
+    assert list(entity_list) == ["binary_sensor.entity_0", "binary_sensor.entity_1", "binary_sensor.group_member"]
+    assert entity_list[2] == "binary_sensor.group_member"
+    await hass.async_block_till_done()
@@ -0,0 +1,108 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import Event as HaEvent, EventBus, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from custom_components.react.const import (
+    ATTR_ACTION,
+    ATTR_CHANGES,
+    ATTR_REVISION,
+    ATTR_RUN_ID,
+    EVENT_RUN_REGISTRY_UPDATED,
+    REGISTRY_ACTION_CREATE,
+    REGISTRY_ACTION_REMOVE,
+)
+from custom_components.react.runtime.publisher import RegistryUpdatePublisher
+from custom_components.react.runtime.runtime import RunRegistry
+
+from tests.common import async_fire_time_changed
+
+WORKFLOW_ID = "workflow_publisher_test"
+PUBLISHER_WINDOW = 5
+
+
+class PublisherRun:
+    def __init__(self, index: int) -> None:
+        self.id = f"run_{index}"
+        self.workflow_id = WORKFLOW_ID
+
+
+    def as_short_dict(self) -> dict:
+        return {"id": self.id, "workflow_id": self.workflow_id}
+
+
+def listen_registry_updated(hass: HomeAssistant) -> list[HaEvent]:
+    events = []
+
+    @callback
+    def async_registry_updated(event: HaEvent):
+        events.append(event)
+    hass.bus.async_listen(EVENT_RUN_REGISTRY_UPDATED, async_registry_updated)
+    return events
+
+
+def patch_async_fire():
+    return patch("homeassistant.core.EventBus.async_fire", autospec=True, side_effect=EventBus.async_fire)
+
+
+def get_registry_updated_calls(async_fire) -> list:
+    # Called with the event bus as the first argument
+    return [ call for call in async_fire.call_args_list if call.args[1] == EVENT_RUN_REGISTRY_UPDATED ]
+
+
+def verify_changes(event: HaEvent, expected: list[tuple[str, str]]):
+    changes = event.data[ATTR_CHANGES]
+    assert [ (change[ATTR_ACTION], change[ATTR_RUN_ID]) for change in changes ] == expected
+    revisions = [ change[ATTR_REVISION] for change in changes ]
+    assert revisions == list(range(revisions[0], revisions[0] + len(revisions))), "Expected the changes to be ordered by revision"
+
+
+async def test_runtime_publisher_loop_iteration(hass: HomeAssistant):
+    registry = RunRegistry(hass)
+    events = listen_registry_updated(hass)
+    runs = [ PublisherRun(index) for index in range(5) ]
+
+    with patch_async_fire() as async_fire:
+        for run in runs:
+            registry.register(run)
+        registry.remove(WORKFLOW_ID, runs[1])
+        registry.remove(WORKFLOW_ID, runs[3])
+        assert get_registry_updated_calls(async_fire) == [], "Expected the changes to be published after the current loop iteration"
+
+        await hass.async_block_till_done()
+        assert len(get_registry_updated_calls(async_fire)) == 1
+
+    assert len(events) == 1, "Expected the changes of one loop iteration to be merged into one event"
+    verify_changes(events[0], [
+        *[ (REGISTRY_ACTION_CREATE, run.id) for run in runs ],
+        (REGISTRY_ACTION_REMOVE, runs[1].id),
+        (REGISTRY_ACTION_REMOVE, runs[3].id),
+    ])
+    assert registry.get_run_count(WORKFLOW_ID) == 3
+
+
+async def test_runtime_publisher_window(hass: HomeAssistant):
+    publisher = RegistryUpdatePublisher(hass, EVENT_RUN_REGISTRY_UPDATED, PUBLISHER_WINDOW)
+    events = listen_registry_updated(hass)
+    now = dt_util.utcnow()
+
+    with patch_async_fire() as async_fire:
+        publisher.async_publish(REGISTRY_ACTION_CREATE, "run_0", {"id": "run_0"})
+        publisher.async_publish(REGISTRY_ACTION_CREATE, "run_1", {"id": "run_1"})
+        await hass.async_block_till_done()
+        publisher.async_publish(REGISTRY_ACTION_REMOVE, "run_0")
+        await hass.async_block_till_done()
+        assert events == [], "Expected the changes to be collected until the window has passed"
+
+        async_fire_time_changed(hass, now + timedelta(seconds=PUBLISHER_WINDOW))
+        await hass.async_block_till_done()
+        assert len(get_registry_updated_calls(async_fire)) == 1
+
+    assert len(events) == 1, "Expected the changes inside the window to be merged into one event"
+    verify_changes(events[0], [
+        (REGISTRY_ACTION_CREATE, "run_0"),
+        (REGISTRY_ACTION_CREATE, "run_1"),
+        (REGISTRY_ACTION_REMOVE, "run_0"),
+    ])
+    assert publisher.get_changes_since(0) == events[0].data[ATTR_CHANGES]
@@ -0,0 +1,74 @@
+from homeassistant.core import HomeAssistant
+
+from custom_components.react.runtime.runtime import ReactionRegistry
+
+REACTION_COUNT = 1_000
+REACTOR_COUNT = 100
+REACTIONS_PER_RUN = 10
+
+
+class BenchmarkReactor:
+    def __init__(self, overwrite: bool) -> None:
+        self.overwrite = overwrite
+
+
+class BenchmarkReaction:
+    def __init__(self, registry: ReactionRegistry, index: int) -> None:
+        self._registry = registry
+        self.id = str(index)
+        self.workflow_run_id = f"run_{index // REACTIONS_PER_RUN}"
+        self.workflow_id = f"workflow_{index % REACTOR_COUNT}"
+        self.reactor_id = f"reactor_{index % REACTOR_COUNT}"
+
+
+    def as_short_dict(self) -> dict:
+        return {"id": self.id, "workflow_id": self.workflow_id, "reactor_id": self.reactor_id}
+
+
+    def stop(self):
+        self._registry.remove(self)
+
+
+def register_reactions(hass: HomeAssistant, overwrite: bool) -> tuple[ReactionRegistry, list[BenchmarkReaction]]:
+    registry = ReactionRegistry(hass)
+    reactor = BenchmarkReactor(overwrite)
+    reactions = [ BenchmarkReaction(registry, index) for index in range(REACTION_COUNT) ]
+    for reaction in reactions:
+        registry.register(reactor, reaction)
+    return registry, reactions
+
+
+def verify_registry_empty(registry: ReactionRegistry):
+    assert registry.get_all_reactions() == []
+    # Removing the last reaction of a run or reactor also removes its index entry
+    assert registry._reactions_by_id == {}
+    assert registry._reactions_by_run == {}
+    assert registry._reactions_by_reactor == {}
+
+
+async def test_runtime_registry_register_remove(hass: HomeAssistant):
+    registry, reactions = register_reactions(hass, overwrite=False)
+    assert len(registry._reactions_by_id) == REACTION_COUNT
+    assert len(registry._reactions_by_run) == REACTION_COUNT // REACTIONS_PER_RUN
+    assert len(registry._reactions_by_reactor) == REACTOR_COUNT
+    assert registry.get_reactions_by_run("run_1") == reactions[REACTIONS_PER_RUN:2 * REACTIONS_PER_RUN]
+    assert list(registry.find(workflow_id="workflow_1", reactor_id="reactor_1")) == reactions[1::REACTOR_COUNT]
+
+    for reaction in reactions:
+        registry.remove(reaction)
+    verify_registry_empty(registry)
+    await hass.async_block_till_done()
+
+
+async def test_runtime_registry_register_overwrite(hass: HomeAssistant):
+    registry, reactions = register_reactions(hass, overwrite=True)
+    # Every reaction replaced the previous reaction of its reactor
+    assert len(registry._reactions_by_id) == REACTOR_COUNT
+    assert len(registry._reactions_by_reactor) == REACTOR_COUNT
+    assert all( len(reactor_reactions) == 1 for reactor_reactions in registry._reactions_by_reactor.values() )
+    assert list(registry.find(workflow_id="workflow_1", reactor_id="reactor_1")) == [reactions[-REACTOR_COUNT + 1]]
+
+    for reaction in reactions[-REACTOR_COUNT:]:
+        registry.remove(reaction)
+    verify_registry_empty(registry)
+    await hass.async_block_till_done()
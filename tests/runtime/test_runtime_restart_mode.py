@@ -1,10 +1,15 @@
 import pytest
 
+from datetime import timedelta
+from freezegun import freeze_time
+
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from custom_components.react.base import ReactBase
-from custom_components.react.const import DOMAIN
+from custom_components.react.const import DOMAIN, JOURNAL_FLUSH_DELAY
+from custom_components.react.runtime.journal import ReactionJournal
 
-from tests.common import FIXTURE_WORKFLOW_NAME
+from tests.common import FIXTURE_WORKFLOW_NAME, async_fire_time_changed
 from tests.tst_context import TstContext
 
 
@@ -34,3 +39,74 @@ async def test_runtime_restart_mode_force(test_context: TstContext, workflow_nam
         await test_context.hass.async_block_till_done()
         await test_context.async_verify_reaction_event_received()
         test_context.verify_run_not_found()
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["scheduled_restart_rerun"])
+async def test_runtime_restart_mode_rerun(test_context: TstContext, workflow_name: str):
+    await test_context.async_start_react()
+    journal = test_context.react.runtime.reaction_registry.journal
+
+    async with test_context.async_listen_reaction_event():
+        await test_context.async_send_action_event()
+        test_context.verify_run_found()
+        reaction_id = test_context.retrieve_reaction_id()
+        assert [ entry["id"] for entry in journal.entries ] == [reaction_id]
+        await test_context.react.runtime.async_shutdown(is_hass_shutdown=True)
+        await test_context.hass.async_block_till_done()
+        await test_context.async_verify_reaction_event_not_received()
+        test_context.verify_run_not_found()
+        assert [ entry["id"] for entry in journal.entries ] == [reaction_id], "Expected the pending wait to survive the shutdown"
+
+
+async def async_restart_with_journal(test_context: TstContext, now) -> str:
+    """Stop the pending wait like a restart would and reload the journal from storage."""
+    runtime = test_context.react.runtime
+    async with test_context.async_listen_reaction_event():
+        await test_context.async_send_action_event()
+        reaction_id = test_context.retrieve_reaction_id()
+        await runtime.get_workflow_runtime(test_context.workflow_id).async_stop_all_runs(is_hass_shutdown=True)
+        async_fire_time_changed(test_context.hass, now + timedelta(seconds=JOURNAL_FLUSH_DELAY + 1))
+        await test_context.hass.async_block_till_done()
+        test_context.verify_run_not_found()
+        await test_context.async_verify_reaction_event_not_received()
+    runtime.reaction_registry.journal = ReactionJournal(test_context.hass)
+    return reaction_id
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["scheduled_restart_rerun"])
+async def test_runtime_restart_mode_rerun_restore(test_context: TstContext, workflow_name: str):
+    now = dt_util.utcnow()
+    with freeze_time(now):
+        await test_context.async_start_react()
+        runtime = test_context.react.runtime
+        reaction_id = await async_restart_with_journal(test_context, now)
+
+        await runtime.async_restore_reactions()
+        journal = runtime.reaction_registry.journal
+        assert [ entry["id"] for entry in journal.entries ] == [reaction_id], "Expected the pending wait to be loaded from storage"
+        when = dt_util.parse_datetime(journal.entries[0]["when"])
+        assert runtime.timer_service.pending_count == 1
+
+        async with test_context.async_listen_reaction_event():
+            # The wait resumes at its original time, not after a full new delay
+            async_fire_time_changed(test_context.hass, when - timedelta(seconds=1))
+            await test_context.hass.async_block_till_done()
+            await test_context.async_verify_reaction_event_not_received()
+            async_fire_time_changed(test_context.hass, when)
+            await test_context.hass.async_block_till_done()
+            await test_context.async_verify_reaction_event_received()
+        assert journal.entries == []
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["scheduled_restart_rerun"])
+async def test_runtime_restart_mode_rerun_restore_disabled(test_context: TstContext, workflow_name: str):
+    now = dt_util.utcnow()
+    with freeze_time(now):
+        await test_context.async_start_react()
+        runtime = test_context.react.runtime
+        await async_restart_with_journal(test_context, now)
+        await runtime.async_stop_workflow_runtime(test_context.workflow_id)
+
+        await runtime.async_restore_reactions()
+        assert runtime.reaction_registry.journal.entries == [], "Expected the wait of a disabled workflow to be dropped"
+        assert runtime.timer_service.pending_count == 0
@@ -0,0 +1,88 @@
+import pytest
+
+from unittest.mock import patch
+
+from homeassistant.core import Event as HaEvent, HomeAssistant
+
+from custom_components.react.const import EVENT_REACT_ACTION
+from custom_components.react.utils.events import ActionEvent
+from custom_components.react.utils.session import Session, SessionManager
+
+from tests.common import FIXTURE_WORKFLOW_NAME
+from tests.tst_context import TstContext
+
+IDLE_MAX_COUNT = 3
+IDLE_TTL = 300
+
+
+def load_root_session(session_manager: SessionManager) -> Session:
+    action_event = ActionEvent(HaEvent(EVENT_REACT_ACTION, {}))
+    session_manager.load_session(action_event)
+    return action_event.session
+
+
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["immediate"])
+async def test_runtime_session_released_by_run(test_context: TstContext, workflow_name: str):
+    await test_context.async_start_react()
+    session_manager = test_context.react.session_manager
+    released_count = session_manager.released_count
+
+    async with test_context.async_listen_reaction_event():
+        await test_context.async_send_action_event()
+        await test_context.async_verify_reaction_event_received()
+        await test_context.hass.async_block_till_done()
+        test_context.verify_run_not_found()
+
+    assert session_manager.live_count == 0, "Expected the sessions of a finished run and its reaction to be released"
+    assert session_manager.released_count == released_count + 2
+
+
+async def test_runtime_session_evicted_by_count(hass: HomeAssistant):
+    session_manager = SessionManager(None, idle_max_count=IDLE_MAX_COUNT, idle_ttl=IDLE_TTL)
+    sessions = [ load_root_session(session_manager) for _ in range(IDLE_MAX_COUNT + 2) ]
+
+    assert session_manager.idle_count == IDLE_MAX_COUNT
+    assert session_manager.evicted_count == 2
+    assert session_manager.get_session(sessions[0].id) is None
+    assert session_manager.get_session(sessions[1].id) is None
+    assert session_manager.get_session(sessions[-1].id) is sessions[-1]
+
+    # Live sessions are never evicted, they become idle once released
+    child_session = sessions[-1].create_child_session()
+    for _ in range(IDLE_MAX_COUNT):
+        load_root_session(session_manager)
+    assert session_manager.live_count == 1
+    assert session_manager.get_session(child_session.id) is child_session
+
+    child_session.release()
+    assert session_manager.live_count == 0
+    assert session_manager.released_count == 1
+    assert session_manager.get_session(child_session.id) is child_session
+    assert not sessions[-1].child_sessions
+    await hass.async_block_till_done()
+
+
+async def test_runtime_session_evicted_by_ttl(hass: HomeAssistant):
+    now = 1000.0
+
+    with patch("custom_components.react.utils.session.monotonic", side_effect=lambda: now):
+        session_manager = SessionManager(None, idle_max_count=IDLE_MAX_COUNT, idle_ttl=IDLE_TTL)
+        first_session = load_root_session(session_manager)
+        second_session = load_root_session(session_manager)
+
+        # Looking up a session keeps it around
+        now += IDLE_TTL / 2
+        assert session_manager.get_session(first_session.id) is first_session
+
+        now += IDLE_TTL / 2 + 1
+        third_session = load_root_session(session_manager)
+        assert session_manager.evicted_count == 1
+        assert session_manager.get_session(second_session.id) is None
+        assert session_manager.get_session(first_session.id) is first_session
+        assert session_manager.get_session(third_session.id) is third_session
+
+        now += IDLE_TTL + 1
+        load_root_session(session_manager)
+        assert session_manager.evicted_count == 3
+        assert session_manager.idle_count == 1
+    await hass.async_block_till_done()
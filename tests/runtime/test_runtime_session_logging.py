@@ -0,0 +1,42 @@
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.react.utils.logger import get_react_logger
+from custom_components.react.utils.session import Session
+
+from tests._mocks.mock_log_handler import MockLogHandler
+
+SESSION_LOGGER = "session_logging_test"
+
+
+async def test_runtime_session_logging_lazy(hass: HomeAssistant):
+    logger = get_react_logger(SESSION_LOGGER)
+    log_handler = MockLogHandler()
+    logger.addHandler(log_handler)
+    session = Session("1", None)
+    formatted_messages = []
+
+    def format_message():
+        formatted_messages.append(True)
+        return "Formatted message"
+
+    try:
+        logger.setLevel(logging.INFO)
+        session.debug(logger, format_message)
+        session.debug(logger, "Message with %s", "args")
+        assert formatted_messages == [], "Expected debug messages not to be formatted while debug logging is disabled"
+        assert log_handler.has_no_record("DEBUG", "1 - Message with args")
+
+        logger.setLevel(logging.DEBUG)
+        session.debug(logger, format_message)
+        session.debug(logger, "Message with %s", "args")
+        session.debug(logger, "Message with 100% no args")
+        assert formatted_messages == [True]
+        assert log_handler.has_record("DEBUG", "1 - Formatted message")
+        assert log_handler.has_record("DEBUG", "1 - Message with args")
+        assert log_handler.has_record("DEBUG", "1 - Message with 100% no args")
+    finally:
+        logger.removeHandler(log_handler)
+        logger.setLevel(logging.NOTSET)
+    await hass.async_block_till_done()
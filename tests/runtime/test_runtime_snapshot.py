@@ -0,0 +1,78 @@
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.react.config.config import Reactor
+from custom_components.react.utils.context import TemplateContext
+from custom_components.react.utils.jit import JitterRenderContext, ObjectJitter
+from custom_components.react.utils.struct import ReactorRuntime
+
+STATIC_REACTOR_CONFIG = {
+    "entity": ["reactor_entity_snapshot"],
+    "type": ["reactor_type_snapshot"],
+    "action": ["reactor_action_snapshot"],
+    "data": [{"data1": 1, "data2": "value"}],
+}
+
+TEMPLATED_REACTOR_CONFIG = {
+    **STATIC_REACTOR_CONFIG,
+    "action": ["{{ 'reactor_action_snapshot' }}"],
+}
+
+
+def create_reactor_jitter(hass: HomeAssistant, config: dict) -> ObjectJitter[ReactorRuntime]:
+    return ObjectJitter[ReactorRuntime](hass, Reactor(config, 0, "snapshot_test"), TemplateContext(hass), ReactorRuntime)
+
+
+async def test_runtime_snapshot_static_reactor(hass: HomeAssistant):
+    static_jitter = create_reactor_jitter(hass, STATIC_REACTOR_CONFIG)
+    templated_jitter = create_reactor_jitter(hass, TEMPLATED_REACTOR_CONFIG)
+
+    static_reactor = static_jitter.render_with(JitterRenderContext())
+    assert static_reactor is static_jitter.render_with(JitterRenderContext())
+    assert static_reactor.action.first == "reactor_action_snapshot"
+
+    templated_reactor = templated_jitter.render_with(JitterRenderContext())
+    assert templated_reactor is not templated_jitter.render_with(JitterRenderContext())
+    assert templated_reactor.action.first == "reactor_action_snapshot"
+    # The static subtrees are shared by templated reactors as well, only the templated action is rendered again
+    next_templated_reactor = templated_jitter.render_with(JitterRenderContext())
+    assert templated_reactor.data is next_templated_reactor.data
+    assert templated_reactor.entity is next_templated_reactor.entity
+    assert templated_reactor.action is not next_templated_reactor.action
+    await hass.async_block_till_done()
+
+
+async def test_runtime_snapshot_shared_values_frozen(hass: HomeAssistant):
+    static_reactor = create_reactor_jitter(hass, STATIC_REACTOR_CONFIG).render_with(JitterRenderContext())
+    templated_reactor = create_reactor_jitter(hass, TEMPLATED_REACTOR_CONFIG).render_with(JitterRenderContext())
+
+    assert static_reactor.frozen
+    with pytest.raises(TypeError):
+        static_reactor.set("action", "reactor_action_changed")
+    with pytest.raises(TypeError):
+        static_reactor.action.append(["reactor_action_changed"])
+    with pytest.raises(TypeError):
+        static_reactor.data.set("data1", 2)
+    assert static_reactor.action.values == ("reactor_action_snapshot",)
+    assert static_reactor.data.data1 == 1
+
+    # A templated reactor is rendered for each run, only its static values are shared
+    assert not templated_reactor.frozen
+    templated_reactor.set("delay", 1)
+    assert templated_reactor.delay == 1
+    with pytest.raises(TypeError):
+        templated_reactor.data.set("data1", 2)
+    await hass.async_block_till_done()
+
+
+async def test_runtime_snapshot_deferred_reactor(hass: HomeAssistant):
+    jitter = create_reactor_jitter(hass, TEMPLATED_REACTOR_CONFIG | {"condition": "{{ False }}"})
+
+    reactor = jitter.render_deferred(JitterRenderContext(), ("condition",))
+    assert reactor.condition == False
+    assert reactor.is_template("condition")
+    assert "action" not in vars(reactor)
+
+    assert reactor.action.first == "reactor_action_snapshot"
+    assert reactor.is_template("action")
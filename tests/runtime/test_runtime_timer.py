@@ -0,0 +1,119 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun import freeze_time
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.react.const import TIMER_CATCH_UP_INTERVAL
+from custom_components.react.runtime.timer import TimerService
+
+from tests.common import async_fire_time_changed
+
+
+def track_point_in_utc_time_not_firing(hass, action, point_in_time):
+    """Loop timer that doesn't fire in time, like it happens after a clock jump or resume."""
+    return lambda: None
+
+
+async def test_runtime_timer_order(hass: HomeAssistant):
+    timer = TimerService(hass)
+    now = dt_util.utcnow()
+    fired = []
+    try:
+        timer.async_schedule(now + timedelta(seconds=3), lambda when: fired.append("third"))
+        timer.async_schedule(now + timedelta(seconds=1), lambda when: fired.append("first"))
+        timer.async_schedule(now + timedelta(seconds=1), lambda when: fired.append("second"))
+        timer.async_schedule(now + timedelta(seconds=10), lambda when: fired.append("later"))
+
+        timer.async_fire_due(now + timedelta(seconds=5))
+        assert fired == ["first", "second", "third"], "Expected due actions to run by deadline and then by scheduling order"
+        assert timer.pending_count == 1
+    finally:
+        timer.destroy()
+    await hass.async_block_till_done()
+
+
+async def test_runtime_timer_cancel(hass: HomeAssistant):
+    timer = TimerService(hass)
+    now = dt_util.utcnow()
+    fired = []
+    try:
+        cancels = [ timer.async_schedule(now + timedelta(seconds=index + 1), lambda when, index=index: fired.append(index)) for index in range(10) ]
+        for index in (0, 2, 4):
+            cancels[index]()
+        assert timer.pending_count == 7
+        # Cancelled entries stay in the heap until more than half of it is cancelled
+        assert len(timer._heap) == 10
+
+        for index in (5, 6, 8):
+            cancels[index]()
+        assert timer.pending_count == 4
+        assert len(timer._heap) == 4, "Expected the heap to be compacted when most of its entries are cancelled"
+
+        cancels[1]()
+        cancels[1]()
+        assert timer.pending_count == 3
+
+        timer.async_fire_due(now + timedelta(seconds=20))
+        assert fired == [3, 7, 9]
+        assert timer.pending_count == 0
+        assert len(timer._heap) == 0
+    finally:
+        timer.destroy()
+    await hass.async_block_till_done()
+
+
+async def test_runtime_timer_cancel_in_batch(hass: HomeAssistant):
+    timer = TimerService(hass)
+    now = dt_util.utcnow()
+    fired = []
+    cancels = {}
+
+    def cancel_second(when):
+        fired.append("first")
+        cancels["second"]()
+
+    try:
+        cancels["first"] = timer.async_schedule(now + timedelta(seconds=1), cancel_second)
+        cancels["second"] = timer.async_schedule(now + timedelta(seconds=2), lambda when: fired.append("second"))
+        timer.async_schedule(now + timedelta(seconds=3), lambda when: fired.append("third"))
+
+        # Both are due in the same batch, the first action cancels the second before it runs
+        timer.async_fire_due(now + timedelta(seconds=5))
+        assert fired == ["first", "third"]
+        assert timer.pending_count == 0
+        assert len(timer._heap) == 0
+
+        cancels["first"]()
+        cancels["second"]()
+        assert timer.pending_count == 0, "Expected cancelling an entry that already left the heap to have no effect"
+    finally:
+        timer.destroy()
+    await hass.async_block_till_done()
+
+
+async def test_runtime_timer_catch_up(hass: HomeAssistant):
+    now = dt_util.utcnow()
+    fired = []
+    with freeze_time(now) as frozen_time, patch("custom_components.react.runtime.timer.async_track_point_in_utc_time", track_point_in_utc_time_not_firing):
+        timer = TimerService(hass)
+        try:
+            timer.async_schedule(now + timedelta(seconds=5), lambda when: fired.append("config_update"))
+            timer.async_schedule(now + timedelta(seconds=30), lambda when: fired.append("interval"))
+
+            # The wall clock jumps ahead, the config update catches up with the actions that became due
+            frozen_time.move_to(now + timedelta(seconds=10))
+            hass.bus.async_fire(EVENT_CORE_CONFIG_UPDATE)
+            await hass.async_block_till_done()
+            assert fired == ["config_update"]
+
+            # Without any signal, the periodic wall clock check catches up
+            async_fire_time_changed(hass, now + timedelta(seconds=TIMER_CATCH_UP_INTERVAL + 10))
+            await hass.async_block_till_done()
+            assert fired == ["config_update", "interval"]
+            assert timer.pending_count == 0
+        finally:
+            timer.destroy()
+    await hass.async_block_till_done()
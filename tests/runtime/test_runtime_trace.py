@@ -0,0 +1,89 @@
+import pytest
+
+from unittest.mock import patch
+
+from homeassistant.core import Context
+
+from custom_components.react.config.config import Workflow
+from custom_components.react.runtime.trace_store import encode_trace
+from custom_components.react.utils.trace import ReactTrace, TraceSampler
+
+TRACE_NODE_COUNT = 10_000
+SAMPLE_EVERY = 3
+SAMPLE_INTERVAL = 60
+
+
+def test_runtime_trace_node_order():
+    trace = ReactTrace("workflow_trace_order", {}, Context(), {})
+    trace.trace_node("actor/0/trigger")
+    trace.trace_node("reactor/10/dispatch")
+    trace.trace_node("reactor/2/dispatch")
+    trace.trace_node("parallel")
+    trace.trace_node("actor/0/condition")
+    trace.trace_node("reactor/2/delay")
+    trace.trace_node("reactor/2/dispatch")
+
+    assert list(trace.as_extended_dict()["trace"]) == [
+        "actor/0/trigger",
+        "actor/0/condition",
+        "parallel",
+        "reactor/2/dispatch",
+        "reactor/2/delay",
+        "reactor/10/dispatch",
+    ]
+    assert len(trace.trace_nodes["reactor/2/dispatch"]) == 2
+
+
+def test_runtime_trace_node_many_reactors():
+    trace = ReactTrace("workflow_trace_many", {}, Context(), {})
+    for index in reversed(range(TRACE_NODE_COUNT)):
+        trace.trace_node(f"reactor/{index}/dispatch")
+
+    paths = list(trace.as_extended_dict()["trace"])
+    assert paths == [ f"reactor/{index}/dispatch" for index in range(TRACE_NODE_COUNT) ]
+
+
+def test_runtime_trace_config_frozen():
+    workflow = Workflow("workflow_trace_config", {})
+    workflow.load({
+        "when": [{ "entity": "actor_entity", "type": "actor_type" }],
+        "then": [{ "entity": ["reactor_entity_1", "reactor_entity_2"], "type": "reactor_type" }],
+    }, {}, {})
+
+    trace_config = workflow.get_trace_config()
+    assert workflow.get_trace_config() is trace_config, "Expected every trace to share the config until it is loaded again"
+    with pytest.raises(TypeError):
+        trace_config["name"] = "changed"
+    with pytest.raises(TypeError):
+        trace_config["reactor"][0]["dispatch"]["type"] = "changed"
+    assert trace_config["reactor"][0]["dispatch"]["entity"] == ("reactor_entity_1", "reactor_entity_2")
+
+    trace = ReactTrace(workflow.id, trace_config, Context(), {})
+    assert b'"reactor_entity_2"' in encode_trace(trace.as_extended_dict())
+
+
+def create_sampler(trace_config: dict) -> TraceSampler:
+    return TraceSampler(Workflow("workflow_trace_sampled", {"trace": {"mode": "sampled", **trace_config}}))
+
+
+def test_runtime_trace_sample_every():
+    sampler = create_sampler({"sample_every": SAMPLE_EVERY})
+    sampled = [ sampler.sample() for _ in range(SAMPLE_EVERY * 3) ]
+    assert sampled == [True, False, False] * 3, "Expected the first run of every group of runs to be sampled"
+
+
+def test_runtime_trace_sample_interval():
+    now = 1000.0
+    with patch("custom_components.react.utils.trace.monotonic", side_effect=lambda: now):
+        sampler = create_sampler({"sample_interval": SAMPLE_INTERVAL})
+        assert sampler.sample()
+        now += SAMPLE_INTERVAL / 2
+        assert not sampler.sample(), "Expected no run to be sampled within the interval"
+        now += SAMPLE_INTERVAL / 2
+        assert sampler.sample()
+
+        # Both settings apply, a run that is due by count is still skipped within the interval
+        sampler = create_sampler({"sample_every": 2, "sample_interval": SAMPLE_INTERVAL})
+        assert [ sampler.sample() for _ in range(3) ] == [True, False, False]
+        now += SAMPLE_INTERVAL
+        assert [ sampler.sample() for _ in range(2) ] == [False, True]
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.react.runtime.trace_store import TraceStore
+
+WORKFLOW_ID = "trace_store_test"
+TRACE_BODY_SIZE = 1000
+TRACE_COUNT = 20
+WORKFLOW_BUDGET = 10 * TRACE_BODY_SIZE
+SEGMENT_SIZE = 3 * TRACE_BODY_SIZE
+
+
+def append_traces(trace_store: TraceStore, start: int, count: int):
+    for index in range(start, start + count):
+        run_id = f"run_{index:03}"
+        trace_store.async_append(WORKFLOW_ID, run_id, {"run_id": run_id}, {"run_id": run_id, "data": "x" * TRACE_BODY_SIZE})
+
+
+async def test_runtime_trace_store(hass: HomeAssistant, tmp_path: Path):
+    hass.config.config_dir = str(tmp_path)
+    trace_store = TraceStore(hass, workflow_budget=WORKFLOW_BUDGET, segment_size=SEGMENT_SIZE)
+
+    append_traces(trace_store, 0, TRACE_COUNT // 2)
+    assert len(trace_store.get_short_traces(WORKFLOW_ID)) == TRACE_COUNT // 2
+    assert (await trace_store.async_get_trace(WORKFLOW_ID, "run_000"))["run_id"] == "run_000"
+    await trace_store.async_flush()
+    append_traces(trace_store, TRACE_COUNT // 2, TRACE_COUNT // 2)
+    await trace_store.async_shutdown()
+
+    # Oldest traces are evicted once the budget is exceeded
+    run_ids = [ trace["run_id"] for trace in trace_store.get_short_traces(WORKFLOW_ID) ]
+    assert len(run_ids) < TRACE_COUNT
+    assert run_ids[-1] == f"run_{TRACE_COUNT - 1:03}"
+    assert await trace_store.async_get_trace(WORKFLOW_ID, "run_000") is None
+
+    segment_dir = tmp_path / ".storage" / "react.trace_segments" / WORKFLOW_ID
+    segment_files = [ path for path in segment_dir.iterdir() if not path.name.endswith(".index.jsonl") ]
+    index_files = [ path for path in segment_dir.iterdir() if path.name.endswith(".index.jsonl") ]
+    assert segment_files
+    assert sorted(path.name.replace(".index", "") for path in index_files) == sorted(path.name for path in segment_files)
+    assert sum(segment_file.stat().st_size for segment_file in segment_files) <= WORKFLOW_BUDGET + SEGMENT_SIZE
+
+    # A new store only reads the index files and loads bodies on request
+    restored_store = TraceStore(hass, workflow_budget=WORKFLOW_BUDGET, segment_size=SEGMENT_SIZE)
+    await restored_store.async_load()
+    assert run_ids
+    assert [ trace["run_id"] for trace in restored_store.get_short_traces(WORKFLOW_ID) ] == run_ids
+    trace = await restored_store.async_get_trace(WORKFLOW_ID, run_ids[-1])
+    assert trace["run_id"] == run_ids[-1]
+    assert len(trace["data"]) == TRACE_BODY_SIZE
+
+
+async def test_runtime_trace_store_encodes_on_append(hass: HomeAssistant, tmp_path: Path):
+    hass.config.config_dir = str(tmp_path)
+    trace_store = TraceStore(hass)
+    body = {"run_id": "run_000", "data": ["appended"]}
+
+    trace_store.async_append(WORKFLOW_ID, "run_000", {"run_id": "run_000"}, body)
+    # Changes after appending don't end up in the stored trace
+    body["data"].append("changed")
+    await trace_store.async_shutdown()
+
+    assert (await trace_store.async_get_trace(WORKFLOW_ID, "run_000"))["data"] == ["appended"]
+
+
+async def test_runtime_trace_store_evicts_on_load(hass: HomeAssistant, tmp_path: Path):
+    hass.config.config_dir = str(tmp_path)
+    trace_store = TraceStore(hass, workflow_budget=WORKFLOW_BUDGET, segment_size=SEGMENT_SIZE)
+    append_traces(trace_store, 0, TRACE_COUNT // 2)
+    await trace_store.async_shutdown()
+
+    segment_dir = tmp_path / ".storage" / "react.trace_segments" / WORKFLOW_ID
+    segment_count = len(list(segment_dir.iterdir()))
+
+    # A smaller budget evicts traces while loading, their segments are removed before loading returns
+    restored_store = TraceStore(hass, workflow_budget=SEGMENT_SIZE, segment_size=SEGMENT_SIZE)
+    await restored_store.async_load()
+    assert len(restored_store.get_short_traces(WORKFLOW_ID)) < TRACE_COUNT // 2
+    assert len(list(segment_dir.iterdir())) < segment_count
+    assert await restored_store.async_get_trace(WORKFLOW_ID, "run_000") is None
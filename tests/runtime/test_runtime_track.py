@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+
+from custom_components.react.utils.track import TemplatePropertyTracker, TemplateTrackerGroup, async_track_template_result
+
+TRACKER_COUNT = 20
+
+
+class PropertyOwner:
+    def __init__(self) -> None:
+        self.updates = []
+
+
+    def set_property(self, attr: str, value):
+        if value is not None:
+            self.updates.append((attr, value))
+
+
+def patch_async_track_template_result():
+    return patch("custom_components.react.utils.track.async_track_template_result", wraps=async_track_template_result)
+
+
+async def test_runtime_track_group_hold(hass: HomeAssistant):
+    hass.states.async_set("sensor.track_test", "on")
+    owner = PropertyOwner()
+    group = TemplateTrackerGroup(hass, None)
+    trackers = [ TemplatePropertyTracker(hass, owner, f"prop_{index}", Template("{{ states('sensor.track_test') }}", hass), str, None) for index in range(TRACKER_COUNT) ]
+    for tracker in trackers:
+        tracker.template_group = group
+
+    try:
+        with patch_async_track_template_result() as track_template_result:
+            group.hold()
+            for tracker in trackers:
+                tracker.start()
+            assert track_template_result.call_count == 0, "Expected the listener to be built once the group is released"
+            group.release()
+            assert track_template_result.call_count == 1
+        assert len(owner.updates) == TRACKER_COUNT
+
+        # Removing a tracker rebuilds the listener, the remaining templates did not change and are not passed on again
+        trackers[0].destroy()
+        assert len(owner.updates) == TRACKER_COUNT
+
+        hass.states.async_set("sensor.track_test", "off")
+        await hass.async_block_till_done()
+        assert len(owner.updates) == TRACKER_COUNT * 2 - 1
+        assert owner.updates[-1] == (f"prop_{TRACKER_COUNT - 1}", "off")
+    finally:
+        group.destroy()
+    await hass.async_block_till_done()
@@ -0,0 +1,32 @@
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.react.utils.updatable import Updatable
+
+
+async def test_runtime_updatable_coalesce(hass: HomeAssistant):
+    updatable = Updatable(hass)
+    callback_updates = []
+    coroutine_updates = []
+
+    @callback
+    def async_on_update(value):
+        callback_updates.append(value)
+
+    async def async_on_update_coroutine(value):
+        coroutine_updates.append(value)
+
+    updatable.on_update(async_on_update)
+    updatable.on_update(async_on_update_coroutine)
+
+    for value in range(10):
+        updatable.async_update(value)
+    assert callback_updates == [], "Expected subscribers to be notified after the current loop iteration"
+
+    await hass.async_block_till_done()
+    assert callback_updates == [9], "Expected updates in the same loop iteration to be merged into one notification"
+    assert coroutine_updates == [9]
+
+    updatable.async_update(10)
+    updatable.destroy()
+    await hass.async_block_till_done()
+    assert callback_updates == [9], "Expected no notification after the updatable was destroyed"
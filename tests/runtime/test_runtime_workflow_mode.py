@@ -82,6 +82,34 @@ async def test_runtime_workflow_mode_queued(test_context: TstContext, workflow_n
             await runtime.async_stop_all_runs()
     
 
+@pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["delayed_templated_queued"])
+async def test_runtime_workflow_mode_queued_renders_at_event(test_context: TstContext, workflow_name: str):
+    now = dt_util.now()
+    with freeze_time(now):
+        await test_context.async_start_react()
+        itc = await test_context.async_start_input_text()
+        runtime = test_context.react.runtime.get_workflow_runtime(test_context.workflow_id)
+        try:
+            async with test_context.async_listen_reaction_event():
+                await itc.async_set_value("delayed_templated_queued", "first")
+                await test_context.async_send_action_event()
+                await itc.async_set_value("delayed_templated_queued", "second")
+                await test_context.async_send_action_event()
+                assert_run_count(runtime, 2)
+                # Changes while the second run is queued don't end up in its reaction
+                await itc.async_set_value("delayed_templated_queued", "third")
+
+                async_fire_time_changed(test_context.hass, now + timedelta(seconds=4))
+                await test_context.hass.async_block_till_done()
+                async_fire_time_changed(test_context.hass, now + timedelta(seconds=4))
+                await test_context.hass.async_block_till_done()
+                test_context.verify_reaction_event_count(2)
+                test_context.verify_reaction_event_data(expected_action="reactor_action_first", event_index=0)
+                test_context.verify_reaction_event_data(expected_action="reactor_action_second", event_index=1)
+        finally:
+            await runtime.async_stop_all_runs()
+
+
 @pytest.mark.parametrize(FIXTURE_WORKFLOW_NAME, ["delayed_long_parallel"])
 async def test_runtime_workflow_mode_parallel(test_context: TstContext, workflow_name: str):
     now = dt_util.now()
@@ -44,7 +44,7 @@ from custom_components.react.base import ReactBase
 from custom_components.react.config.config import Workflow
 from custom_components.react.runtime.runtime import Reaction, WorkflowRun
 from custom_components.react.utils.logger import format_data, get_react_logger
-from custom_components.react.utils.struct import DynamicData, MultiItem
+from custom_components.react.utils.struct import DynamicData, FrozenDict, MultiItem
 from custom_components.react.utils.trace import ReactTrace
 from custom_components.react.const import (
     ATTR_ACTION,
@@ -1238,6 +1238,10 @@ class TstContext():
         )
 
 
+# The trace config is frozen, its dicts and lists match the plain ones of the workflow config
+TRACE_TYPE_GROUPS = [(dict, FrozenDict), (list, tuple)]
+
+
 class TracePath():
     def __init__(self, owner: dict, path: str, parent: str = None) -> None:
         self.owner = owner
@@ -1260,14 +1264,14 @@ class TracePath():
             used_value_expected = value_expected[0]
             if isinstance(used_value_expected, DynamicData):
                 used_value_expected = used_value_expected.as_dict()
-            match = DeepDiff(used_value_expected, value_got) == {} and len(value_expected) == 1
+            match = DeepDiff(used_value_expected, value_got, ignore_type_in_groups=TRACE_TYPE_GROUPS) == {} and len(value_expected) == 1
         elif isinstance(value_expected, list) and isinstance(value_got, list):
             used_value_expected = [ x.as_dict() if isinstance(x, DynamicData) else x for x in value_expected ]
-            match = DeepDiff(used_value_expected, value_got) == {}
+            match = DeepDiff(used_value_expected, value_got, ignore_type_in_groups=TRACE_TYPE_GROUPS) == {}
         else:
             if isinstance(used_value_expected, DynamicData):
                 used_value_expected = used_value_expected.as_dict()
-            match = DeepDiff(used_value_expected, value_got) == {}
+            match = DeepDiff(used_value_expected, value_got, ignore_type_in_groups=TRACE_TYPE_GROUPS) == {}
         assert match, self.assert_message_match(key, name, used_value_expected, value_got)
 
     